@@ -0,0 +1,83 @@
+"""
+Measure the cold import time of the client with 'python -X importtime' and guard it against regressions.
+
+Usage:
+    python benchmarks/import_time.py [--module py_okx_async.OKXClient] [--max-ms 150] [--runs 5] [--top 10]
+
+The script exits with code 1 if the median import time exceeds the limit or if one of the modules that must be
+imported lazily is loaded by the import.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = ('requests', 'aiohttp', 'aiohttp_socks', 'pretty_utils', 'py_okx_async.chains')
+
+
+def import_times(module: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Import the module in a fresh interpreter.
+
+    Args:
+        module (str): the module name.
+
+    Returns:
+        Tuple[Dict[str, int], List[str]]: cumulative import times in microseconds by module names and the lazy
+            modules that were imported.
+
+    """
+    code = f'import sys, {module}; print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))'
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get('PYTHONPATH')))))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, env=env, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times, [name for name in result.stdout.strip().split(',') if name]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='py_okx_async.OKXClient')
+    parser.add_argument('--max-ms', type=float, default=150)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    totals = []
+    times = {}
+    loaded = []
+    for _ in range(args.runs):
+        times, loaded = import_times(module=args.module)
+        totals.append(times.get(args.module, 0) / 1000)
+
+    median = statistics.median(totals)
+    print(f'{args.module}: median {median:.1f} ms, min {min(totals):.1f} ms, max {max(totals):.1f} ms')
+    print('Slowest modules of the last run:')
+    for name, cumulative in sorted(times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f'\t{cumulative / 1000:8.1f} ms  {name}')
+
+    failed = False
+    if loaded:
+        print(f'Modules that must be imported lazily were loaded: {", ".join(loaded)}')
+        failed = True
+
+    if median > args.max_ms:
+        print(f'The median import time exceeds {args.max_ms} ms')
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,464 @@
+"""
+Drive the client against a local stand-in of the OKX API to find out how far it scales.
+
+The stand-in server and HTTP proxies run in a separate process, so the client process is measured alone. Workers
+request funding balances of sub-accounts, funding balances of master accounts and lists of sub-accounts of all
+API keys through OKXClient, Asset and Subaccount, and every interval the script reports throughput, latency
+percentiles, event loop lag, open sockets and RSS of the client process.
+
+Usage:
+    python benchmarks/load_test.py [--api-keys 10] [--subaccounts 1000] [--proxies 0] [--concurrency 256]
+        [--duration 30] [--interval 1] [--server-latency-ms 20] [--in-flight 64] [--respect-limits]
+        [--host 127.0.0.1] [--uvloop] [--dns] [--json results.json] [--min-rps 0] [--max-p99-ms 0]
+
+'--uvloop' runs the client in a uvloop event loop and '--dns' resolves hosts with aiodns and a shared cache if they are
+installed, '--host localhost' makes the client resolve the host of the server and proxies on each connection.
+
+The script exits with code 1 if no request succeeded, if the overall throughput is lower than '--min-rps' or if
+the overall 99th percentile of latency exceeds '--max-p99-ms', so it can guard releases against regressions.
+"""
+import argparse
+import asyncio
+import bisect
+import importlib.util
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+from typing import Optional, Dict, List, Tuple, Any
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.models import OKXCredentials, RateLimit, ConcurrencySettings, DNSSettings
+from py_okx_async.utils import install_uvloop
+
+PATHS = (
+    '/api/v5/asset/balances',
+    '/api/v5/asset/subaccount/balances',
+    '/api/v5/users/subaccount/list',
+)
+
+
+def serve(subaccounts: int, latency: float, proxies: int, ports: multiprocessing.Queue) -> None:
+    """
+    Run the stand-in server and HTTP proxies to it, put their ports to the queue.
+
+    Args:
+        subaccounts (int): the number of sub-accounts.
+        latency (float): the delay of each response in seconds.
+        proxies (int): the number of HTTP proxies.
+        ports (multiprocessing.Queue): the queue for the port of the server and the ports of proxies.
+
+    """
+    from aiohttp import web
+
+    balances = [
+        {'ccy': 'BTC', 'bal': '1', 'availBal': '1', 'frozenBal': '0'},
+        {'ccy': 'USDT', 'bal': '100', 'availBal': '100', 'frozenBal': '0'},
+    ]
+    infos = [
+        {'subAcct': f'sub{i}', 'enable': True, 'type': '1', 'label': '', 'ts': str(1_600_000_000_000 + i)}
+        for i in range(subaccounts)
+    ]
+    timestamps = [int(info['ts']) for info in infos]
+
+    async def respond(data: List[Dict[str, Any]]) -> web.Response:
+        if latency:
+            await asyncio.sleep(latency)
+
+        return web.json_response({'code': '0', 'msg': '', 'data': data})
+
+    async def time_handler(request: web.Request) -> web.Response:
+        return await respond(data=[{'ts': str(int(time.time() * 1000))}])
+
+    async def balances_handler(request: web.Request) -> web.Response:
+        return await respond(data=balances)
+
+    async def list_handler(request: web.Request) -> web.Response:
+        end = bisect.bisect_left(timestamps, int(request.query.get('after', 10 ** 14)))
+        start = bisect.bisect_right(timestamps, int(request.query.get('before', 0)))
+        start = max(start, end - int(request.query.get('limit', 100)))
+        return await respond(data=infos[start:end][::-1])
+
+    async def pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while data := await reader.read(65536):
+                writer.write(data)
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            writer.close()
+
+    async def proxy_handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # CONNECT tunnels are used by the proxy connector, absolute URLs are used by the 'requests' library.
+        head = await reader.readuntil(b'\r\n\r\n')
+        request_line, _, rest = head.partition(b'\r\n')
+        method, target, version = request_line.split(b' ')
+        if method == b'CONNECT':
+            host, port = target.decode().rsplit(':', 1)
+            upstream_reader, upstream_writer = await asyncio.open_connection(host=host, port=int(port))
+            writer.write(b'HTTP/1.1 200 Connection established\r\n\r\n')
+
+        else:
+            host, _, path = target.decode().split('://', 1)[1].partition('/')
+            host, _, port = host.partition(':')
+            upstream_reader, upstream_writer = await asyncio.open_connection(host=host, port=int(port or 80))
+            upstream_writer.write(b' '.join((method, f'/{path}'.encode(), version)) + b'\r\n' + rest)
+
+        await asyncio.gather(pipe(reader, upstream_writer), pipe(upstream_reader, writer))
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get('/api/v5/public/time', time_handler)
+        app.router.add_get('/api/v5/asset/balances', balances_handler)
+        app.router.add_get('/api/v5/asset/subaccount/balances', balances_handler)
+        app.router.add_get('/api/v5/users/subaccount/list', list_handler)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host='127.0.0.1', port=0, backlog=4096).start()
+        port = runner.addresses[0][1]
+        servers = [
+            await asyncio.start_server(proxy_handler, host='127.0.0.1', port=0, backlog=4096) for _ in range(proxies)
+        ]
+        proxy_ports = [server.sockets[0].getsockname()[1] for server in servers]
+        # 'localhost' may be resolved to ::1 first, so the same ports are listened to over IPv6 if it's available.
+        try:
+            await web.TCPSite(runner, host='::1', port=port, backlog=4096).start()
+            for proxy_port in proxy_ports:
+                await asyncio.start_server(proxy_handler, host='::1', port=proxy_port, backlog=4096)
+
+        except OSError:
+            pass
+
+        ports.put((port, proxy_ports))
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def open_sockets() -> Optional[int]:
+    """
+    Count open sockets of the process.
+
+    Returns:
+        Optional[int]: the number of sockets, None if it can't be counted on this platform.
+
+    """
+    try:
+        names = os.listdir('/proc/self/fd')
+
+    except OSError:
+        return None
+
+    sockets = 0
+    for name in names:
+        try:
+            if os.readlink(f'/proc/self/fd/{name}').startswith('socket:'):
+                sockets += 1
+
+        except OSError:
+            pass
+
+    return sockets
+
+
+def rss() -> float:
+    """
+    Get the resident set size of the process.
+
+    Returns:
+        float: the RSS in megabytes, the peak one if the current one can't be read on this platform.
+
+    """
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Get a percentile of sorted values.
+
+    Args:
+        values (List[float]): sorted values.
+        percent (float): the percentile from 0 to 100.
+
+    Returns:
+        float: the percentile, 0 if there are no values.
+
+    """
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class LoadTest:
+    """
+    The load test of the client process.
+
+    Attributes:
+        args (argparse.Namespace): the command line arguments.
+        clients (List[OKXClient]): clients of API keys.
+        subaccounts (List[Tuple[OKXClient, str]]): clients and names of sub-accounts.
+        latencies (List[float]): latencies of successful requests of the current interval in seconds.
+        all_latencies (List[float]): latencies of all successful requests in seconds.
+        errors (Dict[str, int]): numbers of errors by error classes.
+        interval_errors (int): the number of errors of the current interval.
+        lags (List[float]): event loop lags of the current interval in seconds.
+        samples (List[Dict[str, Any]]): metrics by intervals.
+
+    """
+    args: argparse.Namespace
+    clients: List[OKXClient]
+    subaccounts: List[Tuple[OKXClient, str]]
+    latencies: List[float]
+    all_latencies: List[float]
+    errors: Dict[str, int]
+    interval_errors: int
+    lags: List[float]
+    samples: List[Dict[str, Any]]
+
+    def __init__(self, args: argparse.Namespace, port: int, proxy_ports: List[int]) -> None:
+        """
+        Initialize the class and create clients.
+
+        Args:
+            args (argparse.Namespace): the command line arguments.
+            port (int): the port of the stand-in server.
+            proxy_ports (List[int]): ports of proxies.
+
+        """
+        self.args = args
+        rate_limits = None
+        if not args.respect_limits:
+            rate_limits = {path: RateLimit(requests=10 ** 6, period=1) for path in PATHS}
+
+        self.clients = [
+            OKXClient(
+                credentials=OKXCredentials(api_key=f'key{i}', secret_key='secret', passphrase='passphrase'),
+                entrypoint_url=f'http://{args.host}:{port}',
+                proxy=f'http://{args.host}:{proxy_ports[i % len(proxy_ports)]}' if proxy_ports else None,
+                check_proxy=False, rate_limits=rate_limits,
+                concurrency=ConcurrencySettings(initial=min(4, args.in_flight), maximum=args.in_flight),
+                dns=DNSSettings() if args.dns else None
+            )
+            for i in range(args.api_keys)
+        ]
+        self.subaccounts = [(self.clients[i % len(self.clients)], f'sub{i}') for i in range(args.subaccounts)]
+        self.latencies = []
+        self.all_latencies = []
+        self.errors = {}
+        self.interval_errors = 0
+        self.lags = []
+        self.samples = []
+
+    async def worker(self, number: int, stop: float) -> None:
+        """
+        Make requests until the end of the test.
+
+        Args:
+            number (int): the number of the worker.
+            stop (float): the monotonic time of the end of the test.
+
+        """
+        i = number
+        while time.monotonic() < stop:
+            client, subaccount = self.subaccounts[i % len(self.subaccounts)] if self.subaccounts else (
+                self.clients[i % len(self.clients)], None
+            )
+            started = time.monotonic()
+            try:
+                if not subaccount or i % 20 == 0:
+                    await client.asset.balances()
+
+                elif i % 50 == 1:
+                    await client.subaccount.list()
+
+                else:
+                    await client.subaccount.asset_balances(subAcct=subaccount)
+
+                latency = time.monotonic() - started
+                self.latencies.append(latency)
+                self.all_latencies.append(latency)
+
+            except Exception as e:
+                self.errors[e.__class__.__name__] = self.errors.get(e.__class__.__name__, 0) + 1
+                self.interval_errors += 1
+                # Rejections of open circuits don't yield to the event loop, so the worker backs off.
+                await asyncio.sleep(0.01)
+
+            i += self.args.concurrency
+
+    async def lag_monitor(self, stop: float, period: float = 0.05) -> None:
+        """
+        Measure how late the event loop wakes up a sleeping task.
+
+        Args:
+            stop (float): the monotonic time of the end of the test.
+            period (float): the sleep time in seconds. (0.05)
+
+        """
+        while time.monotonic() < stop:
+            started = time.monotonic()
+            await asyncio.sleep(period)
+            self.lags.append(max(0.0, time.monotonic() - started - period))
+
+    async def reporter(self, started: float, stop: float) -> None:
+        """
+        Collect and print metrics every interval.
+
+        Args:
+            started (float): the monotonic time of the start of the test.
+            stop (float): the monotonic time of the end of the test.
+
+        """
+        print(
+            f'{"time, s":>8} {"req/s":>9} {"errors":>7} {"p50, ms":>9} {"p95, ms":>9} {"p99, ms":>9} '
+            f'{"lag, ms":>9} {"sockets":>8} {"RSS, MB":>8}'
+        )
+        last = started
+        while last < stop:
+            await asyncio.sleep(min(self.args.interval, max(0.0, stop - last)))
+            now = time.monotonic()
+            latencies = sorted(self.latencies)
+            sample = {
+                'time': round(now - started, 3),
+                'rps': len(latencies) / (now - last),
+                'errors': self.interval_errors,
+                'p50_ms': percentile(latencies, 50) * 1000,
+                'p95_ms': percentile(latencies, 95) * 1000,
+                'p99_ms': percentile(latencies, 99) * 1000,
+                'max_lag_ms': max(self.lags, default=0.0) * 1000,
+                'sockets': open_sockets(),
+                'rss_mb': rss(),
+            }
+            self.samples.append(sample)
+            self.latencies = []
+            self.interval_errors = 0
+            self.lags = []
+            last = now
+            print(
+                f'{sample["time"]:8.1f} {sample["rps"]:9.1f} {sample["errors"]:7} {sample["p50_ms"]:9.1f} '
+                f'{sample["p95_ms"]:9.1f} {sample["p99_ms"]:9.1f} {sample["max_lag_ms"]:9.1f} '
+                f'{sample["sockets"] if sample["sockets"] is not None else "-":>8} {sample["rss_mb"]:8.1f}'
+            )
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run the test.
+
+        Returns:
+            Dict[str, Any]: the summary of the test.
+
+        """
+        started = time.monotonic()
+        stop = started + self.args.duration
+        await asyncio.gather(
+            self.reporter(started=started, stop=stop), self.lag_monitor(stop=stop),
+            *(self.worker(number=number, stop=stop) for number in range(self.args.concurrency))
+        )
+        elapsed = time.monotonic() - started
+        latencies = sorted(self.all_latencies)
+        return {
+            'requests': len(latencies),
+            'errors': self.errors,
+            'rps': len(latencies) / elapsed,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p95_ms': percentile(latencies, 95) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'mean_ms': statistics.fmean(latencies) * 1000 if latencies else 0.0,
+            'max_lag_ms': max((sample['max_lag_ms'] for sample in self.samples), default=0.0),
+            'max_sockets': max((sample['sockets'] or 0 for sample in self.samples), default=0),
+            'max_rss_mb': max((sample['rss_mb'] for sample in self.samples), default=0.0),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--api-keys', type=int, default=10)
+    parser.add_argument('--subaccounts', type=int, default=1000)
+    parser.add_argument('--proxies', type=int, default=0)
+    parser.add_argument('--concurrency', type=int, default=256)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--interval', type=float, default=1)
+    parser.add_argument('--server-latency-ms', type=float, default=20)
+    parser.add_argument('--in-flight', type=int, default=64)
+    parser.add_argument('--respect-limits', action='store_true')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--uvloop', action='store_true')
+    parser.add_argument('--dns', action='store_true')
+    parser.add_argument('--json')
+    parser.add_argument('--min-rps', type=float, default=0)
+    parser.add_argument('--max-p99-ms', type=float, default=0)
+    args = parser.parse_args()
+
+    # Each worker and connection needs a file descriptor.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = max(soft, 65536) if hard == resource.RLIM_INFINITY else hard
+    if soft < target:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+    if args.dns and not importlib.util.find_spec('aiodns'):
+        print('aiodns is not installed, hosts are resolved in the thread pool with a shared cache')
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.subaccounts, args.server_latency_ms / 1000, args.proxies, ports), daemon=True
+    )
+    server.start()
+    # uvloop is installed after the server is started, so only the client process uses it.
+    if args.uvloop and not install_uvloop():
+        print('uvloop is not installed, the default event loop is used')
+
+    try:
+        port, proxy_ports = ports.get(timeout=30)
+        load_test = LoadTest(args=args, port=port, proxy_ports=proxy_ports)
+        summary = asyncio.run(load_test.run())
+
+    finally:
+        server.terminate()
+        server.join()
+
+    print(
+        f'Total: {summary["requests"]} requests, {summary["rps"]:.1f} req/s, p50 {summary["p50_ms"]:.1f} ms, '
+        f'p95 {summary["p95_ms"]:.1f} ms, p99 {summary["p99_ms"]:.1f} ms, max lag {summary["max_lag_ms"]:.1f} ms, '
+        f'max sockets {summary["max_sockets"]}, max RSS {summary["max_rss_mb"]:.1f} MB'
+    )
+    if summary['errors']:
+        print(f'Errors: {", ".join(f"{name} x{count}" for name, count in summary["errors"].items())}')
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'settings': vars(args), 'summary': summary, 'samples': load_test.samples}, file, indent=2)
+
+    failed = False
+    if not summary['requests']:
+        print('No request succeeded')
+        failed = True
+
+    if args.min_rps and summary['rps'] < args.min_rps:
+        print(f'The throughput is lower than {args.min_rps} req/s')
+        failed = True
+
+    if args.max_p99_ms and summary['p99_ms'] > args.max_p99_ms:
+        print(f'The 99th percentile of latency exceeds {args.max_p99_ms} ms')
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
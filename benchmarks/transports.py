@@ -0,0 +1,107 @@
+"""
+Compare transports on the same request path of the client.
+
+Funding balances of sub-accounts are requested through OKXClient with the aiohttp transport against the stand-in
+server of load_test.py, then with the replay transport of a cassette recorded by the first run and with the mock
+transport, so the overhead of the client itself is seen apart from the one of the network stack.
+
+Usage:
+    python benchmarks/transports.py [--requests 5000] [--concurrency 64]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.load_test import serve, PATHS
+from py_okx_async.Cassette import Cassette
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.Transport import Transport, MockTransport
+from py_okx_async.models import OKXCredentials, RateLimit, ConcurrencySettings, CassetteModes, Methods
+
+
+async def measure(
+        entrypoint_url: str, requests: int, concurrency: int, transport: Optional[Transport] = None,
+        cassette: Optional[Cassette] = None
+) -> float:
+    """
+    Make requests through a client and measure the throughput.
+
+    Args:
+        entrypoint_url (str): the entrypoint URL.
+        requests (int): the number of requests.
+        concurrency (int): the number of concurrent workers.
+        transport (Optional[Transport]): the transport. (AiohttpTransport())
+        cassette (Optional[Cassette]): the cassette. (None)
+
+    Returns:
+        float: requests per second.
+
+    """
+    okx_client = OKXClient(
+        credentials=OKXCredentials(api_key='key', secret_key='secret', passphrase='passphrase'),
+        entrypoint_url=entrypoint_url, rate_limits={path: RateLimit(requests=10 ** 6, period=1) for path in PATHS},
+        concurrency=ConcurrencySettings(initial=concurrency, maximum=concurrency), transport=transport,
+        cassette=cassette
+    )
+    numbers = iter(range(requests))
+
+    async def worker() -> None:
+        for number in numbers:
+            await okx_client.subaccount.asset_balances(subAcct=f'sub{number % 100}')
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(100, 0, 0, ports), daemon=True)
+    server.start()
+    try:
+        port, _ = ports.get(timeout=30)
+        with tempfile.TemporaryDirectory() as directory:
+            cassette = Cassette(path=os.path.join(directory, 'balances.cassette'), mode=CassetteModes.Record)
+            results = {'aiohttp (recording)': asyncio.run(measure(
+                entrypoint_url=f'http://127.0.0.1:{port}', requests=args.requests, concurrency=args.concurrency,
+                cassette=cassette
+            ))}
+            cassette.save()
+            results['replay'] = asyncio.run(measure(
+                entrypoint_url='http://127.0.0.1:1', requests=args.requests, concurrency=args.concurrency,
+                cassette=Cassette(path=cassette.path, speed=0)
+            ))
+
+    finally:
+        server.terminate()
+        server.join()
+
+    transport = MockTransport(handlers={
+        (Methods.GET, '/api/v5/asset/subaccount/balances'): {
+            'code': '0', 'msg': '', 'data': [{'ccy': 'BTC', 'bal': '1', 'availBal': '1', 'frozenBal': '0'}]
+        }
+    })
+    results['mock'] = asyncio.run(measure(
+        entrypoint_url='http://127.0.0.1:1', requests=args.requests, concurrency=args.concurrency, transport=transport
+    ))
+    for name, rps in results.items():
+        print(f'{name:<20} {rps:10.1f} req/s {1e6 / rps:10.1f} us/req')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
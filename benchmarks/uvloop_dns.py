@@ -0,0 +1,76 @@
+"""
+Compare the client with and without uvloop and the aiodns resolver under the same load.
+
+Each variant runs benchmarks/load_test.py in a fresh interpreter with the host of the stand-in server given by name,
+so every connection of the client resolves it, and the summaries are printed side by side.
+
+Usage:
+    python benchmarks/uvloop_dns.py [--duration 15] [--host localhost] [load_test.py arguments]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Any
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VARIANTS = (
+    ('default', []),
+    ('uvloop', ['--uvloop']),
+    ('aiodns', ['--dns']),
+    ('uvloop + aiodns', ['--uvloop', '--dns']),
+)
+
+
+def run_variant(flags: List[str], arguments: List[str]) -> Dict[str, Any]:
+    """
+    Run the load test with the flags.
+
+    Args:
+        flags (List[str]): flags of the variant.
+        arguments (List[str]): other arguments of the load test.
+
+    Returns:
+        Dict[str, Any]: the summary of the load test.
+
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.json')
+        subprocess.run(
+            [sys.executable, os.path.join(ROOT, 'benchmarks', 'load_test.py'), *arguments, *flags, '--json', path],
+            check=True, stdout=subprocess.DEVNULL
+        )
+        with open(path) as file:
+            return json.load(file)['summary']
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', default='15')
+    parser.add_argument('--host', default='localhost')
+    args, arguments = parser.parse_known_args()
+
+    for name in ('uvloop', 'aiodns'):
+        if not importlib.util.find_spec(name):
+            print(f'{name} is not installed, variants with it fall back to the default')
+
+    arguments = ['--duration', args.duration, '--host', args.host, *arguments]
+    print(
+        f'{"variant":<16} {"req/s":>9} {"p50, ms":>9} {"p99, ms":>9} {"max lag, ms":>12} {"max RSS, MB":>12} '
+        f'{"errors":>7}'
+    )
+    for name, flags in VARIANTS:
+        summary = run_variant(flags=flags, arguments=arguments)
+        print(
+            f'{name:<16} {summary["rps"]:9.1f} {summary["p50_ms"]:9.1f} {summary["p99_ms"]:9.1f} '
+            f'{summary["max_lag_ms"]:12.1f} {summary["max_rss_mb"]:12.1f} {sum(summary["errors"].values()):7}'
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,28 @@
+import asyncio
 import base64
+import hashlib
 import hmac
 import json
+import time
 from datetime import datetime
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, TYPE_CHECKING
 from urllib.parse import urlencode
 
 from aiohttp import TCPConnector
-from aiohttp_socks import ProxyConnector
 
 from py_okx_async import exceptions
-from py_okx_async.models import OKXCredentials, Methods
-from py_okx_async.utils import async_get, async_post
+from py_okx_async.CircuitBreaker import CircuitBreaker
+from py_okx_async.ConcurrencyController import ConcurrencyController, AdaptiveLimit
+from py_okx_async.Deadline import Deadline, current_deadline
+from py_okx_async.Priority import Priority
+from py_okx_async.RateLimiter import RateLimiter, LatencyTracker
+from py_okx_async.Transport import Transport, AiohttpTransport
+from py_okx_async.models import (
+    OKXCredentials, Methods, HedgingSettings, Timeouts, Priorities, DNSSettings, TransportRequest
+)
+
+if TYPE_CHECKING:
+    from aiohttp_socks import ProxyConnector
 
 
 class Base:
@@ -20,20 +32,50 @@ class Base:
     Attributes:
         entrypoint_url (str): an entrypoint URL.
         proxy (str): an HTTP or SOCKS5 IPv4 proxy dictionary.
-        connector (Optional[ProxyConnector]): a connector.
+        connector (Optional[Union[ProxyConnector, TCPConnector]]): a connector, it is built on the first request.
+        critical_connector (Optional[Union[ProxyConnector, TCPConnector]]): a connector used only by critical
+            requests, so they don't wait for connections taken by other ones, it is built on the first critical
+            request.
+        rate_limiter (RateLimiter): a rate limiter of the API key.
+        latency_tracker (LatencyTracker): a tracker of response latencies.
+        hedging (Optional[HedgingSettings]): settings of hedged GET requests.
+        hedge_connector (Optional[Union[ProxyConnector, TCPConnector]]): a connector used by hedges, it is built
+            on the first hedge.
+        timeouts (Timeouts): default timeouts of requests.
+        concurrency (ConcurrencyController): a controller of adaptive in-flight limits.
+        circuit_breaker (CircuitBreaker): a circuit breaker of endpoints.
+        dns (Optional[DNSSettings]): settings of resolving hosts of the API and proxies.
+        transport (Transport): the transport that sends requests.
 
     """
-    __credentials: OKXCredentials
+    __credentials: Optional[OKXCredentials]
     entrypoint_url: str
     proxy: Optional[str]
-    connector: Union[ProxyConnector, TCPConnector] = TCPConnector(force_close=True)
+    connector: Optional[Union['ProxyConnector', TCPConnector]]
+    critical_connector: Optional[Union['ProxyConnector', TCPConnector]]
+    rate_limiter: RateLimiter
+    latency_tracker: LatencyTracker
+    hedging: Optional[HedgingSettings]
+    hedge_connector: Optional[Union['ProxyConnector', TCPConnector]]
+    timeouts: Timeouts
+    concurrency: ConcurrencyController
+    circuit_breaker: CircuitBreaker
+    dns: Optional[DNSSettings]
+    transport: Transport
 
-    def __init__(self, credentials: OKXCredentials, entrypoint_url: str, proxy: Optional[str]) -> None:
+    def __init__(
+            self, credentials: Optional[OKXCredentials], entrypoint_url: str, proxy: Optional[str],
+            rate_limiter: Optional[RateLimiter] = None, latency_tracker: Optional[LatencyTracker] = None,
+            hedging: Optional[HedgingSettings] = None, timeouts: Optional[Timeouts] = None,
+            concurrency: Optional[ConcurrencyController] = None, circuit_breaker: Optional[CircuitBreaker] = None,
+            dns: Optional[DNSSettings] = None, transport: Optional[Transport] = None
+    ) -> None:
         """
         Initialize the class.
 
         Args:
-            credentials (OKXCredentials): an instance with all OKX API key data.
+            credentials (Optional[OKXCredentials]): an instance with all OKX API key data, None for sections
+                of public endpoints.
             entrypoint_url (str): an API entrypoint url.
             proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy in one of the following formats:
                 - login:password@proxy:port
@@ -42,14 +84,84 @@ class Base:
                 - proxy:port
                 - http://proxy:port
 
+            rate_limiter (Optional[RateLimiter]): a rate limiter shared by sections of the API key. (a new one)
+            latency_tracker (Optional[LatencyTracker]): a tracker shared by sections of the API key. (a new one)
+            hedging (Optional[HedgingSettings]): settings of hedged GET requests. (disabled)
+            timeouts (Optional[Timeouts]): default timeouts of requests. (Timeouts())
+            concurrency (Optional[ConcurrencyController]): a controller of adaptive in-flight limits shared
+                by sections of the API key. (a new one)
+            circuit_breaker (Optional[CircuitBreaker]): a circuit breaker shared by sections of the API key.
+                (a new one)
+            dns (Optional[DNSSettings]): settings of resolving hosts of the API and proxies. (getaddrinfo
+                in the thread pool)
+            transport (Optional[Transport]): the transport shared by sections of the client. (AiohttpTransport())
+
         """
         self.__credentials = credentials
         self.entrypoint_url = entrypoint_url
         self.proxy = proxy
+        self.connector = None
+        self.critical_connector = None
+        self.rate_limiter = rate_limiter if rate_limiter else RateLimiter()
+        self.latency_tracker = latency_tracker if latency_tracker else LatencyTracker()
+        self.hedging = hedging
+        self.hedge_connector = None
+        self.timeouts = timeouts if timeouts else Timeouts()
+        self.concurrency = concurrency if concurrency else ConcurrencyController()
+        self.circuit_breaker = circuit_breaker if circuit_breaker else CircuitBreaker()
+        self.dns = dns
+        self.transport = transport if transport else AiohttpTransport()
+
+    @staticmethod
+    def build_connector(
+            proxy: Optional[str] = None, dns: Optional[DNSSettings] = None
+    ) -> Union['ProxyConnector', TCPConnector]:
+        """
+        Build a connector, the proxy stack is imported only if the proxy is specified.
+
+        Args:
+            proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy. (None)
+            dns (Optional[DNSSettings]): settings of resolving hosts of the API and proxies. (getaddrinfo
+                in the thread pool)
+
+        Returns:
+            Union[ProxyConnector, TCPConnector]: the connector.
+
+        """
         if proxy:
-            self.connector = ProxyConnector.from_url(
-                url=proxy.replace('socks5h', 'socks5'), rdns=True, force_close=True
-            )
+            if dns:
+                from py_okx_async.Resolver import Resolver
+                from py_okx_async.ResolvingProxyConnector import ResolvingProxyConnector
+
+                return ResolvingProxyConnector.from_url(
+                    url=proxy.replace('socks5h', 'socks5'), rdns=True, force_close=True,
+                    proxy_resolver=Resolver.shared(settings=dns)
+                )
+
+            from aiohttp_socks import ProxyConnector
+
+            return ProxyConnector.from_url(url=proxy.replace('socks5h', 'socks5'), rdns=True, force_close=True)
+
+        if dns:
+            from py_okx_async.Resolver import Resolver
+
+            return TCPConnector(force_close=True, resolver=Resolver.shared(settings=dns), ttl_dns_cache=dns.cache_ttl)
+
+        return TCPConnector(force_close=True)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Get a fingerprint of the API key that doesn't reveal it.
+
+        Returns:
+            str: the fingerprint, an empty string for sections of public endpoints.
+
+        """
+        if not self.__credentials:
+            return ''
+
+        return hashlib.sha256(self.__credentials.api_key.encode()).hexdigest()[:16]
 
     @staticmethod
     async def get_timestamp() -> str:
@@ -87,7 +199,8 @@ class Base:
         return base64.b64encode(hmac.new(key, msg, digestmod='sha256').digest())
 
     async def make_request(
-            self, method: str, request_path: str, body: Optional[dict] = None
+            self, method: str, request_path: str, body: Optional[dict] = None, deadline: Optional[Deadline] = None,
+            priority: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Make a request to the OKX API.
@@ -96,37 +209,279 @@ class Base:
             method (str): the request method is either GET or POST.
             request_path (str): the path of requesting an endpoint.
             body (Optional[dict]): request parameters. (None)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
+            priority (Optional[int]): the priority class of the request, one of Priorities. (the one of the current
+                context or normal, but not lower than the default one of the endpoint)
 
         Returns:
             Optional[Dict[str, Any]]: the request response.
 
         """
-        timestamp = await self.get_timestamp()
         method = method.upper()
+        endpoint = request_path
         body = body if body else {}
         if method == Methods.GET and body:
             request_path += f'?{urlencode(query=body)}'
             body = {}
 
+        if not deadline:
+            deadline = current_deadline.get()
+
+        if deadline and deadline.expired:
+            raise exceptions.DeadlineExceeded(f'The deadline of {deadline.timeout} seconds is exceeded!')
+
+        try:
+            response = await asyncio.wait_for(
+                self.send_request(
+                    method=method, endpoint=endpoint, request_path=request_path, body=body,
+                    timeout=self.client_timeout(deadline=deadline),
+                    priority=Priority.resolve(endpoint=endpoint, priority=priority)
+                ),
+                timeout=deadline.remaining() if deadline else None
+            )
+
+        except asyncio.TimeoutError:
+            if deadline and deadline.expired:
+                raise exceptions.DeadlineExceeded(f'The deadline of {deadline.timeout} seconds is exceeded!')
+
+            raise
+
+        if int(response.get('code')):
+            raise exceptions.APIException(response=response)
+
+        return response
+
+    def client_timeout(self, deadline: Optional[Deadline] = None) -> Timeouts:
+        """
+        Build timeouts of a request bounded by the deadline.
+
+        Args:
+            deadline (Optional[Deadline]): a deadline of the request. (None)
+
+        Returns:
+            Timeouts: the timeouts.
+
+        """
+        total = self.timeouts.total
+        if deadline:
+            total = min(total, deadline.remaining()) if total else deadline.remaining()
+
+        return Timeouts(total=total, connect=self.timeouts.connect, read=self.timeouts.read)
+
+    async def signed_headers(self, method: str, request_path: str, body: Union[dict, str]) -> Dict[str, str]:
+        """
+        Build headers with a signature of the request.
+
+        Args:
+            method (str): the request method is either GET or POST.
+            request_path (str): the path of requesting an endpoint with parameters.
+            body (Union[dict, str]): POST request parameters.
+
+        Returns:
+            Dict[str, str]: the headers.
+
+        """
+        timestamp = await self.get_timestamp()
         sign_msg = await self.generate_sign(timestamp=timestamp, method=method, request_path=request_path, body=body)
-        url = self.entrypoint_url + request_path
-        header = {
+        return {
             'Content-Type': 'application/json',
             'OK-ACCESS-KEY': self.__credentials.api_key,
             'OK-ACCESS-SIGN': sign_msg.decode(),
             'OK-ACCESS-TIMESTAMP': timestamp,
             'OK-ACCESS-PASSPHRASE': self.__credentials.passphrase
         }
-        if method == Methods.POST:
-            response = await async_post(
-                url=url, headers=header, connector=self.connector,
-                data=json.dumps(body) if isinstance(body, dict) else body
+
+    async def send_request(
+            self, method: str, endpoint: str, request_path: str, body: Union[dict, str], timeout: Timeouts,
+            priority: int = Priorities.Normal
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check the circuit of the endpoint, wait for a free in-flight slot and the rate limiter, sign and send
+        a request.
+
+        Args:
+            method (str): the request method is either GET or POST.
+            endpoint (str): the request path without parameters.
+            request_path (str): the path of requesting an endpoint with parameters.
+            body (Union[dict, str]): POST request parameters.
+            timeout (Timeouts): timeouts of the request.
+            priority (int): the priority class of the request, one of Priorities. (normal)
+
+        Returns:
+            Optional[Dict[str, Any]]: the request response.
+
+        """
+        circuit = self.circuit_breaker.circuit(host=self.entrypoint_url, endpoint=endpoint)
+        circuit.allow()
+        limit = self.concurrency.limit(
+            api_key=self.__credentials.api_key if self.__credentials else '', endpoint=endpoint
+        )
+        failed = None
+        try:
+            await limit.acquire(priority=priority)
+
+        except BaseException:
+            circuit.record(failed=failed)
+            raise
+
+        latency = None
+        throttled = False
+        try:
+            await self.rate_limiter.acquire(endpoint=endpoint, priority=priority)
+            headers = await self.signed_headers(method=method, request_path=request_path, body=body)
+            if not self.connector or self.connector.closed:
+                self.connector = self.build_connector(proxy=self.proxy, dns=self.dns)
+
+            connector = self.connector
+            if priority == Priorities.Critical:
+                if not self.critical_connector or self.critical_connector.closed:
+                    self.critical_connector = self.build_connector(proxy=self.proxy, dns=self.dns)
+
+                connector = self.critical_connector
+
+            started = time.monotonic()
+            if method == Methods.POST:
+                response = await self.request(
+                    method=method, url=self.entrypoint_url + request_path, headers=headers, connector=connector,
+                    timeout=timeout, body=json.dumps(body) if isinstance(body, dict) else body
+                )
+
+            elif self.hedging and priority != Priorities.Critical:
+                response = await self.hedged_get(
+                    endpoint=endpoint, request_path=request_path, headers=headers, timeout=timeout, limit=limit,
+                    priority=priority
+                )
+
+            else:
+                response = await self.request(
+                    method=method, url=self.entrypoint_url + request_path, headers=headers, connector=connector,
+                    timeout=timeout
+                )
+                self.latency_tracker.add(endpoint=endpoint, latency=time.monotonic() - started)
+
+            latency = time.monotonic() - started
+            throttled = str(response.get('code')) == '50011'
+            failed = self.circuit_breaker.is_failure(response=response)
+            return response
+
+        except exceptions.APIException as e:
+            throttled = getattr(e, 'code', None) == 50011 or e.status_code == 429
+            failed = self.circuit_breaker.is_failure(error=e)
+            raise
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            failed = self.circuit_breaker.is_failure(error=e)
+            raise
+
+        finally:
+            limit.release(latency=latency, throttled=throttled)
+            circuit.record(failed=failed)
+
+    async def request(
+            self, method: str, url: str, headers: Dict[str, str], connector: Any, timeout: Timeouts,
+            body: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a prepared request with the transport and parse the response.
+
+        Args:
+            method (str): the request method is either GET or POST.
+            url (str): the URL with parameters.
+            headers (Dict[str, str]): signed headers.
+            connector (Any): the connection pool of the request.
+            timeout (Timeouts): timeouts of the request.
+            body (Optional[str]): the request body. (None)
+
+        Returns:
+            Optional[Dict[str, Any]]: the JSON response.
+
+        """
+        response = await self.transport.send(request=TransportRequest(
+            method=method, url=url, headers=headers, body=body.encode() if body else None, timeouts=timeout,
+            connector=connector
+        ))
+        data = json.loads(response.content)
+        if response.status_code <= 201:
+            return data
+
+        raise exceptions.APIException(response=data, status_code=response.status_code)
+
+    async def hedged_get(
+            self, endpoint: str, request_path: str, headers: dict, timeout: Timeouts,
+            limit: Optional[AdaptiveLimit] = None, priority: int = Priorities.Normal
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make a GET request and send a hedge over the hedge connector if the response is late.
+
+        The hedge is sent only if an in-flight slot and a token of the endpoint are available right now, the first
+        successful response wins and the other attempt is cancelled.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            request_path (str): the path of requesting an endpoint with parameters.
+            headers (dict): signed headers.
+            timeout (Timeouts): timeouts of each attempt.
+            limit (Optional[AdaptiveLimit]): the in-flight limit of the endpoint the hedge takes a slot of. (None)
+            priority (int): the priority class of the request, one of Priorities. (normal)
+
+        Returns:
+            Optional[Dict[str, Any]]: the request response.
+
+        """
+        delay = self.latency_tracker.percentile(
+            endpoint=endpoint, percentile=self.hedging.percentile, min_samples=self.hedging.min_samples
+        )
+        delay = self.hedging.delay if delay is None else delay
+        delay = min(max(delay, self.hedging.min_delay), self.hedging.max_delay)
+        started = time.monotonic()
+        attempts = {asyncio.ensure_future(
+            self.request(
+                method=Methods.GET, url=self.entrypoint_url + request_path, headers=headers,
+                connector=self.connector, timeout=timeout
             )
+        )}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and (not limit or limit.try_acquire()):
+                if self.rate_limiter.try_acquire(endpoint=endpoint, priority=priority):
+                    if not self.hedge_connector or self.hedge_connector.closed:
+                        self.hedge_connector = self.build_connector(
+                            proxy=self.hedging.proxy if self.hedging.proxy else self.proxy, dns=self.dns
+                        )
 
-        else:
-            response = await async_get(url=url, headers=header, connector=self.connector)
+                    entrypoint_url = self.hedging.entrypoint_url if self.hedging.entrypoint_url else self.entrypoint_url
+                    hedge = asyncio.ensure_future(
+                        self.request(
+                            method=Methods.GET, url=entrypoint_url + request_path, headers=headers,
+                            connector=self.hedge_connector, timeout=timeout
+                        )
+                    )
+                    if limit:
+                        hedge.add_done_callback(lambda _: limit.release())
 
-        if int(response.get('code')):
-            raise exceptions.APIException(response=response)
+                    attempts.add(hedge)
 
-        return response
+                elif limit:
+                    limit.release()
+
+            error = None
+            pending = attempts
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        self.latency_tracker.add(endpoint=endpoint, latency=time.monotonic() - started)
+                        return attempt.result()
+
+                    if not error:
+                        error = attempt.exception()
+
+            raise error
+
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
@@ -0,0 +1,260 @@
+import asyncio
+import marshal
+import os
+import time
+import zlib
+from typing import Optional, Dict, List, Tuple, Union
+from urllib.parse import urlsplit
+
+from py_okx_async.Transport import Transport, AiohttpTransport
+from py_okx_async.exceptions import CassetteMiss
+from py_okx_async.models import CassetteModes, TransportRequest, TransportResponse
+
+
+class Cassette:
+    """
+    The cassette of raw responses that are recorded from real requests and replayed without network.
+
+    In the record mode responses are recorded with their latencies by a RecordingTransport, in the replay mode they are
+    served with the same latencies divided by the speed by a ReplayTransport, so code paths can be benchmarked and
+    tested deterministically. The cassette is saved in the compressed marshal format, signatures and other headers
+    aren't recorded:
+
+        cassette = Cassette(path='balances.cassette', mode=CassetteModes.Record)
+        okx_client = OKXClient(credentials=credentials, cassette=cassette)
+        await okx_client.subaccount.asset_balances(subAcct='sub1')
+        cassette.save()
+
+        okx_client = OKXClient(credentials=credentials, cassette=Cassette(path='balances.cassette', speed=10))
+
+    A request is answered by the next unserved response of the same method, path, parameters and body, then of the same
+    method and path, e.g. if parameters contain the current time. The last response is served again when all are
+    served.
+
+    Attributes:
+        version (int): the version of the file format.
+        path (str): the path of the cassette file.
+        mode (str): one of CassetteModes.
+        speed (float): the factor latencies are divided by in the replay mode, 0 to serve responses instantly.
+        started (float): the monotonic time of the start of the recording.
+        records (List[tuple]): methods, request paths with parameters, bodies, HTTP status codes, response bytes,
+            offsets of requests from the start of the recording and latencies in seconds.
+        requests (Dict[Tuple[str, str, Optional[str]], List[tuple]]): records by methods, request paths with
+            parameters and bodies.
+        endpoints (Dict[Tuple[str, str], List[tuple]]): records by methods and request paths without parameters.
+        positions (Dict[tuple, int]): numbers of served records by keys of requests and endpoints.
+
+    """
+    version: int = 1
+    path: str
+    mode: str
+    speed: float
+    started: float
+    records: List[tuple]
+    requests: Dict[Tuple[str, str, Optional[str]], List[tuple]]
+    endpoints: Dict[Tuple[str, str], List[tuple]]
+    positions: Dict[tuple, int]
+
+    def __init__(self, path: str, mode: str = CassetteModes.Replay, speed: float = 1.0) -> None:
+        """
+        Initialize the class and load the cassette file in the replay mode.
+
+        Args:
+            path (str): the path of the cassette file.
+            mode (str): one of CassetteModes. (replay)
+            speed (float): the factor latencies are divided by in the replay mode, 0 to serve responses instantly. (1.0)
+
+        """
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.started = time.monotonic()
+        self.records = []
+        self.requests = {}
+        self.endpoints = {}
+        self.positions = {}
+        if mode == CassetteModes.Replay:
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        """
+        Check whether responses are replayed.
+
+        Returns:
+            bool: True in the replay mode.
+
+        """
+        return self.mode == CassetteModes.Replay
+
+    @staticmethod
+    def target(url: str) -> str:
+        """
+        Get the request path with parameters, so a cassette doesn't depend on the entrypoint URL.
+
+        Args:
+            url (str): a URL.
+
+        Returns:
+            str: the request path with parameters.
+
+        """
+        url = urlsplit(url)
+        return f'{url.path}?{url.query}' if url.query else url.path
+
+    def record(
+            self, method: str, url: str, data: Optional[Union[str, bytes]], status_code: int, content: bytes,
+            started: float
+    ) -> None:
+        """
+        Record a response.
+
+        Args:
+            method (str): the request method.
+            url (str): the URL.
+            data (Optional[Union[str, bytes]]): the request body.
+            status_code (int): the HTTP status code.
+            content (bytes): the response bytes.
+            started (float): the monotonic time of sending the request.
+
+        """
+        data = data.decode() if isinstance(data, bytes) else data
+        latency = time.monotonic() - started
+        self.records.append((method, self.target(url=url), data, status_code, content, started - self.started, latency))
+
+    async def replay(self, method: str, url: str, data: Optional[Union[str, bytes]]) -> Tuple[int, bytes]:
+        """
+        Serve a recorded response after its latency.
+
+        Args:
+            method (str): the request method.
+            url (str): the URL.
+            data (Optional[Union[str, bytes]]): the request body.
+
+        Returns:
+            Tuple[int, bytes]: the HTTP status code and the response bytes.
+
+        """
+        target = self.target(url=url)
+        data = data.decode() if isinstance(data, bytes) else data
+        for key, index in (
+                ((method, target, data), self.requests), ((method, target.split('?')[0]), self.endpoints)
+        ):
+            records = index.get(key)
+            if records:
+                position = self.positions.get(key, 0)
+                self.positions[key] = position + 1
+                _, _, _, status_code, content, _, latency = records[min(position, len(records) - 1)]
+                if self.speed:
+                    await asyncio.sleep(latency / self.speed)
+
+                return status_code, content
+
+        raise CassetteMiss(f'There is no recorded response to {method} {target}!')
+
+    def load(self) -> None:
+        """
+        Load the cassette file and index its records.
+        """
+        with open(self.path, 'rb') as file:
+            version, self.records = marshal.loads(zlib.decompress(file.read()))
+
+        if version != self.version:
+            raise ValueError(f'The cassette {self.path} has the unsupported version {version}!')
+
+        for record in self.records:
+            method, target, data = record[:3]
+            self.requests.setdefault((method, target, data), []).append(record)
+            self.endpoints.setdefault((method, target.split('?')[0]), []).append(record)
+
+    def save(self) -> None:
+        """
+        Atomically write recorded responses to the cassette file in the order of their requests.
+        """
+        records = sorted(self.records, key=lambda record: record[5])
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(zlib.compress(marshal.dumps((self.version, records)), 9))
+
+        os.replace(temp_path, self.path)
+
+    def transport(self, transport: Optional[Transport] = None) -> Transport:
+        """
+        Get a transport of the cassette mode.
+
+        Args:
+            transport (Optional[Transport]): the transport that makes recorded requests. (AiohttpTransport())
+
+        Returns:
+            Transport: the replay transport or the recording one.
+
+        """
+        if self.replaying:
+            return ReplayTransport(cassette=self)
+
+        return RecordingTransport(cassette=self, transport=transport if transport else AiohttpTransport())
+
+
+class ReplayTransport(Transport):
+    """
+    The transport that serves responses of a cassette without network.
+
+    Attributes:
+        cassette (Cassette): the cassette.
+
+    """
+    network: bool = False
+    cassette: Cassette
+
+    def __init__(self, cassette: Cassette) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            cassette (Cassette): the cassette.
+
+        """
+        self.cassette = cassette
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        status_code, content = await self.cassette.replay(method=request.method, url=request.url, data=request.body)
+        return TransportResponse(status_code=status_code, content=content)
+
+
+class RecordingTransport(Transport):
+    """
+    The transport that records responses of another transport to a cassette, it makes real requests only if that
+    transport does.
+
+    Attributes:
+        cassette (Cassette): the cassette.
+        transport (Transport): the transport that makes requests.
+
+    """
+    cassette: Cassette
+    transport: Transport
+
+    def __init__(self, cassette: Cassette, transport: Transport) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            cassette (Cassette): the cassette.
+            transport (Transport): the transport that makes requests.
+
+        """
+        self.cassette = cassette
+        self.transport = transport
+        self.network = transport.network
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        started = time.monotonic()
+        response = await self.transport.send(request=request)
+        self.cassette.record(
+            method=request.method, url=request.url, data=request.body, status_code=response.status_code,
+            content=response.content, started=started
+        )
+        return response
+
+    async def close(self) -> None:
+        await self.transport.close()
@@ -0,0 +1,218 @@
+import time
+from collections import deque
+from typing import Optional, Dict, Tuple, Deque, Any
+
+from py_okx_async import exceptions
+from py_okx_async.models import CircuitBreakerSettings, CircuitStates
+
+
+class Circuit:
+    """
+    A circuit of an endpoint on a host.
+
+    Attributes:
+        host (str): an API entrypoint url.
+        endpoint (str): the request path without parameters.
+        settings (CircuitBreakerSettings): settings of the circuit.
+        state (str): the circuit state, one of CircuitStates.
+        outcomes (Deque[Tuple[float, bool]]): times of recent requests and whether they failed.
+        opened_at (float): the monotonic time when the circuit was opened.
+        probes (int): the number of probe requests in flight in the half-open state.
+
+    """
+    host: str
+    endpoint: str
+    settings: CircuitBreakerSettings
+    state: str
+    outcomes: Deque[Tuple[float, bool]]
+    opened_at: float
+    probes: int
+
+    def __init__(self, host: str, endpoint: str, settings: CircuitBreakerSettings) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            host (str): an API entrypoint url.
+            endpoint (str): the request path without parameters.
+            settings (CircuitBreakerSettings): settings of the circuit.
+
+        """
+        self.host = host
+        self.endpoint = endpoint
+        self.settings = settings
+        self.state = CircuitStates.Closed
+        self.outcomes = deque()
+        self.opened_at = 0.0
+        self.probes = 0
+
+    def prune(self, now: float) -> None:
+        """
+        Remove outcomes that are older than the window.
+
+        Args:
+            now (float): the current monotonic time.
+
+        """
+        while self.outcomes and now - self.outcomes[0][0] > self.settings.window:
+            self.outcomes.popleft()
+
+    def failure_rate(self) -> float:
+        """
+        Get the failure rate of requests within the window.
+
+        Returns:
+            float: the failure rate from 0 to 1.
+
+        """
+        self.prune(now=time.monotonic())
+        if not self.outcomes:
+            return 0.0
+
+        return sum(failed for _, failed in self.outcomes) / len(self.outcomes)
+
+    def allow(self) -> None:
+        """
+        Let a request through or reject it if the circuit is open.
+
+        Raises:
+            CircuitOpen: if the circuit is open or all probes of the half-open circuit are in flight.
+
+        """
+        if self.state == CircuitStates.Closed:
+            return
+
+        now = time.monotonic()
+        if self.state == CircuitStates.Open and now - self.opened_at >= self.settings.open_timeout:
+            self.state = CircuitStates.HalfOpen
+            self.probes = 0
+
+        if self.state == CircuitStates.HalfOpen and self.probes < self.settings.half_open_probes:
+            self.probes += 1
+            return
+
+        raise exceptions.CircuitOpen(
+            host=self.host, endpoint=self.endpoint,
+            retry_after=max(0.0, self.opened_at + self.settings.open_timeout - now)
+        )
+
+    def record(self, failed: Optional[bool]) -> None:
+        """
+        Record an outcome of a let through request.
+
+        Args:
+            failed (Optional[bool]): whether the request failed, None if the outcome is unknown, e.g. it was cancelled.
+
+        """
+        now = time.monotonic()
+        if self.state == CircuitStates.HalfOpen:
+            self.probes = max(0, self.probes - 1)
+            if failed:
+                self.open(now=now)
+
+            elif failed is False:
+                self.state = CircuitStates.Closed
+                self.outcomes.clear()
+
+            return
+
+        if failed is None or self.state == CircuitStates.Open:
+            return
+
+        self.outcomes.append((now, failed))
+        self.prune(now=now)
+        if len(self.outcomes) >= self.settings.min_requests and self.failure_rate() >= self.settings.failure_rate:
+            self.open(now=now)
+
+    def open(self, now: float) -> None:
+        """
+        Open the circuit.
+
+        Args:
+            now (float): the current monotonic time.
+
+        """
+        self.state = CircuitStates.Open
+        self.opened_at = now
+        self.outcomes.clear()
+
+
+class CircuitBreaker:
+    """
+    The circuit breaker that keeps a circuit for each endpoint and host.
+
+    Attributes:
+        settings (CircuitBreakerSettings): settings of circuits.
+        circuits (Dict[Tuple[str, str], Circuit]): circuits by hosts and request paths.
+
+    """
+    settings: CircuitBreakerSettings
+    circuits: Dict[Tuple[str, str], Circuit]
+
+    def __init__(self, settings: Optional[CircuitBreakerSettings] = None) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            settings (Optional[CircuitBreakerSettings]): settings of circuits. (CircuitBreakerSettings())
+
+        """
+        self.settings = settings if settings else CircuitBreakerSettings()
+        self.circuits = {}
+
+    def circuit(self, host: str, endpoint: str) -> Circuit:
+        """
+        Get a circuit of the endpoint on the host.
+
+        Args:
+            host (str): an API entrypoint url.
+            endpoint (str): the request path without parameters.
+
+        Returns:
+            Circuit: the circuit.
+
+        """
+        key = (host, endpoint)
+        if key not in self.circuits:
+            self.circuits[key] = Circuit(host=host, endpoint=endpoint, settings=self.settings)
+
+        return self.circuits[key]
+
+    def is_failure(self, error: Optional[BaseException] = None, response: Optional[dict] = None) -> bool:
+        """
+        Check if an error or a response means that the exchange is unavailable.
+
+        Args:
+            error (Optional[BaseException]): a raised exception. (None)
+            response (Optional[dict]): a JSON response. (None)
+
+        Returns:
+            bool: True if it is a failure of the exchange rather than of the request.
+
+        """
+        if isinstance(error, exceptions.APIException):
+            return bool(error.status_code and error.status_code >= 500) or \
+                getattr(error, 'code', None) in self.settings.failure_codes
+
+        if error:
+            return True
+
+        try:
+            return int(response.get('code')) in self.settings.failure_codes
+
+        except (AttributeError, TypeError, ValueError):
+            return False
+
+    def states(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Get states of circuits for monitoring.
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, Any]]: the state, failure rate and number of recent requests by hosts
+                and request paths.
+
+        """
+        return {
+            key: {'state': circuit.state, 'failure_rate': circuit.failure_rate(), 'requests': len(circuit.outcomes)}
+            for key, circuit in self.circuits.items()
+        }
@@ -0,0 +1,190 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Optional, Dict, Tuple, List
+
+from py_okx_async.models import ConcurrencySettings, Priorities
+
+
+class AdaptiveLimit:
+    """
+    An in-flight limit of an endpoint that is raised additively on success and cut multiplicatively on overload.
+
+    Attributes:
+        settings (ConcurrencySettings): settings of the limit.
+        limit (float): the current limit.
+        in_flight (int): the number of requests in flight.
+        baseline (Optional[float]): the smoothed latency of normal responses in seconds.
+        decreased (float): the monotonic time of the last decrease.
+        waiters (List[Tuple[int, int, asyncio.Future]]): the heap of waiting requests ordered by priority classes
+            and then by arrival.
+
+    """
+    settings: ConcurrencySettings
+    limit: float
+    in_flight: int
+    baseline: Optional[float]
+    decreased: float
+    waiters: List[Tuple[int, int, asyncio.Future]]
+    __counter: itertools.count
+
+    def __init__(self, settings: ConcurrencySettings) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            settings (ConcurrencySettings): settings of the limit.
+
+        """
+        self.settings = settings
+        self.limit = float(settings.initial)
+        self.in_flight = 0
+        self.baseline = None
+        self.decreased = 0.0
+        self.waiters = []
+        self.__counter = itertools.count()
+
+    async def acquire(self, priority: int = Priorities.Normal) -> None:
+        """
+        Wait until the number of requests in flight is below the limit and take a slot, waiting requests of higher
+        priority classes take free slots first.
+
+        Args:
+            priority (int): the priority class of the request, one of Priorities. (normal)
+
+        """
+        if self.in_flight < int(self.limit) and not self.waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_event_loop().create_future()
+        entry = (priority, next(self.__counter), waiter)
+        heapq.heappush(self.waiters, entry)
+        try:
+            await waiter
+
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self.wake_up()
+
+            else:
+                self.waiters.remove(entry)
+                heapq.heapify(self.waiters)
+
+            raise
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot if the number of requests in flight is below the limit and no request is waiting.
+
+        Returns:
+            bool: True if the slot was taken.
+
+        """
+        if self.in_flight < int(self.limit) and not self.waiters:
+            self.in_flight += 1
+            return True
+
+        return False
+
+    def release(self, latency: Optional[float] = None, throttled: bool = False) -> None:
+        """
+        Release a slot and adjust the limit.
+
+        Args:
+            latency (Optional[float]): the latency of a successful response in seconds. (unknown)
+            throttled (bool): whether the request was rejected because of the rate limit. (False)
+
+        """
+        self.in_flight -= 1
+        if throttled:
+            self.decrease()
+
+        elif latency is not None:
+            if self.baseline and latency > self.baseline * self.settings.latency_factor:
+                self.decrease()
+
+            else:
+                self.baseline = latency if self.baseline is None else self.baseline * 0.9 + latency * 0.1
+                self.limit = min(float(self.settings.maximum), self.limit + self.settings.increase / self.limit)
+
+        self.wake_up()
+
+    def decrease(self) -> None:
+        """
+        Cut the limit multiplicatively, at most once per the baseline latency.
+        """
+        now = time.monotonic()
+        if now - self.decreased < (self.baseline if self.baseline else 0):
+            return
+
+        self.decreased = now
+        self.limit = max(float(self.settings.minimum), self.limit * self.settings.decrease)
+
+    def wake_up(self) -> None:
+        """
+        Give free slots to waiting requests.
+        """
+        while self.waiters and self.in_flight < int(self.limit):
+            _, _, waiter = heapq.heappop(self.waiters)
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class ConcurrencyController:
+    """
+    The controller of adaptive in-flight limits for each API key and endpoint.
+
+    Attributes:
+        settings (ConcurrencySettings): settings of limits.
+        limits (Dict[Tuple[str, str], AdaptiveLimit]): limits by API keys and request paths.
+
+    """
+    settings: ConcurrencySettings
+    limits: Dict[Tuple[str, str], AdaptiveLimit]
+
+    def __init__(self, settings: Optional[ConcurrencySettings] = None) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            settings (Optional[ConcurrencySettings]): settings of limits. (ConcurrencySettings())
+
+        """
+        self.settings = settings if settings else ConcurrencySettings()
+        self.limits = {}
+
+    def limit(self, api_key: str, endpoint: str) -> AdaptiveLimit:
+        """
+        Get a limit of the API key and endpoint.
+
+        Args:
+            api_key (str): the API key.
+            endpoint (str): the request path without parameters.
+
+        Returns:
+            AdaptiveLimit: the limit.
+
+        """
+        key = (api_key, endpoint)
+        if key not in self.limits:
+            self.limits[key] = AdaptiveLimit(settings=self.settings)
+
+        return self.limits[key]
+
+    def stats(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Get current limits for monitoring.
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, float]]: the limit, requests in flight and waiting ones by API keys
+                and request paths.
+
+        """
+        return {
+            key: {'limit': limit.limit, 'in_flight': limit.in_flight, 'waiting': len(limit.waiters)}
+            for key, limit in self.limits.items()
+        }
@@ -0,0 +1,68 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional, List
+
+current_deadline: ContextVar[Optional['Deadline']] = ContextVar('current_deadline', default=None)
+
+
+class Deadline:
+    """
+    A time budget shared by all requests made within it, including pagination and hedges.
+
+    It can be passed to functions explicitly or used as a context manager, then every request made inside the block
+    and tasks created from it respect the budget:
+
+        with Deadline(timeout=5):
+            balances = await okx_client.asset.balances()
+
+    Attributes:
+        timeout (float): the budget in seconds.
+        expires_at (float): the monotonic time when the budget is spent.
+
+    """
+    timeout: float
+    expires_at: float
+    __tokens: List[Token]
+
+    def __init__(self, timeout: float) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            timeout (float): the budget in seconds.
+
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.__tokens = []
+
+    def remaining(self) -> float:
+        """
+        Get the remaining budget.
+
+        Returns:
+            float: the remaining budget in seconds, 0 if it is spent.
+
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """
+        Check if the budget is spent.
+
+        Returns:
+            bool: True if the budget is spent.
+
+        """
+        return not self.remaining()
+
+    def __enter__(self) -> 'Deadline':
+        self.__tokens.append(current_deadline.set(self))
+        return self
+
+    def __exit__(self, *args) -> None:
+        current_deadline.reset(self.__tokens.pop())
+
+    def __repr__(self) -> str:
+        return f'Deadline(timeout={self.timeout!r}, remaining={self.remaining():.3f})'
@@ -1,29 +1,76 @@
-from typing import Optional, Dict
+import asyncio
+import importlib
+import time
+import uuid
+from typing import Optional, Dict, Any, Tuple, Iterable, Awaitable, List, Union, TYPE_CHECKING
+from urllib.error import HTTPError
 
-import requests
+from py_okx_async.CircuitBreaker import CircuitBreaker
+from py_okx_async.ConcurrencyController import ConcurrencyController
+from py_okx_async.RateLimiter import RateLimiter, LatencyTracker
+from py_okx_async.asset.models import TransferTypes, TransferStates
+from py_okx_async.exceptions import InvalidProxy, APIException, DeadlineExceeded
+from py_okx_async.models import (
+    OKXCredentials, RateLimit, HedgingSettings, Timeouts, ConcurrencySettings, CircuitBreakerSettings, FundingToken,
+    TreasurySnapshot, SweepStatuses, SweepTransfer, AccountTypes, DNSSettings, AccountSnapshot, TokenExposure,
+    TradingToken
+)
 
-from py_okx_async.asset.Asset import Asset
-from py_okx_async.exceptions import InvalidProxy
-from py_okx_async.models import OKXCredentials
-from py_okx_async.subaccount.Subaccount import Subaccount
+if TYPE_CHECKING:
+    from py_okx_async.Cassette import Cassette
+    from py_okx_async.asset.BalanceTracker import BalanceTracker
+    from py_okx_async.Transport import Transport
+    from py_okx_async.account.Account import Account
+    from py_okx_async.asset.Asset import Asset
+    from py_okx_async.public.Public import Public
+    from py_okx_async.subaccount.Subaccount import Subaccount
 
 
 class OKXClient:
     """
     The client that is used to interact with all functions.
 
+    Section modules are imported and section instances are created on the first access to them.
+
     Attributes:
+        sections (Dict[str, Tuple[str, str]]): modules and classes of sections by attribute names.
         entrypoint_url (str): an entrypoint URL.
         proxy (Optional[Dict[str, str]]): an HTTP or SOCKS5 IPv4 proxy dictionary.
+        rate_limiter (RateLimiter): a rate limiter shared by all sections.
+        latency_tracker (LatencyTracker): a tracker of response latencies shared by all sections.
+        concurrency (ConcurrencyController): a controller of adaptive in-flight limits shared by all sections.
+        circuit_breaker (CircuitBreaker): a circuit breaker of endpoints shared by all sections, its states()
+            function returns states of circuits for monitoring.
 
     """
     __credentials: OKXCredentials
     entrypoint_url: str
     proxy: Optional[str] = None
+    rate_limiter: RateLimiter
+    latency_tracker: LatencyTracker
+    concurrency: ConcurrencyController
+    circuit_breaker: CircuitBreaker
+    asset: 'Asset'
+    account: 'Account'
+    subaccount: 'Subaccount'
+    public: 'Public'
+    sections: Dict[str, Tuple[str, str]] = {
+        'asset': ('py_okx_async.asset.Asset', 'Asset'),
+        'account': ('py_okx_async.account.Account', 'Account'),
+        'subaccount': ('py_okx_async.subaccount.Subaccount', 'Subaccount'),
+        'public': ('py_okx_async.public.Public', 'Public'),
+    }
+    __section_kwargs: Dict[str, Any]
+    __balance_tracker: Optional['BalanceTracker'] = None
 
     def __init__(
             self, credentials: OKXCredentials, entrypoint_url: str = 'https://www.okx.com', proxy: Optional[str] = None,
-            check_proxy: bool = True
+            check_proxy: bool = True, rate_limits: Optional[Dict[str, RateLimit]] = None,
+            hedging: Optional[HedgingSettings] = None, timeouts: Optional[Timeouts] = None,
+            concurrency: Optional[Union[ConcurrencySettings, ConcurrencyController]] = None,
+            circuit_breaker: Optional[Union[CircuitBreakerSettings, CircuitBreaker]] = None,
+            rate_limiter: Optional[RateLimiter] = None, bulk_share: float = 0.5, dns: Optional[DNSSettings] = None,
+            transport: Optional['Transport'] = None, cassette: Optional['Cassette'] = None
     ) -> None:
         """
         Initialize the class.
@@ -40,10 +87,37 @@ class OKXClient:
                 - http://proxy:port
 
             check_proxy (bool): check if the proxy is working. (True)
+            rate_limits (Optional[Dict[str, RateLimit]]): rate limits by request paths that override
+                the default ones. (RateLimits.limits_dict)
+            hedging (Optional[HedgingSettings]): settings of hedged GET requests, e.g. HedgingSettings() to hedge
+                idempotent GET requests that are later than the 95th percentile of observed latency. (disabled)
+            timeouts (Optional[Timeouts]): default total, connect and read timeouts of requests. (Timeouts())
+            concurrency (Optional[Union[ConcurrencySettings, ConcurrencyController]]): settings of adaptive in-flight
+                limits of each endpoint or a controller to use instead of a new one, e.g. the one shared by clients
+                of the same API key. (ConcurrencySettings())
+            circuit_breaker (Optional[Union[CircuitBreakerSettings, CircuitBreaker]]): settings of the circuit breaker
+                that rejects requests with the CircuitOpen exception while an endpoint is failing or a circuit breaker
+                to use instead of a new one. (CircuitBreakerSettings())
+            rate_limiter (Optional[RateLimiter]): a rate limiter to use instead of a new one, e.g. the one shared
+                by clients of the same API key or by processes, 'rate_limits' and 'bulk_share' are ignored then.
+                (a new one)
+            bulk_share (float): the share of the rate of each endpoint available to requests of the bulk priority
+                class, see the Priority class. (0.5)
+            dns (Optional[DNSSettings]): settings of resolving hosts of the API and proxies, e.g. DNSSettings() to
+                resolve them with aiodns if it's installed and cache them for 5 minutes in a cache shared by all
+                connectors. See also the install_uvloop function of utils. (getaddrinfo in the thread pool)
+            transport (Optional[Transport]): the transport that sends requests of all sections, e.g. a MockTransport,
+                the entrypoint and the proxy are checked only if it makes real requests. (AiohttpTransport())
+            cassette (Optional[Cassette]): a cassette responses of all sections are recorded to or replayed from,
+                the transport records them or is replaced with the replay one. (None)
 
         """
         self.__credentials = credentials
         self.entrypoint_url = entrypoint_url
+        if cassette:
+            transport = cassette.transport(transport=transport)
+
+        offline = transport is not None and not transport.network
         if proxy:
             try:
                 if 'http' not in proxy and 'socks5' not in proxy:
@@ -53,10 +127,8 @@ class OKXClient:
                     proxy = proxy.replace('socks5', 'socks5h')
 
                 self.proxy = proxy
-                if check_proxy:
-                    your_ip = requests.get(
-                        'http://eth0.me/', proxies={'http': self.proxy, 'https': self.proxy}, timeout=10
-                    ).text.rstrip()
+                if check_proxy and not offline:
+                    your_ip = self.sync_get(url='http://eth0.me/', timeout=10).rstrip()
                     if your_ip not in proxy:
                         raise InvalidProxy(f"Proxy doesn't work! Your IP is {your_ip}.")
 
@@ -67,13 +139,366 @@ class OKXClient:
                 raise InvalidProxy(str(e))
 
         try:
-            requests.get(self.entrypoint_url + '/api/v5/public/time', proxies={'http': self.proxy, 'https': self.proxy})
+            if not offline:
+                self.sync_get(url=self.entrypoint_url + '/api/v5/public/time')
 
-        except requests.exceptions.ConnectionError:
+        except HTTPError:
+            pass
+
+        except OSError:
             self.entrypoint_url = 'https://www.okx.cab'
-            requests.get(self.entrypoint_url + '/api/v5/public/time', proxies={'http': self.proxy, 'https': self.proxy})
+            self.sync_get(url=self.entrypoint_url + '/api/v5/public/time')
+
+        if hedging and hedging.proxy and 'http' not in hedging.proxy and 'socks5' not in hedging.proxy:
+            hedging.proxy = f'http://{hedging.proxy}'
+
+        self.rate_limiter = rate_limiter if rate_limiter else RateLimiter(limits=rate_limits, bulk_share=bulk_share)
+        self.latency_tracker = LatencyTracker()
+        self.concurrency = concurrency if isinstance(concurrency, ConcurrencyController) else \
+            ConcurrencyController(settings=concurrency)
+        self.circuit_breaker = circuit_breaker if isinstance(circuit_breaker, CircuitBreaker) else \
+            CircuitBreaker(settings=circuit_breaker)
+        self.__section_kwargs = {
+            'credentials': self.__credentials, 'entrypoint_url': self.entrypoint_url, 'proxy': self.proxy,
+            'rate_limiter': self.rate_limiter, 'latency_tracker': self.latency_tracker, 'hedging': hedging,
+            'timeouts': timeouts, 'concurrency': self.concurrency, 'circuit_breaker': self.circuit_breaker,
+            'dns': dns, 'transport': transport
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        if name in OKXClient.sections:
+            module_name, class_name = OKXClient.sections[name]
+            section = getattr(importlib.import_module(module_name), class_name)(**self.__section_kwargs)
+            setattr(self, name, section)
+            return section
+
+        raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+
+    @property
+    def balance_tracker(self) -> 'BalanceTracker':
+        """
+        Get the tracker of funding balances, it is created on the first access and observes all balances of funding
+        accounts requested by the 'asset' and 'subaccount' sections after that.
+
+        Returns:
+            BalanceTracker: the tracker.
+
+        """
+        if not self.__balance_tracker:
+            from py_okx_async.asset.BalanceTracker import BalanceTracker
+
+            self.__balance_tracker = BalanceTracker(okx_client=self)
+            self.asset.balance_tracker = self.__balance_tracker
+            self.subaccount.balance_tracker = self.__balance_tracker
+
+        return self.__balance_tracker
+
+    def sync_get(self, url: str, timeout: Optional[float] = None) -> str:
+        """
+        Make a synchronous GET request, the 'requests' library is imported only if the proxy is specified.
+
+        Args:
+            url (str): a URL.
+            timeout (Optional[float]): a timeout in seconds. (None)
+
+        Returns:
+            str: the response text.
+
+        """
+        if self.proxy:
+            import requests
+
+            return requests.get(url, proxies={'http': self.proxy, 'https': self.proxy}, timeout=timeout).text
+
+        from urllib.request import urlopen
+
+        with urlopen(url, timeout=timeout) as response:
+            return response.read().decode()
+
+    async def prices(self, quote: str = 'USDT') -> Dict[str, float]:
+        """
+        Get last prices of all spot tokens in the quote token with a single unsigned tickers request.
+
+        Args:
+            quote (str): the quote token symbol. (USDT)
+
+        Returns:
+            Dict[str, float]: the prices by token symbols, the quote token price is 1.
+
+        """
+        prices = {quote: 1.0}
+        for instId, ticker in (await self.public.tickers()).items():
+            token_symbol, _, ticker_quote = instId.partition('-')
+            if ticker_quote == quote and ticker.last:
+                prices[token_symbol] = ticker.last
+
+        return prices
+
+    async def treasury_snapshot(
+            self, subaccounts: Optional[Iterable[str]] = None, quote: str = 'USDT'
+    ) -> TreasurySnapshot:
+        """
+        Concurrently get funding balances of the master account and all sub-accounts and value them in USD.
+
+        Balances of the master account, the list of sub-accounts and prices are requested at the same time, balances
+        of sub-accounts are requested as soon as the list is received.
+
+        Args:
+            subaccounts (Optional[Iterable[str]]): sub-account names. (absolutely all)
+            quote (str): the quote token symbol used as USD. (USDT)
+
+        Returns:
+            TreasurySnapshot: the aggregated holdings with timings of stages.
+
+        """
+        started = time.monotonic()
+        ts = int(time.time() * 1000)
+        timings = {}
+
+        async def timed(stage: str, coroutine: Awaitable) -> Any:
+            stage_started = time.monotonic()
+            result = await coroutine
+            timings[stage] = time.monotonic() - stage_started
+            return result
+
+        async def subaccount_balances() -> Dict[str, Dict[str, FundingToken]]:
+            names = subaccounts
+            if names is None:
+                names = await timed('subaccounts', self.subaccount_names())
+
+            names = list(names)
+            balances = await timed('subaccount_balances', asyncio.gather(
+                *(self.subaccount.asset_balances(subAcct=name) for name in names)
+            ))
+            return dict(zip(names, balances))
+
+        master_balances, other_balances, prices = await asyncio.gather(
+            timed('balances', self.asset.balances()), subaccount_balances(), timed('prices', self.prices(quote=quote))
+        )
+        accounts = {None: master_balances}
+        accounts.update(other_balances)
+        tokens = {}
+        accounts_usd = {}
+        for account, balances in accounts.items():
+            accounts_usd[account] = 0.0
+            for token_symbol, token in balances.items():
+                tokens[token_symbol] = tokens.get(token_symbol, 0.0) + token.bal
+                if token_symbol in prices:
+                    accounts_usd[account] += token.bal * prices[token_symbol]
+
+        tokens_usd = {
+            token_symbol: bal * prices[token_symbol] if token_symbol in prices else None
+            for token_symbol, bal in tokens.items()
+        }
+        timings['total'] = time.monotonic() - started
+        return TreasurySnapshot(
+            accounts=accounts, prices=prices, tokens=tokens, tokens_usd=tokens_usd, accounts_usd=accounts_usd,
+            total_usd=sum(accounts_usd.values()), timings=timings, ts=ts
+        )
+
+    async def account_snapshot(self, subaccounts: Optional[Iterable[str]] = ()) -> AccountSnapshot:
+        """
+        Concurrently get funding and trading balances of the master account and sub-accounts and merge them by tokens.
+
+        Balances of both accounts of the master account and the list of sub-accounts are requested at the same time,
+        balances of both accounts of sub-accounts are requested as soon as the list is received, so all balances are
+        taken within a single round of requests.
+
+        Args:
+            subaccounts (Optional[Iterable[str]]): sub-account names, None for all of them. (only the master account)
+
+        Returns:
+            AccountSnapshot: the merged balances with timings of stages.
 
-        self.asset = Asset(credentials=self.__credentials, entrypoint_url=self.entrypoint_url, proxy=self.proxy)
-        self.subaccount = Subaccount(
-            credentials=self.__credentials, entrypoint_url=self.entrypoint_url, proxy=self.proxy
+        """
+        started = time.monotonic()
+        ts = int(time.time() * 1000)
+        timings = {}
+
+        async def timed(stage: str, coroutine: Awaitable) -> Any:
+            stage_started = time.monotonic()
+            result = await coroutine
+            timings[stage] = time.monotonic() - stage_started
+            return result
+
+        async def other_balances() -> Tuple[Dict[str, Dict[str, FundingToken]], Dict[str, Dict[str, TradingToken]]]:
+            names = subaccounts
+            if names is None:
+                names = await timed('subaccounts', self.subaccount_names())
+
+            names = list(names)
+            if not names:
+                return {}, {}
+
+            balances = await timed('subaccount_balances', asyncio.gather(
+                *(self.subaccount.asset_balances(subAcct=name) for name in names),
+                *(self.subaccount.trading_balances(subAcct=name) for name in names)
+            ))
+            return dict(zip(names, balances[:len(names)])), dict(zip(names, balances[len(names):]))
+
+        master_funding, master_trading, (other_funding, other_trading) = await asyncio.gather(
+            timed('funding', self.asset.balances()), timed('trading', self.account.balances()), other_balances()
+        )
+        funding = {None: master_funding}
+        funding.update(other_funding)
+        trading = {None: master_trading}
+        trading.update(other_trading)
+        accounts = {}
+        tokens = {}
+        for account in funding:
+            accounts[account] = {}
+            for balances in (funding[account], trading[account]):
+                for token_symbol, token in balances.items():
+                    for exposures in (accounts[account], tokens):
+                        exposure = exposures.setdefault(token_symbol, TokenExposure(token_symbol=token_symbol))
+                        if isinstance(token, FundingToken):
+                            exposure.funding += token.bal
+
+                        else:
+                            exposure.trading += token.eq
+
+                        exposure.availBal += token.availBal
+                        exposure.frozenBal += token.frozenBal
+
+        timings['total'] = time.monotonic() - started
+        return AccountSnapshot(
+            funding=funding, trading=trading, accounts=accounts, tokens=tokens, timings=timings, ts=ts
         )
+
+    async def subaccount_names(self) -> List[str]:
+        """
+        Get names of all sub-accounts from the directory of the 'subaccount' section if it's set, otherwise requesting
+        pages one by one.
+
+        Returns:
+            List[str]: the names of sub-accounts.
+
+        """
+        if self.subaccount.directory:
+            return list(await self.subaccount.directory.list())
+
+        return [info.subAcct async for info in self.subaccount.iter_list()]
+
+    async def sweep(
+            self, subaccounts: Optional[Iterable[str]] = None, token_symbols: Optional[Iterable[str]] = None,
+            dry_run: bool = False, retries: int = 3
+    ) -> List[SweepTransfer]:
+        """
+        Transfer available balances from funding accounts of sub-accounts to the funding account of the master account.
+
+        Balances of all sub-accounts are requested concurrently, then transfers are sent concurrently within the rate
+        limit of the transfer endpoint.
+
+        Args:
+            subaccounts (Optional[Iterable[str]]): sub-account names. (absolutely all)
+            token_symbols (Optional[Iterable[str]]): token symbols to sweep. (absolutely all)
+            dry_run (bool): only build transfers without sending them. (False)
+            retries (int): the number of retries of a transfer whose request failed. (3)
+
+        Returns:
+            List[SweepTransfer]: the transfers with their results.
+
+        """
+        names = list(subaccounts) if subaccounts is not None else await self.subaccount_names()
+        token_symbols = list(token_symbols) if token_symbols is not None else None
+        balances = await asyncio.gather(
+            *(self.subaccount.asset_balances(subAcct=name, token_symbol=token_symbols) for name in names)
+        )
+        transfers = []
+        for name, tokens in zip(names, balances):
+            for token_symbol, token in tokens.items():
+                if token.availBal > 0:
+                    transfers.append(SweepTransfer(
+                        subAcct=name, token_symbol=token_symbol, amount=token.data.get('availBal'),
+                        clientId=uuid.uuid4().hex
+                    ))
+
+        if not dry_run:
+            await asyncio.gather(*(self.sweep_transfer(transfer=transfer, retries=retries) for transfer in transfers))
+
+        return transfers
+
+    async def sweep_transfer(self, transfer: SweepTransfer, retries: int = 3) -> SweepTransfer:
+        """
+        Send a sweep transfer and retry it if its request failed.
+
+        Before each retry the transfer is looked up by its client-supplied ID, so a transfer whose response was lost
+        isn't sent twice. If the lookup itself fails, the transfer isn't sent again since it may have been made, and
+        it ends up with the unknown status if its state is still unknown after all retries.
+
+        Args:
+            transfer (SweepTransfer): the transfer.
+            retries (int): the number of retries. (3)
+
+        Returns:
+            SweepTransfer: the same transfer with the result.
+
+        """
+        statuses = {
+            TransferStates.Success: SweepStatuses.Success,
+            TransferStates.Pending: SweepStatuses.Pending,
+            TransferStates.Failed: SweepStatuses.Failed
+        }
+
+        async def found() -> Optional[bool]:
+            try:
+                state = await self.asset.transfer_state(
+                    clientId=transfer.clientId, type=TransferTypes.SubToMasterMasterKey
+                )
+
+            except DeadlineExceeded:
+                raise
+
+            except Exception as e:
+                transfer.error = str(e) or e.__class__.__name__
+                return None
+
+            if not state:
+                return False
+
+            transfer.transId = state.transId
+            transfer.status = statuses.get(state.state, SweepStatuses.Unknown)
+            return True
+
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(min(2 ** attempt, 30))
+                is_found = await found()
+                if is_found:
+                    return transfer
+
+                if is_found is None:
+                    continue
+
+            transfer.attempts += 1
+            try:
+                result = await self.asset.transfer(
+                    token_symbol=transfer.token_symbol, amount=transfer.amount, from_=AccountTypes.Funding,
+                    to_=AccountTypes.Funding, subAcct=transfer.subAcct, type=TransferTypes.SubToMasterMasterKey,
+                    clientId=transfer.clientId
+                )
+                transfer.transId = result.transId
+                transfer.status = SweepStatuses.Success
+                transfer.error = None
+                return transfer
+
+            except APIException as e:
+                transfer.error = str(e)
+                if getattr(e, 'code', None) != 50011 and not self.circuit_breaker.is_failure(error=e):
+                    transfer.status = SweepStatuses.Failed
+                    return transfer
+
+            except (asyncio.CancelledError, DeadlineExceeded):
+                raise
+
+            except Exception as e:
+                transfer.error = str(e) or e.__class__.__name__
+
+        is_found = await found()
+        if is_found is None:
+            transfer.status = SweepStatuses.Unknown
+
+        elif not is_found:
+            transfer.status = SweepStatuses.Failed
+
+        return transfer
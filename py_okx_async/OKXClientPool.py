@@ -0,0 +1,155 @@
+import asyncio
+import threading
+from typing import Optional, Dict, List, Any, Iterable, Callable, Awaitable, AsyncIterator
+
+from py_okx_async.CircuitBreaker import CircuitBreaker
+from py_okx_async.ConcurrencyController import ConcurrencyController
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.RateLimiter import RateLimiter
+from py_okx_async.models import OKXCredentials, AccountResult
+
+
+class OKXClientPool:
+    """
+    The pool of clients of many accounts, clients are created on the first use.
+
+    Clients of the same API key share a rate limiter, a controller of adaptive in-flight limits and a circuit breaker,
+so the limits of the API key aren't multiplied by the number of its accounts and a backoff slows all of them.
+
+    Attributes:
+        credentials (Dict[str, OKXCredentials]): API key data by account names.
+        client_kwargs (Dict[str, Any]): other arguments of clients.
+        rate_limiter_factory (Callable[[str], RateLimiter]): the function that builds a rate limiter of an API key.
+        clients (Dict[str, OKXClient]): created clients by account names.
+        rate_limiters (Dict[str, RateLimiter]): rate limiters by API keys.
+        concurrency_controllers (Dict[str, ConcurrencyController]): controllers of adaptive in-flight limits
+            by API keys.
+        circuit_breakers (Dict[str, CircuitBreaker]): circuit breakers by API keys.
+        lock (threading.Lock): the lock of clients and objects shared by API keys, clients are created in threads.
+
+    """
+    credentials: Dict[str, OKXCredentials]
+    client_kwargs: Dict[str, Any]
+    rate_limiter_factory: Callable[[str], RateLimiter]
+    clients: Dict[str, OKXClient]
+    rate_limiters: Dict[str, RateLimiter]
+    concurrency_controllers: Dict[str, ConcurrencyController]
+    circuit_breakers: Dict[str, CircuitBreaker]
+    lock: threading.Lock
+
+    def __init__(
+            self, credentials: Dict[str, OKXCredentials],
+            rate_limiter_factory: Optional[Callable[[str], RateLimiter]] = None, **client_kwargs
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            credentials (Dict[str, OKXCredentials]): API key data by account names.
+            rate_limiter_factory (Optional[Callable[[str], RateLimiter]]): the function that builds a rate limiter
+                of an API key. (a local rate limiter with the 'rate_limits' of clients)
+            client_kwargs: other arguments of the OKXClient class, e.g. proxy or timeouts.
+
+        """
+        self.credentials = credentials
+        self.client_kwargs = client_kwargs
+        self.rate_limiter_factory = rate_limiter_factory if rate_limiter_factory else (
+            lambda api_key: RateLimiter(
+                limits=client_kwargs.get('rate_limits'), bulk_share=client_kwargs.get('bulk_share', 0.5)
+            )
+        )
+        self.clients = {}
+        self.rate_limiters = {}
+        self.concurrency_controllers = {}
+        self.circuit_breakers = {}
+        self.lock = threading.Lock()
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Get account names.
+
+        Returns:
+            List[str]: the account names.
+
+        """
+        return list(self.credentials)
+
+    def client(self, name: str) -> OKXClient:
+        """
+        Get a client of the account, create it if there isn't one.
+
+        Args:
+            name (str): account name.
+
+        Returns:
+            OKXClient: the client.
+
+        """
+        if name not in self.clients:
+            credentials = self.credentials[name]
+            api_key = credentials.api_key
+            with self.lock:
+                if api_key not in self.rate_limiters:
+                    self.rate_limiters[api_key] = self.rate_limiter_factory(api_key)
+                    self.concurrency_controllers[api_key] = ConcurrencyController(
+                        settings=self.client_kwargs.get('concurrency')
+                    )
+                    self.circuit_breakers[api_key] = CircuitBreaker(settings=self.client_kwargs.get('circuit_breaker'))
+
+                shared = {
+                    'rate_limiter': self.rate_limiters[api_key], 'concurrency': self.concurrency_controllers[api_key],
+                    'circuit_breaker': self.circuit_breakers[api_key]
+                }
+
+            # The client makes blocking requests on creation, so it is created outside the lock.
+            client = OKXClient(credentials=credentials, **{**self.client_kwargs, **shared})
+            with self.lock:
+                self.clients.setdefault(name, client)
+
+        return self.clients[name]
+
+    async def map(
+            self, func: Callable[[str, OKXClient], Awaitable[Any]], names: Optional[Iterable[str]] = None,
+            concurrency: int = 16
+    ) -> AsyncIterator[AccountResult]:
+        """
+        Concurrently call the function for accounts and yield results as soon as they are ready.
+
+        Args:
+            func (Callable[[str, OKXClient], Awaitable[Any]]): an async function that takes an account name
+                and its client.
+            names (Optional[Iterable[str]]): account names. (absolutely all)
+            concurrency (int): the maximum number of accounts processed at the same time. (16)
+
+        Returns:
+            AsyncIterator[AccountResult]: results in the order of completion.
+
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(name: str) -> AccountResult:
+            async with semaphore:
+                try:
+                    # Clients make blocking requests on creation, so they are created in threads.
+                    client = self.clients.get(name)
+                    if not client:
+                        client = await asyncio.get_event_loop().run_in_executor(None, self.client, name)
+
+                    return AccountResult(account=name, result=await func(name, client))
+
+                except asyncio.CancelledError:
+                    raise
+
+                except Exception as e:
+                    return AccountResult(account=name, error=f'{e.__class__.__name__}: {e}')
+
+        tasks = [asyncio.ensure_future(call(name)) for name in (self.names if names is None else names)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,69 @@
+from contextvars import ContextVar, Token
+from typing import Optional, List
+
+from py_okx_async.models import Priorities
+
+current_priority: ContextVar[Optional[int]] = ContextVar('current_priority', default=None)
+
+
+class Priority:
+    """
+    A priority class of all requests made within it, one of Priorities.
+
+    It is used as a context manager, then every request made inside the block and tasks created from it use
+    the priority unless the endpoint has a higher default one, e.g. withdrawals are always critical:
+
+        with Priority(priority=Priorities.Bulk):
+            deposits = await okx_client.asset.backfill_deposit_history(start=start)
+
+    Attributes:
+        priority (int): the priority class, one of Priorities.
+
+    """
+    priority: int
+    __tokens: List[Token]
+
+    def __init__(self, priority: int) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            priority (int): the priority class, one of Priorities.
+
+        """
+        self.priority = priority
+        self.__tokens = []
+
+    @staticmethod
+    def resolve(endpoint: str, priority: Optional[int] = None) -> int:
+        """
+        Get the priority class of a request.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            priority (Optional[int]): the priority class specified for the request. (the one of the current context
+                or normal, but not lower than the default one of the endpoint)
+
+        Returns:
+            int: the priority class.
+
+        """
+        if priority is not None:
+            return priority
+
+        priority = current_priority.get()
+        priority = Priorities.Normal if priority is None else priority
+        if endpoint in Priorities.endpoints_dict:
+            return min(priority, Priorities.endpoints_dict[endpoint])
+
+        return priority
+
+    def __enter__(self) -> 'Priority':
+        self.__tokens.append(current_priority.set(self.priority))
+        return self
+
+    def __exit__(self, *args) -> None:
+        current_priority.reset(self.__tokens.pop())
+
+    def __repr__(self) -> str:
+        return f'Priority(priority={self.priority!r})'
@@ -0,0 +1,273 @@
+import asyncio
+import time
+from typing import Optional, Dict, List
+
+from py_okx_async.models import RateLimit, RateLimits, Priorities
+
+
+class TokenBucket:
+    """
+    A token bucket of an endpoint.
+
+    Attributes:
+        capacity (float): the maximum number of tokens.
+        rate (float): the number of tokens added per second.
+        tokens (float): the current number of tokens.
+        updated (float): the time of the last refill.
+
+    """
+    capacity: float
+    rate: float
+    tokens: float
+    updated: float
+
+    def __init__(self, rate_limit: RateLimit) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            rate_limit (RateLimit): the endpoint rate limit.
+
+        """
+        self.capacity = float(rate_limit.requests)
+        self.rate = rate_limit.requests / rate_limit.period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self) -> None:
+        """
+        Add the tokens accumulated since the last refill.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """
+        Get the time in seconds until a token becomes available.
+
+        Returns:
+            float: the time in seconds.
+
+        """
+        self.refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    The rate limiter that keeps a token bucket for each endpoint of an API key.
+
+    Critical requests take tokens before waiting requests of other classes and bulk requests also take tokens
+    of separate buckets that limit them to a share of the rate.
+
+    Attributes:
+        limits (Dict[str, RateLimit]): rate limits by request paths.
+        buckets (Dict[str, TokenBucket]): token buckets by request paths.
+        bulk_share (float): the share of the rate available to bulk requests.
+        bulk_buckets (Dict[str, TokenBucket]): token buckets of bulk requests by request paths.
+        critical_waiting (Dict[str, int]): the number of waiting critical requests by request paths.
+
+    """
+    limits: Dict[str, RateLimit]
+    buckets: Dict[str, TokenBucket]
+    bulk_share: float
+    bulk_buckets: Dict[str, TokenBucket]
+    critical_waiting: Dict[str, int]
+
+    def __init__(self, limits: Optional[Dict[str, RateLimit]] = None, bulk_share: float = 0.5) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            limits (Optional[Dict[str, RateLimit]]): rate limits by request paths, they override the default ones.
+                (RateLimits.limits_dict)
+            bulk_share (float): the share of the rate available to bulk requests from 0 to 1. (0.5)
+
+        """
+        self.limits = RateLimits.limits_dict.copy()
+        if limits:
+            self.limits.update(limits)
+
+        self.buckets = {}
+        self.bulk_share = bulk_share
+        self.bulk_buckets = {}
+        self.critical_waiting = {}
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """
+        Get a token bucket of the endpoint.
+
+        Args:
+            endpoint (str): the request path without parameters.
+
+        Returns:
+            TokenBucket: the token bucket.
+
+        """
+        if endpoint not in self.buckets:
+            self.buckets[endpoint] = TokenBucket(rate_limit=self.limits.get(endpoint, RateLimits.Default))
+
+        return self.buckets[endpoint]
+
+    def bulk_limit(self, endpoint: str) -> RateLimit:
+        """
+        Get the share of the rate limit of the endpoint available to bulk requests.
+
+        Args:
+            endpoint (str): the request path without parameters.
+
+        Returns:
+            RateLimit: the rate limit of bulk requests.
+
+        """
+        rate_limit = self.limits.get(endpoint, RateLimits.Default)
+        requests = max(1, round(rate_limit.requests * self.bulk_share))
+        return RateLimit(
+            requests=requests, period=requests * rate_limit.period / (rate_limit.requests * self.bulk_share)
+        )
+
+    def bulk_bucket(self, endpoint: str) -> TokenBucket:
+        """
+        Get a token bucket of bulk requests of the endpoint.
+
+        Args:
+            endpoint (str): the request path without parameters.
+
+        Returns:
+            TokenBucket: the token bucket.
+
+        """
+        if endpoint not in self.bulk_buckets:
+            self.bulk_buckets[endpoint] = TokenBucket(rate_limit=self.bulk_limit(endpoint=endpoint))
+
+        return self.bulk_buckets[endpoint]
+
+    def try_acquire(self, endpoint: str, priority: int = Priorities.Normal) -> bool:
+        """
+        Take a token of the endpoint if it is available right now, requests of other classes give way to waiting
+        critical requests and bulk requests also need a token of the bulk bucket.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            priority (int): the priority class of the request, one of Priorities. (normal)
+
+        Returns:
+            bool: True if the token was taken.
+
+        """
+        if priority != Priorities.Critical and self.critical_waiting.get(endpoint):
+            return False
+
+        bucket = self.bucket(endpoint=endpoint)
+        bulk_bucket = None
+        if priority == Priorities.Bulk and self.bulk_share < 1:
+            bulk_bucket = self.bulk_bucket(endpoint=endpoint)
+            if bulk_bucket.delay():
+                return False
+
+        if bucket.delay():
+            return False
+
+        bucket.tokens -= 1
+        if bulk_bucket:
+            bulk_bucket.tokens -= 1
+
+        return True
+
+    async def acquire(self, endpoint: str, priority: int = Priorities.Normal) -> None:
+        """
+        Wait until a token of the endpoint is available and take it.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            priority (int): the priority class of the request, one of Priorities. (normal)
+
+        """
+        bucket = self.bucket(endpoint=endpoint)
+        bulk_bucket = None
+        if priority == Priorities.Bulk and self.bulk_share < 1:
+            bulk_bucket = self.bulk_bucket(endpoint=endpoint)
+
+        if priority == Priorities.Critical:
+            self.critical_waiting[endpoint] = self.critical_waiting.get(endpoint, 0) + 1
+
+        try:
+            while True:
+                delay = bucket.delay()
+                if bulk_bucket:
+                    delay = max(delay, bulk_bucket.delay())
+
+                if priority != Priorities.Critical and self.critical_waiting.get(endpoint):
+                    delay = max(delay, 1 / bucket.rate)
+
+                if not delay:
+                    bucket.tokens -= 1
+                    if bulk_bucket:
+                        bulk_bucket.tokens -= 1
+
+                    return
+
+                await asyncio.sleep(delay)
+
+        finally:
+            if priority == Priorities.Critical:
+                self.critical_waiting[endpoint] -= 1
+
+
+class LatencyTracker:
+    """
+    The tracker of recent response latencies of endpoints.
+
+    Attributes:
+        window (int): the number of recent samples kept for each endpoint.
+        samples (Dict[str, List[float]]): latencies in seconds by request paths.
+
+    """
+    window: int
+    samples: Dict[str, List[float]]
+
+    def __init__(self, window: int = 200) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            window (int): the number of recent samples kept for each endpoint. (200)
+
+        """
+        self.window = window
+        self.samples = {}
+
+    def add(self, endpoint: str, latency: float) -> None:
+        """
+        Add a latency sample.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            latency (float): the latency in seconds.
+
+        """
+        samples = self.samples.setdefault(endpoint, [])
+        samples.append(latency)
+        if len(samples) > self.window:
+            del samples[0]
+
+    def percentile(self, endpoint: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Get a percentile of observed latencies.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            percentile (float): the percentile from 0 to 1, e.g. 0.95.
+            min_samples (int): the number of samples required to calculate the percentile. (1)
+
+        Returns:
+            Optional[float]: the latency in seconds or None if there are not enough samples.
+
+        """
+        samples = self.samples.get(endpoint)
+        if not samples or len(samples) < min_samples:
+            return None
+
+        samples = sorted(samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
@@ -0,0 +1,102 @@
+import asyncio
+import functools
+import importlib.util
+import socket
+import time
+import weakref
+from typing import Dict, List, Tuple, Any
+
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import AsyncResolver, ThreadedResolver
+
+from py_okx_async.models import DNSSettings
+
+
+class Resolver(AbstractResolver):
+    """
+    The resolver that caches resolved hosts for a time in a cache shared by all connectors of an event loop.
+
+    Hosts are resolved by aiodns if it's installed and enabled, otherwise by getaddrinfo in the thread pool. Concurrent
+    lookups of the same host are made once.
+
+    Attributes:
+        resolvers (weakref.WeakKeyDictionary): shared resolvers by settings by event loops.
+        settings (DNSSettings): settings of resolving.
+        resolver (AbstractResolver): the resolver that makes lookups.
+        cache (Dict[Tuple[str, int, int], Tuple[float, List[Dict[str, Any]]]]): expiration monotonic times
+            and resolved addresses by hosts, ports and address families.
+        lookups (Dict[Tuple[str, int, int], asyncio.Future]): running lookups by hosts, ports and address families.
+
+    """
+    resolvers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    settings: DNSSettings
+    resolver: AbstractResolver
+    cache: Dict[Tuple[str, int, int], Tuple[float, List[Dict[str, Any]]]]
+    lookups: Dict[Tuple[str, int, int], asyncio.Future]
+
+    def __init__(self, settings: DNSSettings) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            settings (DNSSettings): settings of resolving.
+
+        """
+        self.settings = settings
+        if settings.async_resolver and importlib.util.find_spec('aiodns'):
+            kwargs = {'nameservers': list(settings.nameservers)} if settings.nameservers else {}
+            self.resolver = AsyncResolver(**kwargs)
+
+        else:
+            self.resolver = ThreadedResolver()
+
+        self.cache = {}
+        self.lookups = {}
+
+    @staticmethod
+    def shared(settings: DNSSettings) -> 'Resolver':
+        """
+        Get the resolver of the current event loop shared by all connectors, create it if there isn't one.
+
+        Args:
+            settings (DNSSettings): settings of resolving.
+
+        Returns:
+            Resolver: the resolver.
+
+        """
+        resolvers = Resolver.resolvers.setdefault(asyncio.get_event_loop(), {})
+        if settings not in resolvers:
+            resolvers[settings] = Resolver(settings=settings)
+
+        return resolvers[settings]
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict[str, Any]]:
+        key = (host, port, family)
+        cached = self.cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        lookup = self.lookups.get(key)
+        if not lookup:
+            lookup = asyncio.ensure_future(self.resolver.resolve(host, port, family))
+            lookup.add_done_callback(functools.partial(self.resolved, key))
+            self.lookups[key] = lookup
+
+        return await asyncio.shield(lookup)
+
+    def resolved(self, key: Tuple[str, int, int], lookup: asyncio.Future) -> None:
+        """
+        Cache addresses of the finished lookup, a failed lookup is retried on the next request.
+
+        Args:
+            key (Tuple[str, int, int]): the host, the port and the address family.
+            lookup (asyncio.Future): the lookup.
+
+        """
+        del self.lookups[key]
+        if not lookup.cancelled() and not lookup.exception():
+            self.cache[key] = (time.monotonic() + self.settings.cache_ttl, lookup.result())
+
+    async def close(self) -> None:
+        await self.resolver.close()
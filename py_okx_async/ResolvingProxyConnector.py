@@ -0,0 +1,53 @@
+from aiohttp.helpers import is_ip_address
+from aiohttp_socks import ProxyConnector
+from python_socks.async_.asyncio.v2 import Proxy
+
+from py_okx_async.Resolver import Resolver
+
+
+class ResolvingProxyConnector(ProxyConnector):
+    """
+    The proxy connector that resolves the host of the proxy with the shared caching resolver instead of getaddrinfo
+    in the thread pool, hosts of requests are still resolved by the proxy.
+
+    The host is resolved for each connection without changing the connector, a proxy with TLS is connected by its host
+    name, so the certificate of the proxy is verified against it. The connection is made the same way as
+    by ProxyConnector of aiohttp-socks 0.8, the version is pinned.
+
+    Attributes:
+        proxy_resolver (Resolver): the resolver of the host of the proxy.
+
+    """
+    proxy_resolver: Resolver
+
+    def __init__(self, proxy_resolver: Resolver, **kwargs) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            proxy_resolver (Resolver): the resolver of the host of the proxy.
+            kwargs: arguments of the ProxyConnector class.
+
+        """
+        super().__init__(**kwargs)
+        self.proxy_resolver = proxy_resolver
+
+    async def _wrap_create_connection(self, protocol_factory, host, port, *, ssl, **kwargs):
+        proxy_host = self._proxy_host
+        if not self._proxy_ssl and not is_ip_address(proxy_host):
+            hosts = await self.proxy_resolver.resolve(host=proxy_host, port=self._proxy_port)
+            proxy_host = hosts[0]['host']
+
+        proxy = Proxy(
+            proxy_type=self._proxy_type, host=proxy_host, port=self._proxy_port, username=self._proxy_username,
+            password=self._proxy_password, rdns=self._rdns, proxy_ssl=self._proxy_ssl
+        )
+        timeout = kwargs.get('timeout')
+        stream = await proxy.connect(
+            dest_host=host, dest_port=port, dest_ssl=ssl, timeout=getattr(timeout, 'sock_connect', None)
+        )
+        transport = stream.writer.transport
+        protocol = protocol_factory()
+        transport.set_protocol(protocol)
+        protocol.connection_made(transport)
+        return transport, protocol
@@ -0,0 +1,333 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import queue
+import threading
+from multiprocessing.managers import SyncManager
+from typing import Optional, Dict, List, Tuple, Any, Iterable, Callable, Awaitable, AsyncIterator
+
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.OKXClientPool import OKXClientPool
+from py_okx_async.RateLimiter import TokenBucket, RateLimiter
+from py_okx_async.models import RateLimit, RateLimits, AccountResult, OKXCredentials, Priorities
+
+
+class TokenBuckets:
+    """
+    Token buckets kept in the manager process and shared by all processes.
+
+    Attributes:
+        buckets (Dict[Tuple[str, str], TokenBucket]): token buckets by namespaces and request paths.
+        lock (threading.Lock): the lock of buckets, the manager serves each process in its own thread.
+
+    """
+    buckets: Dict[Tuple[str, str], TokenBucket]
+    lock: threading.Lock
+
+    def __init__(self) -> None:
+        """
+        Initialize the class.
+        """
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def take(self, namespace: str, endpoint: str, requests: int, period: float) -> float:
+        """
+        Take a token of the endpoint if it is available right now.
+
+        Args:
+            namespace (str): a namespace of buckets, e.g. an API key.
+            endpoint (str): the request path without parameters.
+            requests (int): a number of requests allowed per period.
+            period (float): a period in seconds.
+
+        Returns:
+            float: 0 if the token was taken, otherwise the time in seconds until a token becomes available.
+
+        """
+        with self.lock:
+            key = (namespace, endpoint)
+            if key not in self.buckets:
+                self.buckets[key] = TokenBucket(rate_limit=RateLimit(requests=requests, period=period))
+
+            bucket = self.buckets[key]
+            delay = bucket.delay()
+            if not delay:
+                bucket.tokens -= 1
+
+            return delay
+
+
+class RateLimitManager(SyncManager):
+    """
+    The manager that serves shared token buckets and queues of results over a local socket.
+    """
+    pass
+
+
+RateLimitManager.register('TokenBuckets', TokenBuckets)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    The rate limiter whose token buckets are shared by processes through a RateLimitManager.
+
+    The bulk share of the rate is enforced across processes, critical requests are dispatched first only within
+    a process.
+
+    Attributes:
+        token_buckets (TokenBuckets): a proxy of shared token buckets.
+        namespace (str): the namespace of buckets, e.g. an API key.
+
+    """
+    token_buckets: TokenBuckets
+    namespace: str
+
+    def __init__(
+            self, token_buckets: TokenBuckets, namespace: str = '', limits: Optional[Dict[str, RateLimit]] = None,
+            bulk_share: float = 0.5
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            token_buckets (TokenBuckets): a proxy of shared token buckets.
+            namespace (str): the namespace of buckets, e.g. an API key. ('')
+            limits (Optional[Dict[str, RateLimit]]): rate limits by request paths, they override the default ones.
+                (RateLimits.limits_dict)
+            bulk_share (float): the share of the rate available to bulk requests from 0 to 1. (0.5)
+
+        """
+        super().__init__(limits=limits, bulk_share=bulk_share)
+        self.token_buckets = token_buckets
+        self.namespace = namespace
+
+    def take(self, endpoint: str, bulk: bool = False) -> float:
+        """
+        Take a shared token of the endpoint if it is available right now.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            bulk (bool): take a token of the bulk share of the rate. (False)
+
+        Returns:
+            float: 0 if the token was taken, otherwise the time in seconds until a token becomes available.
+
+        """
+        rate_limit = self.bulk_limit(endpoint=endpoint) if bulk else self.limits.get(endpoint, RateLimits.Default)
+        return self.token_buckets.take(
+            namespace=f'{self.namespace}:bulk' if bulk else self.namespace, endpoint=endpoint,
+            requests=rate_limit.requests, period=rate_limit.period
+        )
+
+    async def async_take(self, endpoint: str, bulk: bool = False) -> float:
+        """
+        Take a shared token of the endpoint in a thread, so the call to the manager doesn't block the event loop.
+
+        Args:
+            endpoint (str): the request path without parameters.
+            bulk (bool): take a token of the bulk share of the rate. (False)
+
+        Returns:
+            float: 0 if the token was taken, otherwise the time in seconds until a token becomes available.
+
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            None, functools.partial(self.take, endpoint=endpoint, bulk=bulk)
+        )
+
+    def try_acquire(self, endpoint: str, priority: int = Priorities.Normal) -> bool:
+        # It is used only by hedges, so the rare blocking call to the manager is acceptable.
+        if priority != Priorities.Critical and self.critical_waiting.get(endpoint):
+            return False
+
+        if priority == Priorities.Bulk and self.bulk_share < 1 and self.take(endpoint=endpoint, bulk=True):
+            return False
+
+        return not self.take(endpoint=endpoint)
+
+    async def acquire(self, endpoint: str, priority: int = Priorities.Normal) -> None:
+        if priority == Priorities.Critical:
+            self.critical_waiting[endpoint] = self.critical_waiting.get(endpoint, 0) + 1
+
+        try:
+            if priority == Priorities.Bulk and self.bulk_share < 1:
+                while True:
+                    delay = await self.async_take(endpoint=endpoint, bulk=True)
+                    if not delay:
+                        break
+
+                    await asyncio.sleep(delay)
+
+            while True:
+                if priority != Priorities.Critical and self.critical_waiting.get(endpoint):
+                    delay = 1 / self.bucket(endpoint=endpoint).rate
+
+                else:
+                    delay = await self.async_take(endpoint=endpoint)
+                    if not delay:
+                        return
+
+                await asyncio.sleep(delay)
+
+        finally:
+            if priority == Priorities.Critical:
+                self.critical_waiting[endpoint] -= 1
+
+
+def run_shard(
+        credentials: Dict[str, OKXCredentials], client_kwargs: Dict[str, Any],
+        func: Callable[[str, OKXClient], Awaitable[Any]], token_buckets: TokenBuckets, results: queue.Queue,
+        concurrency: int
+) -> None:
+    """
+    Process accounts of a shard in a child process and put results to the queue, None is put when the shard is done.
+
+    Args:
+        credentials (Dict[str, OKXCredentials]): API key data by account names of the shard.
+        client_kwargs (Dict[str, Any]): other arguments of clients.
+        func (Callable[[str, OKXClient], Awaitable[Any]]): an async function that takes an account name and its
+            client, it must be defined at the module level.
+        token_buckets (TokenBuckets): a proxy of shared token buckets.
+        results (queue.Queue): a proxy of the queue of results.
+        concurrency (int): the maximum number of accounts processed at the same time.
+
+    """
+    from py_okx_async.public.Public import Public
+
+    limits = client_kwargs.get('rate_limits')
+    bulk_share = client_kwargs.get('bulk_share', 0.5)
+    Public.shared_rate_limiter = SharedRateLimiter(
+        token_buckets=token_buckets, namespace='public', limits=limits, bulk_share=bulk_share
+    )
+    pool = OKXClientPool(
+        credentials=credentials, **client_kwargs,
+        rate_limiter_factory=lambda api_key: SharedRateLimiter(
+            token_buckets=token_buckets, namespace=api_key, limits=limits, bulk_share=bulk_share
+        )
+    )
+
+    async def main() -> None:
+        async for result in pool.map(func=func, concurrency=concurrency):
+            results.put(result)
+
+    try:
+        asyncio.run(main())
+
+    finally:
+        results.put(None)
+
+
+class ShardedRunner:
+    """
+    The runner that spreads accounts of a pool across processes that share rate limits of API keys.
+
+    Accounts of the same API key are processed in the same process, token buckets are kept in a manager process,
+    so all processes together stay within the limits of each API key and of public endpoints.
+
+    Attributes:
+        pool (OKXClientPool): the pool of accounts.
+        processes (int): the number of processes.
+        concurrency (int): the maximum number of accounts processed at the same time by each process.
+
+    """
+    pool: OKXClientPool
+    processes: int
+    concurrency: int
+
+    def __init__(self, pool: OKXClientPool, processes: Optional[int] = None, concurrency: int = 16) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            pool (OKXClientPool): the pool of accounts.
+            processes (Optional[int]): the number of processes. (the number of CPUs)
+            concurrency (int): the maximum number of accounts processed at the same time by each process. (16)
+
+        """
+        self.pool = pool
+        self.processes = processes if processes else os.cpu_count()
+        self.concurrency = concurrency
+
+    def shards(self, names: Iterable[str]) -> List[List[str]]:
+        """
+        Split accounts into shards, accounts of the same API key get into the same shard.
+
+        Args:
+            names (Iterable[str]): account names.
+
+        Returns:
+            List[List[str]]: the non-empty shards.
+
+        """
+        groups = {}
+        for name in names:
+            api_key = self.pool.credentials[name].api_key
+            if api_key not in groups:
+                groups[api_key] = []
+
+            groups[api_key].append(name)
+
+        shards = [[] for _ in range(self.processes)]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(shards, key=len).extend(group)
+
+        return [shard for shard in shards if shard]
+
+    async def run(
+            self, func: Callable[[str, OKXClient], Awaitable[Any]], names: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[AccountResult]:
+        """
+        Call the function for accounts in child processes and yield results as soon as they are ready.
+
+        Args:
+            func (Callable[[str, OKXClient], Awaitable[Any]]): an async function that takes an account name and its
+                client, it and its result must be picklable, so it must be defined at the module level.
+            names (Optional[Iterable[str]]): account names. (absolutely all)
+
+        Returns:
+            AsyncIterator[AccountResult]: results in the order of completion.
+
+        """
+        loop = asyncio.get_event_loop()
+        with RateLimitManager() as manager:
+            token_buckets = manager.TokenBuckets()
+            results = manager.Queue()
+            processes = [
+                multiprocessing.Process(
+                    target=run_shard, daemon=True, kwargs={
+                        'credentials': {name: self.pool.credentials[name] for name in shard},
+                        'client_kwargs': self.pool.client_kwargs, 'func': func, 'token_buckets': token_buckets,
+                        'results': results, 'concurrency': self.concurrency
+                    }
+                )
+                for shard in self.shards(names=self.pool.names if names is None else names)
+            ]
+            for process in processes:
+                process.start()
+
+            try:
+                finished = 0
+                while finished < len(processes):
+                    try:
+                        result = await loop.run_in_executor(None, functools.partial(results.get, timeout=1))
+
+                    except queue.Empty:
+                        if not any(process.is_alive() for process in processes):
+                            break
+
+                        continue
+
+                    if result is None:
+                        finished += 1
+
+                    else:
+                        yield result
+
+            finally:
+                for process in processes:
+                    if process.is_alive():
+                        process.terminate()
+
+                    process.join()
@@ -0,0 +1,134 @@
+import asyncio
+import inspect
+import json
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, List, Tuple, Any
+from urllib.parse import urlsplit
+
+from aiohttp import ClientSession, ClientTimeout
+
+from py_okx_async.models import Methods, TransportRequest, TransportResponse
+
+
+class Transport(ABC):
+    """
+    The base class of transports that send prepared requests and return raw responses.
+
+    A transport is passed to the client and shared by all its sections, so a backend, e.g. an HTTP/2 client, an
+    in-process mock or a replay of a cassette, can be swapped in per client.
+
+    Attributes:
+        network (bool): whether the transport makes real requests, the client checks the entrypoint and the proxy only
+            if it does.
+
+    """
+    network: bool = True
+
+    @abstractmethod
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            request (TransportRequest): the prepared request.
+
+        Returns:
+            TransportResponse: the raw response.
+
+        """
+
+    async def close(self) -> None:
+        """
+        Release resources of the transport.
+        """
+        pass
+
+
+class AiohttpTransport(Transport):
+    """
+    The default transport that sends requests with aiohttp over connectors of requests.
+    """
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        timeout = None
+        if request.timeouts:
+            timeout = ClientTimeout(
+                total=request.timeouts.total, sock_connect=request.timeouts.connect, sock_read=request.timeouts.read
+            )
+
+        async with ClientSession(
+                headers=request.headers, connector=request.connector, connector_owner=request.connector is None
+        ) as session:
+            async with session.request(
+                    method=request.method, url=request.url, data=request.body, timeout=timeout
+            ) as response:
+                return TransportResponse(status_code=response.status, content=await response.read())
+
+
+class MockTransport(Transport):
+    """
+    The in-process transport that answers requests with handlers of request paths without network.
+
+    A handler is a JSON response or a function that takes the request and returns a JSON response or a raw one,
+    the function can be async:
+
+        transport = MockTransport(handlers={
+            (Methods.GET, '/api/v5/asset/balances'): {'code': '0', 'msg': '', 'data': []},
+        })
+        okx_client = OKXClient(credentials=credentials, transport=transport)
+
+    Attributes:
+        handlers (Dict[Tuple[str, str], Any]): handlers by methods and request paths without parameters.
+        latency (float): the delay of each response in seconds.
+        requests (List[TransportRequest]): received requests.
+
+    """
+    network: bool = False
+    handlers: Dict[Tuple[str, str], Any]
+    latency: float
+    requests: List[TransportRequest]
+
+    def __init__(self, handlers: Optional[Dict[Tuple[str, str], Any]] = None, latency: float = 0.0) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            handlers (Optional[Dict[Tuple[str, str], Any]]): handlers by methods and request paths without parameters.
+                (None)
+            latency (float): the delay of each response in seconds. (0.0)
+
+        """
+        self.handlers = handlers if handlers else {}
+        self.latency = latency
+        self.requests = []
+
+    def add(self, path: str, handler: Any, method: str = Methods.GET) -> None:
+        """
+        Add a handler of a request path.
+
+        Args:
+            path (str): the request path without parameters.
+            handler (Any): a JSON response or a function that takes the request and returns a JSON response or a raw
+                one.
+            method (str): the request method is either GET or POST. (GET)
+
+        """
+        self.handlers[(method, path)] = handler
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        self.requests.append(request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        handler = self.handlers.get((request.method, urlsplit(request.url).path))
+        if handler is None:
+            return TransportResponse(status_code=404, content=b'{"code": "404", "msg": "Not Found", "data": []}')
+
+        response = handler(request) if callable(handler) else handler
+        if inspect.isawaitable(response):
+            response = await response
+
+        if isinstance(response, TransportResponse):
+            return response
+
+        return TransportResponse(status_code=200, content=json.dumps(response).encode())
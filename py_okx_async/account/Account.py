@@ -0,0 +1,55 @@
+import asyncio
+from typing import Optional, Dict, Union, Iterable
+
+from pretty_utils.miscellaneous.http import aiohttp_params
+
+from py_okx_async.Base import Base
+from py_okx_async.models import Methods, TradingToken
+from py_okx_async.utils import split_token_symbols
+
+
+class Account(Base):
+    """
+    The class contains functions from the 'account' section.
+
+    Attributes:
+        section (str): a section name.
+
+    """
+    section: str = 'account'
+
+    async def balances(self, token_symbol: Optional[Union[str, Iterable[str]]] = None) -> Dict[str, TradingToken]:
+        """
+        Get a dictionary with tokens and their balances in the trading account.
+
+        Args:
+            token_symbol (Optional[Union[str, Iterable[str]]]): single or multiple token symbols separated with comma,
+                e.g. BTC or BTC,ETH, or an iterable of them. More than 20 token symbols are requested concurrently
+                in chunks. (all tokens with a non-zero balance)
+
+        Returns:
+            Dict[str, TradingToken]: the dictionary with tokens and their balances in the trading account.
+
+        """
+        chunks = split_token_symbols(token_symbol=token_symbol)
+        if len(chunks) > 1:
+            tokens = {}
+            for chunk_tokens in await asyncio.gather(*(self.balances(token_symbol=chunk) for chunk in chunks)):
+                tokens.update(chunk_tokens)
+
+            return tokens
+
+        token_symbol = chunks[0]
+        method = 'balance'
+        body = {
+            'ccy': token_symbol
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body)
+        )
+        tokens = {}
+        for account in response.get('data'):
+            for token in account.get('details'):
+                tokens[token.get('ccy')] = TradingToken(data=token)
+
+        return tokens
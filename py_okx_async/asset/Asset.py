@@ -1,14 +1,28 @@
-from typing import Optional, Dict, Union
+import asyncio
+import time
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from typing import Optional, Dict, Union, AsyncIterator, Iterable, List, Any, TYPE_CHECKING
 
 from pretty_utils.miscellaneous.http import aiohttp_params
 
+from py_okx_async import exceptions
 from py_okx_async.Base import Base
+from py_okx_async.Deadline import Deadline
+from py_okx_async.Priority import Priority
+from py_okx_async.asset.BillExporter import BillExporter
+from py_okx_async.asset.ChangeFeed import DepositFeed, WithdrawalFeed
+from py_okx_async.asset.DepositAddressCache import DepositAddressCache
 from py_okx_async.asset.models import (
     Currency, TransactionType, TransactionTypes, WithdrawalStatus, Withdrawal, WithdrawalToken, TransferType,
-    TransferTypes, Transfer, DepositStatus, Deposit
+    TransferTypes, Transfer, TransferState, DepositStatus, Deposit, DepositAddress, BillType, Bill, WithdrawalCheck,
+    WithdrawalErrors
 )
-from py_okx_async.models import Methods, FundingToken, AccountType, AccountTypes
-from py_okx_async.utils import secs_to_millisecs
+from py_okx_async.models import Methods, FundingToken, AccountType, AccountTypes, Priorities
+from py_okx_async.utils import secs_to_millisecs, split_token_symbols, backfill
+
+if TYPE_CHECKING:
+    from py_okx_async.asset.BalanceTracker import BalanceTracker
+    from py_okx_async.asset.CurrencyCache import CurrencyCache
 
 
 class Asset(Base):
@@ -17,23 +31,57 @@ class Asset(Base):
 
     Attributes:
         section (str): a section name.
+        currency_cache (Optional[CurrencyCache]): a persistent cache of currencies used by withdrawals instead
+            of requesting them.
+        balance_tracker (Optional[BalanceTracker]): a tracker that observes all balances of the funding account
+            whenever they are requested.
+        address_cache (DepositAddressCache): a cache of deposit addresses of the account of the API key that are
+            looked up instead of requesting them, the account name in it is None.
 
     """
     section: str = 'asset'
+    currency_cache: Optional['CurrencyCache'] = None
+    balance_tracker: Optional['BalanceTracker'] = None
+    address_cache: DepositAddressCache
+
+    def __init__(self, address_cache: Optional[DepositAddressCache] = None, **kwargs) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            address_cache (Optional[DepositAddressCache]): a cache of deposit addresses, e.g. a persistent one.
+                (a new one kept in memory)
+            kwargs: arguments of the Base class.
 
-    async def currencies(self, token_symbol: Optional[str] = None) -> Dict[str, Dict[str, Currency]]:
+        """
+        super().__init__(**kwargs)
+        self.address_cache = address_cache if address_cache else DepositAddressCache()
+
+    async def currencies(
+            self, token_symbol: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Dict[str, Currency]]:
         """
         Get a dictionary with all exchange tokens and chains where they can be withdrawn.
 
         Args:
-            token_symbol (Optional[str]): single or multiple token symbols (no more than 20) separated with comma,
-                e.g. BTC or BTC,ETH. (absolutely all)
+            token_symbol (Optional[Union[str, Iterable[str]]]): single or multiple token symbols separated with comma,
+                e.g. BTC or BTC,ETH, or an iterable of them. More than 20 token symbols are requested concurrently
+                in chunks. (absolutely all)
 
         Returns:
             Dict[str, Dict[str, Currency]]: the dictionary with all exchange tokens and chains where they can be
                 withdrawn.
 
         """
+        chunks = split_token_symbols(token_symbol=token_symbol)
+        if len(chunks) > 1:
+            currencies = {}
+            for chunk_currencies in await asyncio.gather(*(self.currencies(token_symbol=chunk) for chunk in chunks)):
+                currencies.update(chunk_currencies)
+
+            return currencies
+
+        token_symbol = chunks[0]
         method = 'currencies'
         body = {
             'ccy': token_symbol
@@ -53,18 +101,28 @@ class Asset(Base):
 
         return currencies
 
-    async def balances(self, token_symbol: Optional[str] = None) -> Dict[str, FundingToken]:
+    async def balances(self, token_symbol: Optional[Union[str, Iterable[str]]] = None) -> Dict[str, FundingToken]:
         """
         Get a dictionary with tokens and their balances in the funding account.
 
         Args:
-            token_symbol (Optional[str]): single or multiple token symbols (no more than 20) separated with comma,
-                e.g. BTC or BTC,ETH. (absolutely all)
+            token_symbol (Optional[Union[str, Iterable[str]]]): single or multiple token symbols separated with comma,
+                e.g. BTC or BTC,ETH, or an iterable of them. More than 20 token symbols are requested concurrently
+                in chunks. (absolutely all)
 
         Returns:
             Dict[str, FundingToken]: the dictionary with tokens and their balances in the funding account.
 
         """
+        chunks = split_token_symbols(token_symbol=token_symbol)
+        if len(chunks) > 1:
+            tokens = {}
+            for chunk_tokens in await asyncio.gather(*(self.balances(token_symbol=chunk) for chunk in chunks)):
+                tokens.update(chunk_tokens)
+
+            return tokens
+
+        token_symbol = chunks[0]
         method = 'balances'
         body = {
             'ccy': token_symbol
@@ -76,16 +134,71 @@ class Asset(Base):
         for token in response.get('data'):
             tokens[token.get('ccy')] = FundingToken(data=token)
 
+        if self.balance_tracker and not token_symbol:
+            self.balance_tracker.observe(account=None, tokens=tokens)
+
         return tokens
 
-    async def deposit_history(
+    async def deposit_address(self, token_symbol: str, refresh: bool = False) -> Dict[str, DepositAddress]:
+        """
+        Get deposit addresses of the token, cached ones are returned without a request.
+
+        Args:
+            token_symbol (str): token symbol, e.g. BTC.
+            refresh (bool): request addresses even if they are cached and update the cache. (False)
+
+        Returns:
+            Dict[str, DepositAddress]: deposit addresses by chains, the selected one if a chain has several addresses.
+
+        """
+        if not refresh and (None, token_symbol) in self.address_cache.tokens:
+            return self.address_cache.chains(token_symbol=token_symbol)
+
+        method = 'deposit-address'
+        body = {
+            'ccy': token_symbol
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=body
+        )
+        addresses = {}
+        for address in response.get('data'):
+            address = DepositAddress(data=address)
+            if address.chain not in addresses or address.selected:
+                addresses[address.chain] = address
+
+        self.address_cache.replace(token_symbol=token_symbol, addresses=addresses.values())
+        return addresses
+
+    async def deposit_addresses(
+            self, token_symbols: Iterable[str], refresh: bool = False
+    ) -> Dict[str, Dict[str, DepositAddress]]:
+        """
+        Concurrently get deposit addresses of tokens within the rate limit, cached ones are returned without requests.
+
+        Args:
+            token_symbols (Iterable[str]): token symbols, e.g. ['BTC', 'ETH'].
+            refresh (bool): request addresses even if they are cached and update the cache. (False)
+
+        Returns:
+            Dict[str, Dict[str, DepositAddress]]: deposit addresses by chains by token symbols.
+
+        """
+        token_symbols = list(dict.fromkeys(token_symbols))
+        addresses = await asyncio.gather(
+            *(self.deposit_address(token_symbol=token_symbol, refresh=refresh) for token_symbol in token_symbols)
+        )
+        return dict(zip(token_symbols, addresses))
+
+    async def raw_deposit_history(
             self, token_symbol: Optional[str] = None, depId: Optional[Union[str, int]] = None,
             fromWdId: Optional[Union[str, int]] = None, txId: Optional[str] = None,
             type: Optional[TransactionType] = None, state: Optional[DepositStatus] = None,
-            after: Optional[int] = None, before: Optional[int] = None, limit: int = 100
-    ) -> Dict[int, Deposit]:
+            after: Optional[int] = None, before: Optional[int] = None, limit: int = 100,
+            deadline: Optional[Deadline] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get a dictionary with deposit IDs and information about deposits.
+        Get a list with raw data of deposits without building instances.
 
         Args:
             token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
@@ -100,9 +213,10 @@ class Asset(Base):
             before (Optional[int]): Pagination of data to return records newer than the requested ts,
                 Unix timestamp format in milliseconds, e.g. 1656633600000. (None)
             limit (int): number of results per request, the maximum is 100. (100)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
 
         Returns:
-            Dict[int, Deposit]: the dictionary with deposit IDs and information about deposits.
+            List[Dict[str, Any]]: the list with raw data of deposits.
 
         """
         method = 'deposit-history'
@@ -117,28 +231,64 @@ class Asset(Base):
         }
 
         if after:
-            body['after'] = secs_to_millisecs(secs=after)
+            body['after'] = await secs_to_millisecs(secs=after)
 
         if before:
-            body['before'] = secs_to_millisecs(secs=before)
+            body['before'] = await secs_to_millisecs(secs=before)
 
         response = await self.make_request(
-            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body)
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body),
+            deadline=deadline
         )
+        return response.get('data')
+
+    async def deposit_history(
+            self, token_symbol: Optional[str] = None, depId: Optional[Union[str, int]] = None,
+            fromWdId: Optional[Union[str, int]] = None, txId: Optional[str] = None,
+            type: Optional[TransactionType] = None, state: Optional[DepositStatus] = None,
+            after: Optional[int] = None, before: Optional[int] = None, limit: int = 100,
+            deadline: Optional[Deadline] = None
+    ) -> Dict[int, Deposit]:
+        """
+        Get a dictionary with deposit IDs and information about deposits.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            depId (Optional[Union[str, int]]): deposit ID. (None)
+            fromWdId (Optional[Union[str, int]]): internal transfer initiator's withdrawal ID. If the deposit comes
+                from internal transfer, this field displays the withdrawal ID of the internal transfer initiator. (None)
+            txId (Optional[str]): hash record of the deposit. (None)
+            type (Optional[TransactionType]): deposit type. (absolutely all)
+            state (Optional[DepositStatus]): status of deposit. (absolutely all)
+            after (Optional[int]): pagination of data to return records earlier than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): Pagination of data to return records newer than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1656633600000. (None)
+            limit (int): number of results per request, the maximum is 100. (100)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
+
+        Returns:
+            Dict[int, Deposit]: the dictionary with deposit IDs and information about deposits.
+
+        """
         deposits = {}
-        for deposit in response.get('data'):
+        for deposit in await self.raw_deposit_history(
+                token_symbol=token_symbol, depId=depId, fromWdId=fromWdId, txId=txId, type=type, state=state,
+                after=after, before=before, limit=limit, deadline=deadline
+        ):
             deposits[int(deposit.get('depId'))] = Deposit(data=deposit)
 
         return deposits
 
-    async def withdrawal_history(
+    async def raw_withdrawal_history(
             self, token_symbol: Optional[str] = None, wdId: Optional[Union[str, int]] = None,
             clientId: Optional[Union[str, int]] = None, txId: Optional[str] = None,
             type: Optional[TransactionType] = None, state: Optional[WithdrawalStatus] = None,
-            after: Optional[int] = None, before: Optional[int] = None, limit: int = 100
-    ) -> Dict[int, Withdrawal]:
+            after: Optional[int] = None, before: Optional[int] = None, limit: int = 100,
+            deadline: Optional[Deadline] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get a dictionary with withdrawal IDs and information about withdrawals.
+        Get a list with raw data of withdrawals without building instances.
 
         Args:
             token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
@@ -152,9 +302,10 @@ class Asset(Base):
             before (Optional[int]): pagination of data to return records newer than the requested ts,
                 Unix timestamp format in milliseconds, e.g. 1656633600000. (None)
             limit (int): number of results per request, the maximum is 100. (100)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
 
         Returns:
-            Dict[int, Withdrawal]: the dictionary with withdrawal IDs and information about withdrawals.
+            List[Dict[str, Any]]: the list with raw data of withdrawals.
 
         """
         method = 'withdrawal-history'
@@ -175,44 +326,577 @@ class Asset(Base):
             body['before'] = await secs_to_millisecs(secs=before)
 
         response = await self.make_request(
-            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body)
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body),
+            deadline=deadline
         )
+        return response.get('data')
+
+    async def withdrawal_history(
+            self, token_symbol: Optional[str] = None, wdId: Optional[Union[str, int]] = None,
+            clientId: Optional[Union[str, int]] = None, txId: Optional[str] = None,
+            type: Optional[TransactionType] = None, state: Optional[WithdrawalStatus] = None,
+            after: Optional[int] = None, before: Optional[int] = None, limit: int = 100,
+            deadline: Optional[Deadline] = None
+    ) -> Dict[int, Withdrawal]:
+        """
+        Get a dictionary with withdrawal IDs and information about withdrawals.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            wdId (Optional[Union[str, int]]): withdrawal ID. (None)
+            clientId (Optional[Union[str, int]]): client-supplied ID. (None)
+            txId (Optional[str]): hash record of the withdrawal. (None)
+            type (Optional[TransactionType]): withdrawal type. (absolutely all)
+            state (Optional[WithdrawalStatus]): status of withdrawal. (absolutely all)
+            after (Optional[int]): pagination of data to return records earlier than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): pagination of data to return records newer than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1656633600000. (None)
+            limit (int): number of results per request, the maximum is 100. (100)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
+
+        Returns:
+            Dict[int, Withdrawal]: the dictionary with withdrawal IDs and information about withdrawals.
+
+        """
         withdrawals = {}
-        for withdrawal in response.get('data'):
+        for withdrawal in await self.raw_withdrawal_history(
+                token_symbol=token_symbol, wdId=wdId, clientId=clientId, txId=txId, type=type, state=state, after=after,
+                before=before, limit=limit, deadline=deadline
+        ):
             withdrawals[int(withdrawal.get('wdId'))] = Withdrawal(data=withdrawal)
 
         return withdrawals
 
+    async def iter_deposit_history(
+            self, token_symbol: Optional[str] = None, type: Optional[TransactionType] = None,
+            state: Optional[DepositStatus] = None, after: Optional[int] = None, before: Optional[int] = None,
+            deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Deposit]:
+        """
+        Iterate over deposits from newer to earlier ones requesting pages one by one.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[TransactionType]): deposit type. (absolutely all)
+            state (Optional[DepositStatus]): status of deposit. (absolutely all)
+            after (Optional[int]): return records earlier than the requested ts, Unix timestamp format
+                in seconds or milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): return records newer than the requested ts, Unix timestamp format
+                in milliseconds, e.g. 1656633600000. (None)
+            deadline (Optional[Deadline]): a deadline of the whole iteration, it stops when the deadline
+                is exceeded. (the one of the current context)
+
+        Returns:
+            AsyncIterator[Deposit]: the iterator of deposits.
+
+        """
+        limit = 100
+        boundary_ids = set()
+        if after:
+            after = await secs_to_millisecs(secs=after)
+
+        while True:
+            try:
+                deposits = await self.deposit_history(
+                    token_symbol=token_symbol, type=type, state=state, after=after, before=before, limit=limit,
+                    deadline=deadline
+                )
+
+            except exceptions.DeadlineExceeded:
+                return
+
+            for depId, deposit in deposits.items():
+                if depId not in boundary_ids:
+                    yield deposit
+
+            # The boundary millisecond is requested again since records sharing it may be cut off by the page.
+            oldest = min((int(deposit.data.get('ts')) for deposit in deposits.values()), default=None)
+            if len(deposits) < limit or (after and oldest + 1 >= after):
+                return
+
+            boundary_ids = {depId for depId, deposit in deposits.items() if int(deposit.data.get('ts')) == oldest}
+            after = oldest + 1
+
+    async def iter_withdrawal_history(
+            self, token_symbol: Optional[str] = None, type: Optional[TransactionType] = None,
+            state: Optional[WithdrawalStatus] = None, after: Optional[int] = None, before: Optional[int] = None,
+            deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Withdrawal]:
+        """
+        Iterate over withdrawals from newer to earlier ones requesting pages one by one.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[TransactionType]): withdrawal type. (absolutely all)
+            state (Optional[WithdrawalStatus]): status of withdrawal. (absolutely all)
+            after (Optional[int]): return records earlier than the requested ts, Unix timestamp format
+                in seconds or milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): return records newer than the requested ts, Unix timestamp format
+                in milliseconds, e.g. 1656633600000. (None)
+            deadline (Optional[Deadline]): a deadline of the whole iteration, it stops when the deadline
+                is exceeded. (the one of the current context)
+
+        Returns:
+            AsyncIterator[Withdrawal]: the iterator of withdrawals.
+
+        """
+        limit = 100
+        boundary_ids = set()
+        if after:
+            after = await secs_to_millisecs(secs=after)
+
+        while True:
+            try:
+                withdrawals = await self.withdrawal_history(
+                    token_symbol=token_symbol, type=type, state=state, after=after, before=before, limit=limit,
+                    deadline=deadline
+                )
+
+            except exceptions.DeadlineExceeded:
+                return
+
+            for wdId, withdrawal in withdrawals.items():
+                if wdId not in boundary_ids:
+                    yield withdrawal
+
+            # The boundary millisecond is requested again since records sharing it may be cut off by the page.
+            oldest = min((int(withdrawal.data.get('ts')) for withdrawal in withdrawals.values()), default=None)
+            if len(withdrawals) < limit or (after and oldest + 1 >= after):
+                return
+
+            boundary_ids = {wdId for wdId, withdrawal in withdrawals.items() if int(withdrawal.data.get('ts')) == oldest}
+            after = oldest + 1
+
+    async def backfill_deposit_history(
+            self, start: int, end: Optional[int] = None, token_symbol: Optional[str] = None,
+            type: Optional[TransactionType] = None, state: Optional[DepositStatus] = None, windows: int = 8
+    ) -> Dict[int, Deposit]:
+        """
+        Get a dictionary with deposit IDs and information about all deposits of a time range by fetching its windows
+        concurrently under the rate limiter, requests are of the bulk priority class.
+
+        Args:
+            start (int): the start of the range, Unix timestamp format in seconds or milliseconds, inclusive.
+            end (Optional[int]): the end of the range, Unix timestamp format in seconds or milliseconds, exclusive.
+                (now)
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[TransactionType]): deposit type. (absolutely all)
+            state (Optional[DepositStatus]): status of deposit. (absolutely all)
+            windows (int): the number of windows the range is initially split into. (8)
+
+        Returns:
+            Dict[int, Deposit]: the dictionary with deposit IDs and information about deposits from newer
+                to earlier ones.
+
+        """
+
+        async def fetch(after: int, before: int) -> Dict[int, Deposit]:
+            return await self.deposit_history(
+                token_symbol=token_symbol, type=type, state=state, after=after, before=before
+            )
+
+        with Priority(priority=Priorities.Bulk):
+            return await backfill(
+                fetch=fetch, start=await secs_to_millisecs(secs=start),
+                end=await secs_to_millisecs(secs=end if end else int(time.time() * 1000)), windows=windows
+            )
+
+    async def backfill_withdrawal_history(
+            self, start: int, end: Optional[int] = None, token_symbol: Optional[str] = None,
+            type: Optional[TransactionType] = None, state: Optional[WithdrawalStatus] = None, windows: int = 8
+    ) -> Dict[int, Withdrawal]:
+        """
+        Get a dictionary with withdrawal IDs and information about all withdrawals of a time range by fetching its
+        windows concurrently under the rate limiter, requests are of the bulk priority class.
+
+        Args:
+            start (int): the start of the range, Unix timestamp format in seconds or milliseconds, inclusive.
+            end (Optional[int]): the end of the range, Unix timestamp format in seconds or milliseconds, exclusive.
+                (now)
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[TransactionType]): withdrawal type. (absolutely all)
+            state (Optional[WithdrawalStatus]): status of withdrawal. (absolutely all)
+            windows (int): the number of windows the range is initially split into. (8)
+
+        Returns:
+            Dict[int, Withdrawal]: the dictionary with withdrawal IDs and information about withdrawals from newer
+                to earlier ones.
+
+        """
+
+        async def fetch(after: int, before: int) -> Dict[int, Withdrawal]:
+            return await self.withdrawal_history(
+                token_symbol=token_symbol, type=type, state=state, after=after, before=before
+            )
+
+        with Priority(priority=Priorities.Bulk):
+            return await backfill(
+                fetch=fetch, start=await secs_to_millisecs(secs=start),
+                end=await secs_to_millisecs(secs=end if end else int(time.time() * 1000)), windows=windows
+            )
+
+    def deposit_feed(
+            self, token_symbol: Optional[str] = None, interval: float = 5.0, start: Optional[int] = None
+    ) -> DepositFeed:
+        """
+        Get a change feed that emits new deposits and state transitions of pending ones as an async iterator.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            interval (float): the interval between polls in seconds. (5.0)
+            start (Optional[int]): deposits newer than this time are emitted as new, Unix timestamp format in seconds
+                or milliseconds. (now)
+
+        Returns:
+            DepositFeed: the change feed.
+
+        """
+        return DepositFeed(asset=self, token_symbol=token_symbol, interval=interval, start=start)
+
+    def withdrawal_feed(
+            self, token_symbol: Optional[str] = None, interval: float = 5.0, start: Optional[int] = None
+    ) -> WithdrawalFeed:
+        """
+        Get a change feed that emits new withdrawals and state transitions of pending ones as an async iterator.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            interval (float): the interval between polls in seconds. (5.0)
+            start (Optional[int]): withdrawals newer than this time are emitted as new, Unix timestamp format
+                in seconds or milliseconds. (now)
+
+        Returns:
+            WithdrawalFeed: the change feed.
+
+        """
+        return WithdrawalFeed(asset=self, token_symbol=token_symbol, interval=interval, start=start)
+
+    async def raw_bills(
+            self, token_symbol: Optional[str] = None, type: Optional[BillType] = None,
+            clientId: Optional[Union[str, int]] = None, after: Optional[int] = None, before: Optional[int] = None,
+            limit: int = 100, deadline: Optional[Deadline] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a list with raw data of bills of the funding account without building instances.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[BillType]): bill type. (absolutely all)
+            clientId (Optional[Union[str, int]]): client-supplied ID for transfer or withdrawal. (None)
+            after (Optional[int]): pagination of data to return records earlier than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): pagination of data to return records newer than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1656633600000. (None)
+            limit (int): number of results per request, the maximum is 100. (100)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
+
+        Returns:
+            List[Dict[str, Any]]: the list with raw data of bills.
+
+        """
+        method = 'bills'
+        body = {
+            'ccy': token_symbol,
+            'type': type.state if type else None,
+            'clientId': str(clientId) if clientId else None,
+            'limit': limit
+        }
+
+        if after:
+            body['after'] = await secs_to_millisecs(secs=after)
+
+        if before:
+            body['before'] = await secs_to_millisecs(secs=before)
+
+        response = await self.make_request(
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body),
+            deadline=deadline
+        )
+        return response.get('data')
+
+    async def bills(
+            self, token_symbol: Optional[str] = None, type: Optional[BillType] = None,
+            clientId: Optional[Union[str, int]] = None, after: Optional[int] = None, before: Optional[int] = None,
+            limit: int = 100, deadline: Optional[Deadline] = None
+    ) -> Dict[int, Bill]:
+        """
+        Get a dictionary with bill IDs and bills of the funding account.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[BillType]): bill type. (absolutely all)
+            clientId (Optional[Union[str, int]]): client-supplied ID for transfer or withdrawal. (None)
+            after (Optional[int]): pagination of data to return records earlier than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): pagination of data to return records newer than the requested ts,
+                Unix timestamp format in milliseconds, e.g. 1656633600000. (None)
+            limit (int): number of results per request, the maximum is 100. (100)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
+
+        Returns:
+            Dict[int, Bill]: the dictionary with bill IDs and bills.
+
+        """
+        bills = {}
+        for bill in await self.raw_bills(
+                token_symbol=token_symbol, type=type, clientId=clientId, after=after, before=before, limit=limit,
+                deadline=deadline
+        ):
+            bills[int(bill.get('billId'))] = Bill(data=bill)
+
+        return bills
+
+    async def iter_bills(
+            self, token_symbol: Optional[str] = None, type: Optional[BillType] = None, after: Optional[int] = None,
+            before: Optional[int] = None, skip_ids: Optional[Iterable[int]] = None, deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Bill]:
+        """
+        Iterate over bills of the funding account from newer to earlier ones requesting pages one by one.
+
+        Args:
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[BillType]): bill type. (absolutely all)
+            after (Optional[int]): return records earlier than the requested ts, Unix timestamp format
+                in seconds or milliseconds, e.g. 1654041600000. (None)
+            before (Optional[int]): return records newer than the requested ts, Unix timestamp format
+                in milliseconds, e.g. 1656633600000. (None)
+            skip_ids (Optional[Iterable[int]]): IDs of bills that were already received, e.g. ones with
+                the ts of 'after' minus 1 when the iteration is resumed. (None)
+            deadline (Optional[Deadline]): a deadline of the whole iteration, it stops when the deadline
+                is exceeded. (the one of the current context)
+
+        Returns:
+            AsyncIterator[Bill]: the iterator of bills.
+
+        """
+        limit = 100
+        boundary_ids = set(skip_ids) if skip_ids else set()
+        if after:
+            after = await secs_to_millisecs(secs=after)
+
+        while True:
+            try:
+                bills = await self.bills(
+                    token_symbol=token_symbol, type=type, after=after, before=before, limit=limit, deadline=deadline
+                )
+
+            except exceptions.DeadlineExceeded:
+                return
+
+            for billId, bill in bills.items():
+                if billId not in boundary_ids:
+                    yield bill
+
+            # The boundary millisecond is requested again since records sharing it may be cut off by the page.
+            oldest = min((int(bill.data.get('ts')) for bill in bills.values()), default=None)
+            if len(bills) < limit or (after and oldest + 1 >= after):
+                return
+
+            boundary_ids = {billId for billId, bill in bills.items() if int(bill.data.get('ts')) == oldest}
+            after = oldest + 1
+
+    async def export_bills(
+            self, path: str, token_symbol: Optional[str] = None, type: Optional[BillType] = None,
+            format: Optional[str] = None, batch_size: int = 1000, cursor_path: Optional[str] = None
+    ) -> int:
+        """
+        Stream bills of the funding account to a file in batches, a crashed export is resumed from the last batch.
+        Requests are of the bulk priority class.
+
+        Args:
+            path (str): the path of a CSV file or a directory of Parquet parts.
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[BillType]): bill type. (absolutely all)
+            format (Optional[str]): one of ExportFormats. (Parquet if pyarrow is installed, otherwise CSV)
+            batch_size (int): the number of bills written at once. (1000)
+            cursor_path (Optional[str]): the path of the cursor file. (the path with the '.cursor' suffix)
+
+        Returns:
+            int: the total number of exported bills.
+
+        """
+        exporter = BillExporter(
+            asset=self, path=path, token_symbol=token_symbol, type=type, format=format, batch_size=batch_size,
+            cursor_path=cursor_path
+        )
+        with Priority(priority=Priorities.Bulk):
+            return await exporter.run()
+
+    async def cached_currencies(
+            self, token_symbol: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Dict[str, Currency]]:
+        """
+        Get currencies from the currency cache if it is set, otherwise request them.
+
+        Args:
+            token_symbol (Optional[Union[str, Iterable[str]]]): token symbols to request if there is no currency cache.
+                (absolutely all)
+
+        Returns:
+            Dict[str, Dict[str, Currency]]: currencies by chains by token symbols.
+
+        """
+        if self.currency_cache:
+            return await self.currency_cache.get()
+
+        return await self.currencies(token_symbol=token_symbol)
+
+    @staticmethod
+    def check_withdrawal(
+            currencies: Dict[str, Dict[str, Currency]], token_symbol: str, amount: Union[float, int, str, Decimal],
+            chain: str, fee: Optional[Union[float, int, str, Decimal]] = None
+    ) -> WithdrawalCheck:
+        """
+        Validate an on-chain withdrawal against currencies without requests, an amount or a fee with more decimals
+        than the withdrawal precision is rejected and its rounded value is returned.
+
+        Args:
+            currencies (Dict[str, Dict[str, Currency]]): currencies by chains by token symbols.
+            token_symbol (str): token symbol, e.g. USDT.
+            amount (Union[float, int, str, Decimal]): withdrawal amount.
+            chain (str): chain name with or without the token symbol, e.g. ERC20 or USDT-ERC20.
+            fee (Optional[Union[float, int, str, Decimal]]): transaction fee. (the withdrawal fee of the chain)
+
+        Returns:
+            WithdrawalCheck: the result of validation with the amount rounded down and the fee rounded up.
+
+        """
+        if chain.startswith(f'{token_symbol}-'):
+            chain = chain[len(token_symbol) + 1:]
+
+        amount = Decimal(str(amount))
+        chains = currencies.get(token_symbol)
+        if not chains:
+            return WithdrawalCheck(
+                token_symbol=token_symbol, chain=chain, amount=amount, fee=None, error=WithdrawalErrors.UnknownToken
+            )
+
+        currency = chains.get(chain)
+        if not currency:
+            return WithdrawalCheck(
+                token_symbol=token_symbol, chain=chain, amount=amount, fee=None, error=WithdrawalErrors.UnknownChain
+            )
+
+        tick = Decimal(1).scaleb(-currency.wdTickSz)
+        rounded_amount = amount.quantize(tick, rounding=ROUND_DOWN)
+        fee = Decimal(str(fee)) if fee is not None else currency.fee
+        rounded_fee = fee.quantize(tick, rounding=ROUND_UP)
+        maxWd = Decimal(str(currency.data.get('maxWd') or 0))
+        error = None
+        if not currency.canWd:
+            error = WithdrawalErrors.Disabled
+
+        elif rounded_amount != amount or rounded_fee != fee:
+            error = WithdrawalErrors.Precision
+
+        elif rounded_amount <= 0 or rounded_amount < Decimal(str(currency.data.get('minWd'))):
+            error = WithdrawalErrors.BelowMinimum
+
+        elif maxWd and rounded_amount > maxWd:
+            error = WithdrawalErrors.AboveMaximum
+
+        elif rounded_fee < currency.fee:
+            error = WithdrawalErrors.LowFee
+
+        return WithdrawalCheck(
+            token_symbol=token_symbol, chain=chain, amount=rounded_amount, fee=rounded_fee, error=error
+        )
+
+    async def validate_withdrawal(
+            self, token_symbol: str, amount: Union[float, int, str, Decimal], chain: str,
+            fee: Optional[Union[float, int, str, Decimal]] = None
+    ) -> WithdrawalCheck:
+        """
+        Validate an on-chain withdrawal against currencies from the currency cache if it is set, otherwise requested
+        ones.
+
+        Args:
+            token_symbol (str): token symbol, e.g. USDT.
+            amount (Union[float, int, str, Decimal]): withdrawal amount.
+            chain (str): chain name with or without the token symbol, e.g. ERC20 or USDT-ERC20.
+            fee (Optional[Union[float, int, str, Decimal]]): transaction fee. (the withdrawal fee of the chain)
+
+        Returns:
+            WithdrawalCheck: the result of validation with the rounded amount and fee.
+
+        """
+        return self.check_withdrawal(
+            currencies=await self.cached_currencies(token_symbol=token_symbol), token_symbol=token_symbol,
+            amount=amount, chain=chain, fee=fee
+        )
+
+    async def validate_withdrawals(self, withdrawals: Iterable[Dict[str, Any]]) -> List[WithdrawalCheck]:
+        """
+        Validate a batch of on-chain withdrawals, e.g. payouts, getting currencies once.
+
+        Args:
+            withdrawals (Iterable[Dict[str, Any]]): arguments of the 'withdrawal' function, only 'token_symbol',
+                'amount', 'chain' and 'fee' are validated.
+
+        Returns:
+            List[WithdrawalCheck]: results of validation in the order of withdrawals.
+
+        """
+        withdrawals = list(withdrawals)
+        if not withdrawals:
+            return []
+
+        currencies = await self.cached_currencies(
+            token_symbol={withdrawal['token_symbol'] for withdrawal in withdrawals}
+        )
+        return [
+            self.check_withdrawal(
+                currencies=currencies, token_symbol=withdrawal['token_symbol'], amount=withdrawal['amount'],
+                chain=withdrawal['chain'], fee=withdrawal.get('fee')
+            ) for withdrawal in withdrawals
+        ]
+
     async def withdrawal(
-            self, token_symbol: str, amount: Union[float, int, str], toAddr: str, chain: str,
-            dest: TransactionType = TransactionTypes.OnChain, fee: Optional[Union[float, int, str]] = None,
-            areaCode: Union[int, str] = None, clientId: Optional[Union[str, int]] = None
+            self, token_symbol: str, amount: Union[float, int, str, Decimal], toAddr: str, chain: str,
+            dest: TransactionType = TransactionTypes.OnChain, fee: Optional[Union[float, int, str, Decimal]] = None,
+            areaCode: Union[int, str] = None, clientId: Optional[Union[str, int]] = None,
+            validate: Optional[bool] = None
     ) -> WithdrawalToken:
         """
         Withdraw funds from the funding account.
 
         Args:
             token_symbol (str): token symbol, e.g. USDT.
-            amount (Union[float, int, str]): withdrawal amount.
+            amount (Union[float, int, str, Decimal]): withdrawal amount.
             toAddr (str): if your dest is 4,toAddr should be a trusted crypto currency address. Some crypto currency
                 addresses are formatted as 'address:tag', e.g. 'ARDOR-7JF3-8F2E-QUWZ-CAN7F:123456'. If your dest is 3,
                 toAddr should be a recipient address which can be email, phone or login account name.
             chain (str): chain name.
             dest (TransactionType): withdrawal method. (on-chain)
-            fee (Union[float, int, str]): transaction fee. (minimal, parsed using the 'currencies' function)
+            fee (Optional[Union[float, int, str, Decimal]]): transaction fee. (the withdrawal fee of the chain, taken
+                from the currency cache if it is set or parsed using the 'currencies' function)
             areaCode (Optional[str]): area code for the phone number. If toAddr is a phone number, this parameter is
                 required. (None)
             clientId (Optional[Union[str, int]]): Client-supplied ID. A combination of case-sensitive alphanumerics,
                 all numbers, or all letters of up to 32 characters. (None)
+            validate (Optional[bool]): validate an on-chain withdrawal against currencies before sending, an invalid
+                one, e.g. with an amount that has more decimals than the withdrawal precision, raises
+                the InvalidWithdrawal exception without a withdrawal request. The amount and the fee are sent
+                as they are. Without the currency cache currencies are requested first. (only if the currency cache
+                is set)
 
         Returns:
             WithdrawalToken: an instance with information about the withdrawal.
 
         """
         method = 'withdrawal'
-        if not fee:
-            currency = await self.currencies(token_symbol=token_symbol)
-            fee = currency[token_symbol][chain].minFee
+        if validate is None:
+            validate = self.currency_cache is not None
+
+        validate = validate and dest == TransactionTypes.OnChain
+        if not fee or validate:
+            check = await self.validate_withdrawal(token_symbol=token_symbol, amount=amount, chain=chain, fee=fee)
+            if check.fee is None or (validate and not check.valid):
+                raise exceptions.InvalidWithdrawal(token_symbol=token_symbol, chain=chain, reason=check.error)
+
+            if not fee:
+                fee = check.fee
 
         body = {
             'ccy': token_symbol,
@@ -279,8 +963,8 @@ class Asset(Base):
         body = {
             'ccy': token_symbol,
             'amt': str(amount),
-            'from_': from_.state,
-            'to_': to_.state,
+            'from': from_.state,
+            'to': to_.state,
             'subAcct': subAcct,
             'type': type.state,
             'loanTrans': loanTrans,
@@ -291,3 +975,33 @@ class Asset(Base):
             method=Methods.POST, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body)
         )
         return Transfer(data=response.get('data')[0])
+
+    async def transfer_state(
+            self, transId: Optional[Union[str, int]] = None, clientId: Optional[Union[str, int]] = None,
+            type: Optional[TransferType] = None
+    ) -> Optional[TransferState]:
+        """
+        Get the state of a transfer, e.g. to check if a transfer whose response was lost went through before retrying
+        it with the same client-supplied ID.
+
+        Args:
+            transId (Optional[Union[str, int]]): transfer ID. Either transId or clientId is required. (None)
+            clientId (Optional[Union[str, int]]): client-supplied ID. (None)
+            type (Optional[TransferType]): transfer type, it is required to query transfers between sub-accounts
+                and the master account. (within account)
+
+        Returns:
+            Optional[TransferState]: an instance with the transfer state, None if the transfer isn't found.
+
+        """
+        method = 'transfer-state'
+        body = {
+            'transId': str(transId) if transId else None,
+            'clientId': str(clientId) if clientId else None,
+            'type': type.state if type else None
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body)
+        )
+        if response.get('data'):
+            return TransferState(data=response.get('data')[0])
@@ -0,0 +1,147 @@
+import asyncio
+from typing import Optional, Dict, List, Tuple, Iterable, TYPE_CHECKING
+
+from py_okx_async.models import BalanceDelta, FundingToken
+
+if TYPE_CHECKING:
+    from py_okx_async.OKXClient import OKXClient
+
+
+class BalanceTracker:
+    """
+    The tracker that keeps the last funding balances of the master account and sub-accounts and emits only changes.
+
+    The tracker of a client is created on the first access to its balance_tracker property, after that all balances
+    of the funding account requested by the client, e.g. by treasury_snapshot or sweep, are observed by it, and
+    changes are reported by the next refresh of the account even if they were seen by another request:
+
+        deltas = await okx_client.balance_tracker.refresh_all(subaccounts=['sub1', 'sub2'])
+
+    Attributes:
+        okx_client (OKXClient): a client.
+        snapshots (Dict[Optional[str], Dict[str, Tuple[str, str, str]]]): raw balance, available and frozen balances
+            by token symbols by sub-account names, None is the master account.
+        unreported (Dict[Optional[str], Dict[str, BalanceDelta]]): observed changes that weren't reported yet
+            by token symbols by sub-account names.
+
+    """
+    okx_client: 'OKXClient'
+    snapshots: Dict[Optional[str], Dict[str, Tuple[str, str, str]]]
+    unreported: Dict[Optional[str], Dict[str, BalanceDelta]]
+
+    def __init__(self, okx_client: 'OKXClient') -> None:
+        """
+        Initialize the class.
+
+        Args:
+            okx_client (OKXClient): a client.
+
+        """
+        self.okx_client = okx_client
+        self.snapshots = {}
+        self.unreported = {}
+
+    def update(self, account: Optional[str], tokens: Dict[str, FundingToken]) -> List[BalanceDelta]:
+        """
+        Replace the snapshot of the account and get changes.
+
+        Args:
+            account (Optional[str]): sub-account name, None for the master account.
+            tokens (Dict[str, FundingToken]): current balances of the account.
+
+        Returns:
+            List[BalanceDelta]: balances of tokens that changed, disappeared tokens have zero balances.
+
+        """
+        previous = self.snapshots.get(account, {})
+        snapshot = {
+            token_symbol: (token.data.get('bal'), token.data.get('availBal'), token.data.get('frozenBal'))
+            for token_symbol, token in tokens.items()
+        }
+        self.snapshots[account] = snapshot
+        deltas = []
+        for token_symbol, balances in snapshot.items():
+            old_balances = previous.get(token_symbol)
+            if old_balances != balances:
+                deltas.append(BalanceDelta(
+                    account=account, token_symbol=token_symbol, bal=float(balances[0]), availBal=float(balances[1]),
+                    frozenBal=float(balances[2]),
+                    previous=tuple(float(balance) for balance in old_balances) if old_balances else None
+                ))
+
+        for token_symbol in previous.keys() - snapshot.keys():
+            deltas.append(BalanceDelta(
+                account=account, token_symbol=token_symbol, bal=0.0, availBal=0.0, frozenBal=0.0,
+                previous=tuple(float(balance) for balance in previous[token_symbol])
+            ))
+
+        return deltas
+
+    def observe(self, account: Optional[str], tokens: Dict[str, FundingToken]) -> None:
+        """
+        Replace the snapshot of the account and keep changes until the next refresh of the account, several changes
+        of a token are merged into one.
+
+        Args:
+            account (Optional[str]): sub-account name, None for the master account.
+            tokens (Dict[str, FundingToken]): all current balances of the account.
+
+        """
+        unreported = self.unreported.setdefault(account, {})
+        for delta in self.update(account=account, tokens=tokens):
+            earlier = unreported.pop(delta.token_symbol, None)
+            if earlier:
+                delta.previous = earlier.previous
+
+            # A token that got back its reported balances or appeared and disappeared since then hasn't changed.
+            if delta.previous == (delta.bal, delta.availBal, delta.frozenBal) or (
+                    delta.previous is None and delta.token_symbol not in self.snapshots[account]
+            ):
+                continue
+
+            unreported[delta.token_symbol] = delta
+
+    async def refresh(self, account: Optional[str] = None) -> List[BalanceDelta]:
+        """
+        Request balances of an account and get changes since the last refresh.
+
+        Args:
+            account (Optional[str]): sub-account name. (the master account)
+
+        Returns:
+            List[BalanceDelta]: balances of tokens that changed.
+
+        """
+        if account:
+            tokens = await self.okx_client.subaccount.asset_balances(subAcct=account)
+
+        else:
+            tokens = await self.okx_client.asset.balances()
+
+        # Balances requested by the client are already observed, observing them again finds no changes.
+        self.observe(account=account, tokens=tokens)
+        return list(self.unreported.pop(account, {}).values())
+
+    async def refresh_all(
+            self, subaccounts: Optional[Iterable[str]] = None, master: bool = True
+    ) -> List[BalanceDelta]:
+        """
+        Concurrently request balances of the master account and sub-accounts and get changes since the last refresh.
+
+        Args:
+            subaccounts (Optional[Iterable[str]]): sub-account names. (all tracked ones)
+            master (bool): whether to refresh the master account. (True)
+
+        Returns:
+            List[BalanceDelta]: balances of tokens that changed.
+
+        """
+        accounts = [None] if master else []
+        accounts += list(subaccounts) if subaccounts is not None else [
+            account for account in self.snapshots if account
+        ]
+        deltas = []
+        for account_deltas in await asyncio.gather(*(self.refresh(account=account) for account in accounts)):
+            deltas += account_deltas
+
+        return deltas
@@ -0,0 +1,156 @@
+import csv
+import importlib.util
+import json
+import os
+from typing import Optional, Dict, List, Any, TYPE_CHECKING
+
+from py_okx_async.asset.models import Bill, BillType, ExportFormats
+
+if TYPE_CHECKING:
+    from py_okx_async.asset.Asset import Asset
+
+
+class BillExporter:
+    """
+    The exporter that streams bills of the funding account to a file in bounded batches.
+
+    Bills are written from newer to earlier ones. After each batch the cursor file is updated, so a crashed export is
+    resumed from the last written batch and memory use doesn't depend on the length of the history.
+
+    Attributes:
+        asset (Asset): an instance of the 'asset' section.
+        path (str): the path of a CSV file or a directory of Parquet parts.
+        token_symbol (Optional[str]): token symbol, e.g. BTC.
+        type (Optional[BillType]): bill type.
+        format (str): one of ExportFormats.
+        batch_size (int): the number of bills written at once.
+        cursor_path (str): the path of the cursor file.
+        cursor (Dict[str, Any]): the ts of the oldest written bill in milliseconds, IDs of written bills with it,
+            the size of the written CSV file, the number of Parquet parts and the number of written bills.
+        columns (List[str]): exported fields of bills.
+
+    """
+    asset: 'Asset'
+    path: str
+    token_symbol: Optional[str]
+    type: Optional[BillType]
+    format: str
+    batch_size: int
+    cursor_path: str
+    cursor: Dict[str, Any]
+    columns: List[str] = ['billId', 'ccy', 'clientId', 'balChg', 'bal', 'type', 'ts']
+
+    def __init__(
+            self, asset: 'Asset', path: str, token_symbol: Optional[str] = None, type: Optional[BillType] = None,
+            format: Optional[str] = None, batch_size: int = 1000, cursor_path: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the class and load the cursor if it exists.
+
+        Args:
+            asset (Asset): an instance of the 'asset' section.
+            path (str): the path of a CSV file or a directory of Parquet parts.
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            type (Optional[BillType]): bill type. (absolutely all)
+            format (Optional[str]): one of ExportFormats. (Parquet if pyarrow is installed, otherwise CSV)
+            batch_size (int): the number of bills written at once. (1000)
+            cursor_path (Optional[str]): the path of the cursor file. (the path with the '.cursor' suffix)
+
+        """
+        if not format:
+            format = ExportFormats.Parquet if importlib.util.find_spec('pyarrow') else ExportFormats.CSV
+
+        self.asset = asset
+        self.path = path
+        self.token_symbol = token_symbol
+        self.type = type
+        self.format = format
+        self.batch_size = batch_size
+        self.cursor_path = cursor_path if cursor_path else f'{path.rstrip(os.sep)}.cursor'
+        self.cursor = {'after': None, 'ids': [], 'offset': 0, 'parts': 0, 'count': 0}
+        if os.path.exists(self.cursor_path):
+            with open(self.cursor_path) as file:
+                self.cursor.update(json.load(file))
+
+    async def run(self) -> int:
+        """
+        Export bills that are earlier than the cursor.
+
+        Returns:
+            int: the total number of exported bills including ones exported before the resume.
+
+        """
+        self.prepare()
+        batch = []
+        async for bill in self.asset.iter_bills(
+                token_symbol=self.token_symbol, type=self.type,
+                after=self.cursor['after'] + 1 if self.cursor['after'] else None, skip_ids=self.cursor['ids']
+        ):
+            batch.append(bill)
+            if len(batch) >= self.batch_size:
+                self.write(batch=batch)
+                batch = []
+
+        if batch:
+            self.write(batch=batch)
+
+        return self.cursor['count']
+
+    def prepare(self) -> None:
+        """
+        Remove data written after the last saved cursor and write the CSV header if the export starts.
+        """
+        if self.format == ExportFormats.Parquet:
+            os.makedirs(self.path, exist_ok=True)
+            for name in os.listdir(self.path):
+                if name.startswith('part-') and int(name[5:10]) >= self.cursor['parts']:
+                    os.remove(os.path.join(self.path, name))
+
+            return
+
+        if not self.cursor['offset']:
+            with open(self.path, 'w', newline='') as file:
+                csv.writer(file).writerow(self.columns)
+                self.cursor['offset'] = file.tell()
+
+            return
+
+        with open(self.path, 'r+') as file:
+            file.truncate(self.cursor['offset'])
+
+    def write(self, batch: List[Bill]) -> None:
+        """
+        Write a batch of bills and save the cursor.
+
+        Args:
+            batch (List[Bill]): bills from newer to earlier ones.
+
+        """
+        rows = [[bill.data.get(column, '') for column in self.columns] for bill in batch]
+        if self.format == ExportFormats.Parquet:
+            import pyarrow
+            import pyarrow.parquet
+
+            table = pyarrow.table({
+                column: [int(row[i]) if column == 'ts' else row[i] for row in rows]
+                for i, column in enumerate(self.columns)
+            })
+            part_path = os.path.join(self.path, f'part-{self.cursor["parts"]:05}.parquet')
+            pyarrow.parquet.write_table(table, f'{part_path}.tmp')
+            os.replace(f'{part_path}.tmp', part_path)
+            self.cursor['parts'] += 1
+
+        else:
+            with open(self.path, 'a', newline='') as file:
+                csv.writer(file).writerows(rows)
+                self.cursor['offset'] = file.tell()
+
+        oldest = int(batch[-1].data.get('ts'))
+        ids = self.cursor['ids'] if oldest == self.cursor['after'] else []
+        self.cursor['ids'] = ids + [bill.billId for bill in batch if int(bill.data.get('ts')) == oldest]
+        self.cursor['after'] = oldest
+        self.cursor['count'] += len(batch)
+        with open(f'{self.cursor_path}.tmp', 'w') as file:
+            json.dump(self.cursor, file)
+
+        os.replace(f'{self.cursor_path}.tmp', self.cursor_path)
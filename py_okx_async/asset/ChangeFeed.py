@@ -0,0 +1,214 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, List, Any, Set, AsyncIterator, Union, TYPE_CHECKING
+
+from py_okx_async.asset.models import (
+    FeedEvent, FeedEventTypes, Deposit, DepositStatuses, Withdrawal, WithdrawalStatuses
+)
+from py_okx_async.utils import secs_to_millisecs
+
+if TYPE_CHECKING:
+    from py_okx_async.asset.Asset import Asset
+
+
+class ChangeFeed(ABC):
+    """
+    The base class of change feeds that poll only records newer than the cursor and re-poll only pending records.
+
+    Attributes:
+        asset (Asset): an instance of the 'asset' section.
+        token_symbol (Optional[str]): token symbol, e.g. BTC.
+        interval (float): the interval between polls in seconds.
+        cursor (int): the newest seen ts, Unix timestamp format in milliseconds.
+        cursor_ids (Set[str]): IDs of seen records with the cursor ts.
+        pending (Dict[str, str]): states of records that can still change by IDs.
+        id_key (str): the name of the ID field.
+        statuses_dict (Dict[str, Any]): statuses by states.
+        pending_states (tuple): states of records that can still change.
+        limit (int): the number of records in a full page.
+
+    """
+    asset: 'Asset'
+    token_symbol: Optional[str]
+    interval: float
+    cursor: int
+    cursor_ids: Set[str]
+    pending: Dict[str, str]
+    id_key: str
+    statuses_dict: Dict[str, Any]
+    pending_states: tuple
+    limit: int = 100
+
+    def __init__(
+            self, asset: 'Asset', token_symbol: Optional[str] = None, interval: float = 5.0,
+            start: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            asset (Asset): an instance of the 'asset' section.
+            token_symbol (Optional[str]): token symbol, e.g. BTC. (absolutely all)
+            interval (float): the interval between polls in seconds. (5.0)
+            start (Optional[int]): records newer than this time are emitted as new, Unix timestamp format in seconds
+                or milliseconds. (now)
+
+        """
+        self.asset = asset
+        self.token_symbol = token_symbol
+        self.interval = interval
+        self.cursor = int(time.time() * 1000) if start is None else start
+        self.cursor_ids = set()
+        self.pending = {}
+
+    @abstractmethod
+    async def fetch(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Get raw data of records.
+
+        Args:
+            kwargs: arguments of the history function.
+
+        Returns:
+            List[Dict[str, Any]]: the raw data of records.
+
+        """
+
+    @abstractmethod
+    def build(self, data: Dict[str, Any]) -> Union[Deposit, Withdrawal]:
+        """
+        Build an instance of a record.
+
+        Args:
+            data (Dict[str, Any]): the raw data of a record.
+
+        Returns:
+            Union[Deposit, Withdrawal]: the instance.
+
+        """
+
+    async def poll_new(self) -> List[FeedEvent]:
+        """
+        Request records newer than the cursor and move the cursor.
+
+        Returns:
+            List[FeedEvent]: events of new records from earlier to newer ones.
+
+        """
+        self.cursor = await secs_to_millisecs(secs=self.cursor)
+        records = {}
+        after = None
+        while True:
+            page = await self.fetch(token_symbol=self.token_symbol, before=self.cursor - 1, after=after)
+            for data in page:
+                if int(data.get('ts')) != self.cursor or data.get(self.id_key) not in self.cursor_ids:
+                    records[data.get(self.id_key)] = data
+
+            # The boundary millisecond is requested again since records sharing it may be cut off by the page.
+            oldest = min((int(data.get('ts')) for data in page), default=None)
+            if len(page) < self.limit or (after and oldest + 1 >= after):
+                break
+
+            after = oldest + 1
+
+        events = []
+        for data in sorted(records.values(), key=lambda data: int(data.get('ts'))):
+            ts = int(data.get('ts'))
+            if ts > self.cursor:
+                self.cursor = ts
+                self.cursor_ids = set()
+
+            if ts == self.cursor:
+                self.cursor_ids.add(data.get(self.id_key))
+
+            if data.get('state') in self.pending_states:
+                self.pending[data.get(self.id_key)] = data.get('state')
+
+            events.append(FeedEvent(type=FeedEventTypes.New, record=self.build(data=data)))
+
+        return events
+
+    async def poll_pending(self, ids: List[str]) -> List[FeedEvent]:
+        """
+        Re-request pending records and find state transitions.
+
+        Args:
+            ids (List[str]): IDs of pending records.
+
+        Returns:
+            List[FeedEvent]: events of state transitions.
+
+        """
+        events = []
+        for page in await asyncio.gather(*(self.fetch(**{self.id_key: record_id}) for record_id in ids)):
+            for data in page:
+                record_id = data.get(self.id_key)
+                previous_state = self.pending.get(record_id)
+                if previous_state is None or data.get('state') == previous_state:
+                    continue
+
+                if data.get('state') in self.pending_states:
+                    self.pending[record_id] = data.get('state')
+
+                else:
+                    del self.pending[record_id]
+
+                events.append(FeedEvent(
+                    type=FeedEventTypes.StateChanged, record=self.build(data=data),
+                    previous_state=self.statuses_dict.get(previous_state)
+                ))
+
+        return events
+
+    async def poll(self) -> List[FeedEvent]:
+        """
+        Poll new records and state transitions of pending ones once.
+
+        Returns:
+            List[FeedEvent]: events of new records and state transitions.
+
+        """
+        pending_ids = list(self.pending)
+        events = await self.poll_new()
+        if pending_ids:
+            events += await self.poll_pending(ids=pending_ids)
+
+        return events
+
+    async def __aiter__(self) -> AsyncIterator[FeedEvent]:
+        while True:
+            for event in await self.poll():
+                yield event
+
+            await asyncio.sleep(self.interval)
+
+
+class DepositFeed(ChangeFeed):
+    """
+    The change feed of new deposits and their state transitions.
+    """
+    id_key: str = 'depId'
+    statuses_dict: Dict[str, Any] = DepositStatuses.statuses_dict
+    pending_states: tuple = DepositStatuses.pending_states
+
+    async def fetch(self, **kwargs) -> List[Dict[str, Any]]:
+        return await self.asset.raw_deposit_history(**kwargs)
+
+    def build(self, data: Dict[str, Any]) -> Deposit:
+        return Deposit(data=data)
+
+
+class WithdrawalFeed(ChangeFeed):
+    """
+    The change feed of new withdrawals and their state transitions.
+    """
+    id_key: str = 'wdId'
+    statuses_dict: Dict[str, Any] = WithdrawalStatuses.statuses_dict
+    pending_states: tuple = WithdrawalStatuses.pending_states
+
+    async def fetch(self, **kwargs) -> List[Dict[str, Any]]:
+        return await self.asset.raw_withdrawal_history(**kwargs)
+
+    def build(self, data: Dict[str, Any]) -> Withdrawal:
+        return Withdrawal(data=data)
@@ -0,0 +1,168 @@
+import asyncio
+import marshal
+import os
+import time
+from typing import Optional, Dict, List, Any, TYPE_CHECKING
+
+from py_okx_async.asset.models import Currency
+
+if TYPE_CHECKING:
+    from py_okx_async.asset.Asset import Asset
+
+
+class CurrencyCache:
+    """
+    The persistent cache of currencies that is served at startup without a request and refreshed in the background.
+
+    The currency table is saved in the marshal format with the time of the request and the fingerprint of the API key,
+    so it is loaded without parsing JSON and a file of another account is ignored:
+
+        okx_client.asset.currency_cache = CurrencyCache(asset=okx_client.asset, path='currencies.bin')
+        currencies = await okx_client.asset.currency_cache.get()
+
+    Attributes:
+        version (int): the version of the file format.
+        asset (Asset): an instance of the 'asset' section.
+        path (str): the path of the cache file.
+        max_age (float): the age in seconds after which currencies are refreshed in the background.
+        currencies (Optional[Dict[str, Dict[str, Currency]]]): currencies by chains by token symbols.
+        ts (float): the time of the request of currencies, Unix timestamp format in seconds.
+        validated (bool): whether currencies were requested by this process.
+        refresh_task (Optional[asyncio.Task]): the running background refresh.
+
+    """
+    version: int = 1
+    asset: 'Asset'
+    path: str
+    max_age: float
+    currencies: Optional[Dict[str, Dict[str, Currency]]]
+    ts: float
+    validated: bool
+    refresh_task: Optional[asyncio.Task]
+
+    def __init__(self, asset: 'Asset', path: str, max_age: float = 3600) -> None:
+        """
+        Initialize the class and load the cache file if it exists.
+
+        Args:
+            asset (Asset): an instance of the 'asset' section.
+            path (str): the path of the cache file.
+            max_age (float): the age in seconds after which currencies are refreshed in the background. (3600)
+
+        """
+        self.asset = asset
+        self.path = path
+        self.max_age = max_age
+        self.currencies = None
+        self.ts = 0.0
+        self.validated = False
+        self.refresh_task = None
+        self.load()
+
+    @staticmethod
+    def build(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Currency]]:
+        """
+        Build currencies from raw data.
+
+        Args:
+            data (List[Dict[str, Any]]): the raw data of currencies.
+
+        Returns:
+            Dict[str, Dict[str, Currency]]: currencies by chains by token symbols.
+
+        """
+        currencies = {}
+        for currency in data:
+            currency = Currency(data=currency)
+            if currency.token_symbol not in currencies:
+                currencies[currency.token_symbol] = {}
+
+            if currency.chain not in currencies[currency.token_symbol]:
+                currencies[currency.token_symbol][currency.chain] = currency
+
+        return currencies
+
+    def load(self) -> bool:
+        """
+        Load the cache file if it exists, has the current format and belongs to the API key.
+
+        Returns:
+            bool: True if currencies were loaded.
+
+        """
+        try:
+            with open(self.path, 'rb') as file:
+                version, ts, fingerprint, data = marshal.load(file)
+
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+
+        if version != self.version or fingerprint != self.asset.fingerprint:
+            return False
+
+        self.currencies = self.build(data=data)
+        self.ts = ts
+        return True
+
+    def save(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Atomically write the raw data of currencies to the cache file.
+
+        Args:
+            data (List[Dict[str, Any]]): the raw data of currencies.
+
+        """
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'wb') as file:
+            marshal.dump((self.version, self.ts, self.asset.fingerprint, data), file)
+
+        os.replace(temp_path, self.path)
+
+    async def refresh(self) -> Dict[str, Dict[str, Currency]]:
+        """
+        Request currencies and save them to the cache file.
+
+        Returns:
+            Dict[str, Dict[str, Currency]]: currencies by chains by token symbols.
+
+        """
+        currencies = await self.asset.currencies()
+        self.ts = time.time()
+        self.save(data=[currency.data for chains in currencies.values() for currency in chains.values()])
+        self.currencies = currencies
+        self.validated = True
+        return currencies
+
+    async def get(self) -> Dict[str, Dict[str, Currency]]:
+        """
+        Get currencies, request them only if there is no cache.
+
+        Cached currencies are returned immediately, if they were loaded from the file or are older than the maximum
+        age, they are refreshed in the background.
+
+        Returns:
+            Dict[str, Dict[str, Currency]]: currencies by chains by token symbols.
+
+        """
+        stale = not self.validated or time.time() - self.ts > self.max_age
+        if stale and not self.refresh_task:
+            self.refresh_task = asyncio.ensure_future(self.refresh())
+            self.refresh_task.add_done_callback(self.refreshed)
+
+        if self.currencies is None:
+            return await asyncio.shield(self.refresh_task)
+
+        return self.currencies
+
+    def refreshed(self, task: asyncio.Task) -> None:
+        """
+        Forget the finished background refresh, a failed one is retried on the next access.
+
+        Args:
+            task (asyncio.Task): the refresh task.
+
+        """
+        if not task.cancelled():
+            task.exception()
+
+        self.refresh_task = None
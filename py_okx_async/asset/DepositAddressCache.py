@@ -0,0 +1,168 @@
+import asyncio
+import json
+import os
+from typing import Optional, Dict, List, Tuple, Iterable, TYPE_CHECKING
+
+from py_okx_async.asset.models import DepositAddress
+
+if TYPE_CHECKING:
+    from py_okx_async.OKXClient import OKXClient
+
+
+class DepositAddressCache:
+    """
+    The persistent cache of deposit addresses indexed by accounts, token symbols and chains.
+
+    Deposit addresses rarely change, so they are requested once, saved to a JSON file and then looked up locally.
+
+    Attributes:
+        path (Optional[str]): the path of the JSON file, the cache is kept only in memory if it isn't specified.
+        addresses (Dict[Tuple[Optional[str], str, str], DepositAddress]): deposit addresses by account names,
+            token symbols and chains, None is the master account.
+        tokens (Dict[Tuple[Optional[str], str], List[str]]): chains by account names and token symbols.
+
+    """
+    path: Optional[str]
+    addresses: Dict[Tuple[Optional[str], str, str], DepositAddress]
+    tokens: Dict[Tuple[Optional[str], str], List[str]]
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Initialize the class and load the cache from the file if it exists.
+
+        Args:
+            path (Optional[str]): the path of the JSON file. (the cache is kept only in memory)
+
+        """
+        self.path = path
+        self.addresses = {}
+        self.tokens = {}
+        if path and os.path.exists(path):
+            with open(path) as file:
+                for record in json.load(file):
+                    self.add(account=record.get('account'), address=DepositAddress(data=record.get('data')))
+
+    def add(self, account: Optional[str], address: DepositAddress) -> None:
+        """
+        Add an address to the cache.
+
+        Args:
+            account (Optional[str]): account name, None for the master account.
+            address (DepositAddress): the deposit address.
+
+        """
+        key = (account, address.token_symbol)
+        if key not in self.tokens:
+            self.tokens[key] = []
+
+        if address.chain not in self.tokens[key]:
+            self.tokens[key].append(address.chain)
+
+        self.addresses[(account, address.token_symbol, address.chain)] = address
+
+    def replace(
+            self, token_symbol: str, addresses: Iterable[DepositAddress], account: Optional[str] = None,
+            save: bool = True
+    ) -> None:
+        """
+        Replace all cached addresses of the token with requested ones.
+
+        Args:
+            token_symbol (str): token symbol, e.g. USDT.
+            addresses (Iterable[DepositAddress]): the requested deposit addresses.
+            account (Optional[str]): account name. (the master account)
+            save (bool): save the cache to the file. (True)
+
+        """
+        for chain in self.tokens.get((account, token_symbol), []):
+            del self.addresses[(account, token_symbol, chain)]
+
+        self.tokens[(account, token_symbol)] = []
+        for address in addresses:
+            self.add(account=account, address=address)
+
+        if save:
+            self.save()
+
+    def get(self, token_symbol: str, chain: str, account: Optional[str] = None) -> Optional[DepositAddress]:
+        """
+        Get a cached deposit address without a request.
+
+        Args:
+            token_symbol (str): token symbol, e.g. USDT.
+            chain (str): chain name, e.g. ERC20.
+            account (Optional[str]): account name. (the master account)
+
+        Returns:
+            Optional[DepositAddress]: the deposit address, None if it isn't cached.
+
+        """
+        return self.addresses.get((account, token_symbol, chain))
+
+    def chains(self, token_symbol: str, account: Optional[str] = None) -> Dict[str, DepositAddress]:
+        """
+        Get all cached deposit addresses of the token without a request.
+
+        Args:
+            token_symbol (str): token symbol, e.g. USDT.
+            account (Optional[str]): account name. (the master account)
+
+        Returns:
+            Dict[str, DepositAddress]: the deposit addresses by chains.
+
+        """
+        return {
+            chain: self.addresses[(account, token_symbol, chain)]
+            for chain in self.tokens.get((account, token_symbol), [])
+        }
+
+    async def fill(
+            self, okx_clients: Dict[Optional[str], 'OKXClient'], token_symbols: Iterable[str], refresh: bool = False
+    ) -> int:
+        """
+        Concurrently request deposit addresses of tokens that aren't cached for all accounts and save the cache.
+
+        Args:
+            okx_clients (Dict[Optional[str], OKXClient]): clients by account names, e.g. clients created with API keys
+                of sub-accounts, None is the master account.
+            token_symbols (Iterable[str]): token symbols, e.g. ['BTC', 'ETH'].
+            refresh (bool): request addresses of cached tokens too. (False)
+
+        Returns:
+            int: the number of requested tokens.
+
+        """
+        token_symbols = list(token_symbols)
+        requested = {
+            account: [
+                token_symbol for token_symbol in token_symbols
+                if refresh or (account, token_symbol) not in self.tokens
+            ]
+            for account in okx_clients
+        }
+        results = await asyncio.gather(
+            *(
+                okx_clients[account].asset.deposit_addresses(token_symbols=requested[account], refresh=refresh)
+                for account in requested
+            )
+        )
+        for account, addresses in zip(requested, results):
+            for token_symbol, chains in addresses.items():
+                self.replace(token_symbol=token_symbol, addresses=chains.values(), account=account, save=False)
+
+        self.save()
+        return sum(len(account_tokens) for account_tokens in requested.values())
+
+    def save(self) -> None:
+        """
+        Atomically write the cache to the file if the path is specified.
+        """
+        if not self.path:
+            return
+
+        records = [{'account': key[0], 'data': address.data} for key, address in self.addresses.items()]
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(records, file)
+
+        os.replace(temp_path, self.path)
@@ -0,0 +1,229 @@
+from decimal import Decimal
+from typing import Optional, Dict, List, Tuple, Hashable, AsyncIterator
+
+from py_okx_async.asset.ChangeFeed import DepositFeed
+from py_okx_async.asset.models import (
+    Deposit, DepositStatus, DepositStatuses, ExpectedPayment, MatchKeys, PaymentMatch, FeedEvent
+)
+
+
+class DepositReconciler:
+    """
+    The engine that matches deposits against expected payments using hash indexes.
+
+    Each open payment is indexed once by its most specific field, so an arriving deposit is matched by a few dictionary
+    lookups regardless of the number of open payments. Payments sharing a key are matched in the order of registration.
+    A matched payment leaves the indexes and is notified about state changes of its deposit until the deposit reaches
+    a final state:
+
+        reconciler = DepositReconciler()
+        reconciler.expect(payment=ExpectedPayment(id='42', address='0x...', amount=Decimal('10')))
+        async for match in reconciler.watch(feed=okx_client.asset.deposit_feed()):
+            print(match.payment.id, match.deposit.state)
+
+    Attributes:
+        payments (Dict[str, ExpectedPayment]): open payments by IDs.
+        by_txId (Dict[str, Dict[str, ExpectedPayment]]): open payments by transaction hashes.
+        by_address (Dict[Tuple[str, Optional[Decimal]], Dict[str, ExpectedPayment]]): open payments by deposit
+            addresses and amounts.
+        by_amount (Dict[Tuple[str, Optional[str], Decimal], Dict[str, ExpectedPayment]]): open payments by token
+            symbols, chains and amounts.
+        matched (Dict[int, ExpectedPayment]): matched payments whose deposits can still change by deposit IDs.
+
+    """
+    payments: Dict[str, ExpectedPayment]
+    by_txId: Dict[str, Dict[str, ExpectedPayment]]
+    by_address: Dict[Tuple[str, Optional[Decimal]], Dict[str, ExpectedPayment]]
+    by_amount: Dict[Tuple[str, Optional[str], Decimal], Dict[str, ExpectedPayment]]
+    matched: Dict[int, ExpectedPayment]
+
+    def __init__(self) -> None:
+        """
+        Initialize the class.
+        """
+        self.payments = {}
+        self.by_txId = {}
+        self.by_address = {}
+        self.by_amount = {}
+        self.matched = {}
+
+    def index(self, payment: ExpectedPayment) -> Tuple[Dict[Hashable, Dict[str, ExpectedPayment]], Hashable]:
+        """
+        Get the index and the key of the payment.
+
+        Args:
+            payment (ExpectedPayment): the expected payment.
+
+        Returns:
+            Tuple[Dict[Hashable, Dict[str, ExpectedPayment]], Hashable]: the index and the key.
+
+        """
+        amount = Decimal(str(payment.amount)) if payment.amount is not None else None
+        if payment.txId:
+            return self.by_txId, payment.txId
+
+        if payment.address:
+            return self.by_address, (payment.address, amount)
+
+        if payment.token_symbol and amount is not None:
+            return self.by_amount, (payment.token_symbol, payment.chain, amount)
+
+        raise ValueError(f'The payment {payment.id} has neither a txId, nor an address, nor a token and an amount!')
+
+    def expect(self, payment: ExpectedPayment) -> None:
+        """
+        Register an expected payment, a payment with the same ID is replaced.
+
+        Args:
+            payment (ExpectedPayment): the expected payment.
+
+        """
+        index, key = self.index(payment=payment)
+        self.cancel(payment_id=payment.id)
+        self.payments[payment.id] = payment
+        index.setdefault(key, {})[payment.id] = payment
+
+    def cancel(self, payment_id: str) -> Optional[ExpectedPayment]:
+        """
+        Unregister an open payment.
+
+        Args:
+            payment_id (str): payment ID.
+
+        Returns:
+            Optional[ExpectedPayment]: the unregistered payment.
+
+        """
+        payment = self.payments.pop(payment_id, None)
+        if payment:
+            index, key = self.index(payment=payment)
+            bucket = index[key]
+            del bucket[payment_id]
+            if not bucket:
+                del index[key]
+
+        return payment
+
+    def find(self, deposit: Deposit) -> Tuple[Optional[ExpectedPayment], Optional[str]]:
+        """
+        Find the earliest registered open payment that matches the deposit.
+
+        Args:
+            deposit (Deposit): the deposit.
+
+        Returns:
+            Tuple[Optional[ExpectedPayment], Optional[str]]: the payment and the field by which it was matched, one of
+                MatchKeys.
+
+        """
+        amount = Decimal(str(deposit.data.get('amt')))
+        candidates = (
+            (MatchKeys.TxId, self.by_txId, deposit.txId),
+            (MatchKeys.Address, self.by_address, (deposit.to_, amount)),
+            (MatchKeys.Address, self.by_address, (deposit.to_, None)),
+            (MatchKeys.Amount, self.by_amount, (deposit.token_symbol, deposit.chain, amount)),
+            (MatchKeys.Amount, self.by_amount, (deposit.token_symbol, None, amount)),
+        )
+        for match_key, index, key in candidates:
+            bucket = index.get(key)
+            if not bucket:
+                continue
+
+            for payment in bucket.values():
+                if not payment.token_symbol or payment.token_symbol == deposit.token_symbol:
+                    return payment, match_key
+
+        return None, None
+
+    def process_deposit(
+            self, deposit: Deposit, previous_state: Optional[DepositStatus] = None
+    ) -> Optional[PaymentMatch]:
+        """
+        Match a new deposit or notify about a state change of a matched one.
+
+        Args:
+            deposit (Deposit): the deposit in its current state.
+            previous_state (Optional[DepositStatus]): the state before the change. (the one of the last processed
+                deposit)
+
+        Returns:
+            Optional[PaymentMatch]: the notification, None if there is no match or nothing changed.
+
+        """
+        payment = self.matched.get(deposit.depId)
+        if payment:
+            if not previous_state:
+                previous_state = payment.deposit.state
+
+            if deposit.state == payment.deposit.state:
+                return
+
+            match = PaymentMatch(
+                payment=payment, deposit=deposit, key=payment.matched_by, previous_state=previous_state
+            )
+
+        else:
+            payment, match_key = self.find(deposit=deposit)
+            if not payment:
+                return
+
+            self.cancel(payment_id=payment.id)
+            payment.matched_by = match_key
+            match = PaymentMatch(payment=payment, deposit=deposit, key=match_key)
+
+        payment.deposit = deposit
+        if deposit.state and deposit.state.state in DepositStatuses.pending_states:
+            self.matched[deposit.depId] = payment
+
+        else:
+            self.matched.pop(deposit.depId, None)
+
+        return match
+
+    def process(self, event: FeedEvent) -> Optional[PaymentMatch]:
+        """
+        Process an event of a deposit change feed.
+
+        Args:
+            event (FeedEvent): the event.
+
+        Returns:
+            Optional[PaymentMatch]: the notification, None if there is no match or nothing changed.
+
+        """
+        return self.process_deposit(deposit=event.record, previous_state=event.previous_state)
+
+    def reconcile(self, deposits: Dict[int, Deposit]) -> List[PaymentMatch]:
+        """
+        Process deposits of the deposit history, e.g. ones received while the feed wasn't running.
+
+        Args:
+            deposits (Dict[int, Deposit]): deposits by deposit IDs.
+
+        Returns:
+            List[PaymentMatch]: notifications from earlier to newer deposits.
+
+        """
+        matches = []
+        for deposit in sorted(deposits.values(), key=lambda deposit: int(deposit.data.get('ts'))):
+            match = self.process_deposit(deposit=deposit)
+            if match:
+                matches.append(match)
+
+        return matches
+
+    async def watch(self, feed: DepositFeed) -> AsyncIterator[PaymentMatch]:
+        """
+        Process events of the deposit change feed endlessly.
+
+        Args:
+            feed (DepositFeed): the deposit change feed.
+
+        Returns:
+            AsyncIterator[PaymentMatch]: notifications as soon as deposits arrive or change.
+
+        """
+        async for event in feed:
+            match = self.process(event=event)
+            if match:
+                yield match
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 from py_okx_async.models import ReprWithoutData, StateName, AccountType, AccountTypes
 
@@ -21,14 +21,11 @@ class Currency(ReprWithoutData):
         depQuoteDailyLayer2 (Optional[float]): the layer2 network daily deposit limit.
         logoLink (str): the logo link of currency.
         mainNet (bool): if current chain is main net then return true, otherwise return false.
-        maxFee (Decimal): the maximum withdrawal fee for normal address.
-        maxFeeForCtAddr (Decimal): the maximum withdrawal fee for contract address.
+        fee (Decimal): the withdrawal fee.
         maxWd (float): the maximum amount of currency withdrawal in a single transaction.
         minDep (float): the minimum deposit amount of the currency in a single transaction.
         minDepArrivalConfirm (int): the minimum number of blockchain confirmations to acknowledge fund deposit.
             The account is credited after that, but the deposit can not be withdrawn.
-        minFee (Decimal): the minimum withdrawal fee for normal address.
-        minFeeForCtAddr (Decimal): the minimum withdrawal fee for contract address.
         minWd (float): the minimum withdrawal amount of the currency in a single transaction.
         minWdUnlockConfirm (int): the minimum number of blockchain confirmations required for withdrawal of a deposit.
         name (str): name of currency. There is no related name when it is not shown.
@@ -78,6 +75,50 @@ class Currency(ReprWithoutData):
         self.wdTickSz: int = int(data.get('wdTickSz'))
 
 
+class WithdrawalErrors:
+    """
+    An instance with all reasons why withdrawals are rejected by local validation.
+    """
+    UnknownToken = 'unknown token'
+    UnknownChain = 'unknown chain'
+    Disabled = 'withdrawals are disabled'
+    Precision = 'the amount or the fee has more decimals than wdTickSz'
+    BelowMinimum = 'the amount is less than minWd'
+    AboveMaximum = 'the amount is greater than maxWd'
+    LowFee = 'the fee is less than the withdrawal fee'
+
+
+@dataclass
+class WithdrawalCheck:
+    """
+    An instance of a result of local validation of a withdrawal.
+
+    Attributes:
+        token_symbol (str): token symbol, e.g. BTC.
+        chain (str): chain name without the token symbol, e.g. ERC20, TRC20.
+        amount (Decimal): withdrawal amount rounded down to the withdrawal precision.
+        fee (Optional[Decimal]): withdrawal fee rounded up to the withdrawal precision, None if the chain is unknown.
+        error (Optional[str]): the reason of the rejection, one of WithdrawalErrors. (None)
+
+    """
+    token_symbol: str
+    chain: str
+    amount: Decimal
+    fee: Optional[Decimal]
+    error: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        """
+        Check whether the withdrawal passed validation.
+
+        Returns:
+            bool: True if there is no error.
+
+        """
+        return self.error is None
+
+
 @dataclass
 class TransactionType(StateName):
     """
@@ -126,6 +167,8 @@ class DepositStatuses:
         '14': KYCLimit
     }
 
+    pending_states = ('0', '1', '8', '12', '13', '14')
+
 
 class Deposit(ReprWithoutData):
     """
@@ -221,6 +264,8 @@ class WithdrawalStatuses:
         '12': WaitingMannualReview12
     }
 
+    pending_states = ('-3', '0', '1', '4', '5', '6', '7', '8', '9', '10', '12')
+
 
 class Withdrawal(ReprWithoutData):
     """
@@ -354,7 +399,7 @@ class Transfer(ReprWithoutData):
     Attributes:
         data (Dict[str, Any]): the raw data.
         transId (int): transfer ID.
-        clientId (Optional[int]): client-supplied ID.
+        clientId (Optional[str]): client-supplied ID.
         token_symbol (str): token symbol, e.g. BTC.
         from_ (AccountType): the remitting account.
         amt (float): transfer amount.
@@ -372,9 +417,270 @@ class Transfer(ReprWithoutData):
         """
         self.data: Dict[str, Any] = data
         self.transId: int = int(data.get('transId'))
-        self.clientId: Optional[int] = data.get('clientId')
-        self.clientId = int(self.clientId) if self.clientId else None
+        self.clientId: Optional[str] = data.get('clientId')
+        self.clientId = self.clientId if self.clientId else None
         self.token_symbol: str = data.get('ccy')
         self.from_: AccountType = AccountTypes.types_dict.get(data.get('from'))
         self.amt: float = float(data.get('amt'))
         self.to_: AccountType = AccountTypes.types_dict.get(data.get('to'))
+
+
+class TransferStates:
+    """
+    An instance with all transfer states.
+    """
+    Success = 'success'
+    Pending = 'pending'
+    Failed = 'failed'
+
+
+class TransferState(ReprWithoutData):
+    """
+    An instance of a transfer state.
+
+    Attributes:
+        data (Dict[str, Any]): the raw data.
+        transId (int): transfer ID.
+        clientId (Optional[str]): client-supplied ID.
+        token_symbol (str): token symbol, e.g. BTC.
+        amt (float): amount to be transferred.
+        type (Optional[TransferType]): transfer type.
+        from_ (AccountType): the remitting account.
+        to_ (AccountType): the beneficiary account.
+        subAcct (Optional[str]): name of the sub-account.
+        state (str): transfer state, one of TransferStates.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with a transfer state data.
+
+        """
+        self.data: Dict[str, Any] = data
+        self.transId: int = int(data.get('transId'))
+        self.clientId: Optional[str] = data.get('clientId')
+        self.clientId = self.clientId if self.clientId else None
+        self.token_symbol: str = data.get('ccy')
+        self.amt: float = float(data.get('amt'))
+        self.type: Optional[TransferType] = TransferTypes.statuses_dict.get(data.get('type'))
+        self.from_: AccountType = AccountTypes.types_dict.get(data.get('from'))
+        self.to_: AccountType = AccountTypes.types_dict.get(data.get('to'))
+        self.subAcct: Optional[str] = data.get('subAcct')
+        self.subAcct = self.subAcct if self.subAcct else None
+        self.state: str = data.get('state')
+
+
+class DepositAddress(ReprWithoutData):
+    """
+    An instance of a deposit address.
+
+    Attributes:
+        data (Dict[str, Any]): the raw data.
+        addr (str): deposit address.
+        tag (Optional[str]): deposit tag, it is returned when the currency requires a tag for deposit.
+        memo (Optional[str]): deposit memo, it is returned when the currency requires a memo for deposit.
+        pmtId (Optional[str]): deposit payment ID, it is returned when the currency requires a payment ID for deposit.
+        addrEx (Optional[Dict[str, str]]): deposit address attachment, e.g. {'attachmentTag': '123'}.
+        token_symbol (str): token symbol, e.g. BTC.
+        chain (str): chain name, e.g. ERC20, TRC20.
+        to_ (Optional[AccountType]): the beneficiary account.
+        selected (bool): whether the address is selected on the website.
+        ctAddr (Optional[str]): last 6 digits of the contract address.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with a deposit address data.
+
+        """
+        self.data: Dict[str, Any] = data
+        self.addr: str = data.get('addr')
+        self.tag: Optional[str] = data.get('tag')
+        self.tag = self.tag if self.tag else None
+        self.memo: Optional[str] = data.get('memo')
+        self.memo = self.memo if self.memo else None
+        self.pmtId: Optional[str] = data.get('pmtId')
+        self.pmtId = self.pmtId if self.pmtId else None
+        self.addrEx: Optional[Dict[str, str]] = data.get('addrEx')
+        self.addrEx = self.addrEx if self.addrEx else None
+        self.token_symbol: str = data.get('ccy')
+        self.chain: str = '-'.join(data.get('chain').split('-')[1:])
+        self.to_: Optional[AccountType] = AccountTypes.types_dict.get(data.get('to'))
+        self.selected: bool = data.get('selected')
+        self.ctAddr: Optional[str] = data.get('ctAddr')
+        self.ctAddr = self.ctAddr if self.ctAddr else None
+
+
+@dataclass
+class BillType(StateName):
+    """
+    An instance of a bill type.
+    """
+    pass
+
+
+class BillTypes:
+    """
+    An instance with common bill types.
+    """
+    Deposit = BillType(state='1', name='deposit')
+    Withdrawal = BillType(state='2', name='withdrawal')
+    CanceledWithdrawal = BillType(state='13', name='canceled withdrawal')
+    TransferToSub = BillType(state='20', name='transfer to sub account')
+    TransferFromSub = BillType(state='21', name='transfer from sub account')
+    TransferOutFromSubToMaster = BillType(state='22', name='transfer out from sub to master account')
+    TransferInFromMasterToSub = BillType(state='23', name='transfer in from master to sub account')
+    ManuallyAdded = BillType(state='28', name='manually add')
+    ManuallyDeducted = BillType(state='29', name='manually deduct')
+    TransferToSpot = BillType(state='37', name='transfer to spot')
+    TransferFromSpot = BillType(state='38', name='transfer from spot')
+    TransferToTrading = BillType(state='130', name='transferred from trading account')
+    TransferFromTrading = BillType(state='131', name='transferred to trading account')
+
+    types_dict = {
+        '1': Deposit,
+        '2': Withdrawal,
+        '13': CanceledWithdrawal,
+        '20': TransferToSub,
+        '21': TransferFromSub,
+        '22': TransferOutFromSubToMaster,
+        '23': TransferInFromMasterToSub,
+        '28': ManuallyAdded,
+        '29': ManuallyDeducted,
+        '37': TransferToSpot,
+        '38': TransferFromSpot,
+        '130': TransferToTrading,
+        '131': TransferFromTrading
+    }
+
+
+class Bill(ReprWithoutData):
+    """
+    An instance of a bill of the funding account.
+
+    Attributes:
+        data (Dict[str, Any]): the raw data.
+        billId (int): bill ID.
+        token_symbol (str): token symbol, e.g. BTC.
+        clientId (Optional[str]): client-supplied ID for transfer or withdrawal.
+        balChg (float): change in balance at the account level.
+        bal (float): balance at the account level.
+        type (Optional[BillType]): bill type, None if it isn't one of BillTypes, the raw one is in the data.
+        ts (int): creation time, Unix timestamp format in seconds.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with a bill data.
+
+        """
+        self.data: Dict[str, Any] = data
+        self.billId: int = int(data.get('billId'))
+        self.token_symbol: str = data.get('ccy')
+        self.clientId: Optional[str] = data.get('clientId')
+        self.clientId = self.clientId if self.clientId else None
+        self.balChg: float = float(data.get('balChg'))
+        self.bal: float = float(data.get('bal'))
+        self.type: Optional[BillType] = BillTypes.types_dict.get(data.get('type'))
+        self.ts: int = data.get('ts')
+        self.ts = int(int(self.ts) / 1000) if self.ts else 0
+
+
+class ExportFormats:
+    """
+    An instance with all formats of exported files.
+    """
+    CSV = 'csv'
+    Parquet = 'parquet'
+
+
+class FeedEventTypes:
+    """
+    An instance with all change feed event types.
+    """
+    New = 'new'
+    StateChanged = 'state changed'
+
+
+@dataclass
+class FeedEvent:
+    """
+    An instance of a change feed event.
+
+    Attributes:
+        type (str): event type, one of FeedEventTypes.
+        record (Union[Deposit, Withdrawal]): the new or changed record.
+        previous_state (Optional[Union[DepositStatus, WithdrawalStatus]]): the state before the change. (None)
+
+    """
+    type: str
+    record: Union[Deposit, Withdrawal]
+    previous_state: Optional[Union[DepositStatus, WithdrawalStatus]] = None
+
+
+@dataclass
+class ExpectedPayment:
+    """
+    An instance of an expected payment.
+
+    The payment is matched by the most specific field it has: the transaction hash, the deposit address (and the amount
+    if it's specified) or the token, the chain and the amount.
+
+    Attributes:
+        id (str): payment ID, e.g. an invoice number.
+        token_symbol (Optional[str]): token symbol, e.g. BTC. (None)
+        chain (Optional[str]): chain name, e.g. ERC20, TRC20. (any)
+        amount (Optional[Decimal]): deposit amount. (any)
+        address (Optional[str]): deposit address. (None)
+        txId (Optional[str]): hash record of the deposit. (None)
+        deposit (Optional[Deposit]): the matched deposit. (None)
+        matched_by (Optional[str]): the field by which the deposit was matched, one of MatchKeys. (None)
+
+    """
+    id: str
+    token_symbol: Optional[str] = None
+    chain: Optional[str] = None
+    amount: Optional[Decimal] = None
+    address: Optional[str] = None
+    txId: Optional[str] = None
+    deposit: Optional[Deposit] = None
+    matched_by: Optional[str] = None
+
+
+class MatchKeys:
+    """
+    An instance with all fields by which deposits are matched.
+    """
+    TxId = 'txId'
+    Address = 'address'
+    Amount = 'amount'
+
+
+@dataclass
+class PaymentMatch:
+    """
+    An instance of a match notification.
+
+    Attributes:
+        payment (ExpectedPayment): the expected payment.
+        deposit (Deposit): the matched deposit in its current state.
+        key (str): the field by which the deposit was matched, one of MatchKeys.
+        previous_state (Optional[DepositStatus]): the state before the change, None for a new match. (None)
+
+    """
+    payment: ExpectedPayment
+    deposit: Deposit
+    key: str
+    previous_state: Optional[DepositStatus] = None
@@ -44,3 +44,67 @@ class APIException(OKXClientException):
             return f'{self.code}, {self.msg}'
 
         return f'{self.status_code} (HTTP)'
+
+
+class DeadlineExceeded(OKXClientException):
+    pass
+
+
+class CassetteMiss(OKXClientException):
+    pass
+
+
+class InvalidWithdrawal(OKXClientException):
+    """
+    An exception that occurs when a withdrawal is rejected by local validation without sending.
+
+    Attributes:
+        token_symbol (str): token symbol, e.g. BTC.
+        chain (str): chain name.
+        reason (str): the reason of the rejection, one of WithdrawalErrors.
+
+    Args:
+        token_symbol (str): token symbol, e.g. BTC.
+        chain (str): chain name.
+        reason (str): the reason of the rejection, one of WithdrawalErrors.
+
+    """
+    token_symbol: str
+    chain: str
+    reason: str
+
+    def __init__(self, token_symbol: str, chain: str, reason: str) -> None:
+        self.token_symbol = token_symbol
+        self.chain = chain
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f'The withdrawal of {self.token_symbol} on {self.chain} is invalid: {self.reason}'
+
+
+class CircuitOpen(OKXClientException):
+    """
+    An exception that occurs when a request is rejected without sending because the circuit of the endpoint is open.
+
+    Attributes:
+        host (str): an API entrypoint url.
+        endpoint (str): the request path without parameters.
+        retry_after (float): the time in seconds after which probe requests are let through.
+
+    Args:
+        host (str): an API entrypoint url.
+        endpoint (str): the request path without parameters.
+        retry_after (float): the time in seconds after which probe requests are let through.
+
+    """
+    host: str
+    endpoint: str
+    retry_after: float
+
+    def __init__(self, host: str, endpoint: str, retry_after: float) -> None:
+        self.host = host
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return f'The circuit of {self.host}{self.endpoint} is open, retry after {self.retry_after:.1f} seconds'
@@ -1,5 +1,15 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+
+def __getattr__(name: str) -> Any:
+    # The large Chains class is loaded on first access to keep the import of the package cheap.
+    if name == 'Chains':
+        from py_okx_async.chains import Chains
+
+        return Chains
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class ReprWithoutData:
@@ -62,234 +72,217 @@ class Methods:
     POST = 'POST'
 
 
-class Chains:
-    """
-    An instance with all chain names supported by OKX.
-    """
-    AELF = 'AELF'
-    Acala = 'Acala'
-    Algorand = 'Algorand'
-    Aptos = 'Aptos'
-    ArbitrumOne = 'Arbitrum One'
-    Arweave = 'Arweave'
-    Astar = 'Astar'
-    AvalancheCChain = 'Avalanche C-Chain'
-    AvalancheXChain = 'Avalanche X-Chain'
-    BRC20 = 'BRC20'
-    BSC = 'BSC'
-    Base = 'Base'
-    Bitcoin = 'Bitcoin'
-    BitcoinSV = 'Bitcoin SV'
-    BitcoinCash = 'BitcoinCash'
-    CELO = 'CELO'
-    CELOTOKEN = 'CELO-TOKEN'
-    CFX_EVM = 'CFX_EVM'
-    CORE = 'CORE'
-    Cardano = 'Cardano'
-    Casper = 'Casper'
-    Celestia = 'Celestia'
-    Chia = 'Chia'
-    Chiliz2_0Chain = 'Chiliz 2.0 Chain'
-    ChilizChain = 'Chiliz Chain'
-    Conflux = 'Conflux'
-    Cortex = 'Cortex'
-    Cosmos = 'Cosmos'
-    Crypto = 'Crypto'
-    DYDX = 'DYDX'
-    Dfinity = 'Dfinity'
-    Digibyte = 'Digibyte'
-    Dogecoin = 'Dogecoin'
-    EOS = 'EOS'
-    ERC20 = 'ERC20'
-    Elrond = 'Elrond'
-    EnduranceSmartChain = 'Endurance Smart Chain'
-    EnjinRelayChain = 'Enjin Relay Chain'
-    EthereumClassic = 'Ethereum Classic'
-    EthereumPoW = 'EthereumPoW'
-    FEVM = 'FEVM'
-    FLOW = 'FLOW'
-    Fantom = 'Fantom'
-    Filecoin = 'Filecoin'
-    Flare = 'Flare'
-    GravityAlphaMainnet = 'Gravity Alpha Mainnet'
-    Harmony = 'Harmony'
-    Hedera = 'Hedera'
-    ICON = 'ICON'
-    INJ = 'INJ'
-    IOST = 'IOST'
-    Kadena = 'Kadena'
-    Khala = 'Khala'
-    Klaytn = 'Klaytn'
-    Kusama = 'Kusama'
-    Layer3 = 'Layer 3'
-    Lightning = 'Lightning'
-    Linea = 'Linea'
-    Lisk = 'Lisk'
-    Litecoin = 'Litecoin'
-    MERLINNetwork = 'MERLIN Network'
-    MIOTA = 'MIOTA'
-    Metis = 'Metis'
-    MetisTokenTransfer = 'Metis (Token Transfer)'
-    Mina = 'Mina'
-    Moonbeam = 'Moonbeam'
-    Moonriver = 'Moonriver'
-    N3 = 'N3'
-    NEAR = 'NEAR'
-    NULS = 'NULS'
-    Nano = 'Nano'
-    OASYS = 'OASYS'
-    OKTC = 'OKTC'
-    Ontology = 'Ontology'
-    Optimism = 'Optimism'
-    OptimismV2 = 'Optimism (V2)'
-    PlatON = 'PlatON'
-    Polkadot = 'Polkadot'
-    Polygon = 'Polygon'
-    PolygonBridged = 'Polygon (Bridged)'
-    Quantum = 'Quantum'
-    Ravencoin = 'Ravencoin'
-    Ripple = 'Ripple'
-    Ronin = 'Ronin'
-    SUI = 'SUI'
-    Siacoin = 'Siacoin'
-    Solana = 'Solana'
-    Starknet = 'Starknet'
-    StellarLumens = 'Stellar Lumens'
-    TON = 'TON'
-    TRC20 = 'TRC20'
-    Terra = 'Terra'
-    TerraClassic = 'Terra Classic'
-    TerraClassicUSTC = 'Terra Classic (USTC)'
-    Tezos = 'Tezos'
-    Theta = 'Theta'
-    Venom = 'Venom'
-    Wax = 'Wax'
-    XLayer = 'X Layer'
-    ZetaChain = 'ZetaChain'
-    Zilliqa = 'Zilliqa'
-    lStacks = 'l-Stacks'
-    zkSyncEra = 'zkSync Era'
-
-    all_chains = {
-        'aelf': AELF,
-        'acala': Acala,
-        'algorand': Algorand,
-        'aptos': Aptos,
-        'arbitrum one': ArbitrumOne,
-        'arweave': Arweave,
-        'astar': Astar,
-        'avalanche c-chain': AvalancheCChain,
-        'avalanche x-chain': AvalancheXChain,
-        'brc20': BRC20,
-        'bsc': BSC,
-        'base': Base,
-        'bitcoin': Bitcoin,
-        'bitcoin sv': BitcoinSV,
-        'bitcoincash': BitcoinCash,
-        'celo': CELO,
-        'celo-token': CELOTOKEN,
-        'cfx_evm': CFX_EVM,
-        'core': CORE,
-        'cardano': Cardano,
-        'casper': Casper,
-        'celestia': Celestia,
-        'chia': Chia,
-        'chiliz 2.0 chain': Chiliz2_0Chain,
-        'chiliz chain': ChilizChain,
-        'conflux': Conflux,
-        'cortex': Cortex,
-        'cosmos': Cosmos,
-        'crypto': Crypto,
-        'dydx': DYDX,
-        'dfinity': Dfinity,
-        'digibyte': Digibyte,
-        'dogecoin': Dogecoin,
-        'eos': EOS,
-        'erc20': ERC20,
-        'elrond': Elrond,
-        'endurance smart chain': EnduranceSmartChain,
-        'enjin relay chain': EnjinRelayChain,
-        'ethereum classic': EthereumClassic,
-        'ethereumpow': EthereumPoW,
-        'fevm': FEVM,
-        'flow': FLOW,
-        'fantom': Fantom,
-        'filecoin': Filecoin,
-        'flare': Flare,
-        'gravity alpha mainnet': GravityAlphaMainnet,
-        'harmony': Harmony,
-        'hedera': Hedera,
-        'icon': ICON,
-        'inj': INJ,
-        'iost': IOST,
-        'kadena': Kadena,
-        'khala': Khala,
-        'klaytn': Klaytn,
-        'kusama': Kusama,
-        'layer 3': Layer3,
-        'lightning': Lightning,
-        'linea': Linea,
-        'lisk': Lisk,
-        'litecoin': Litecoin,
-        'merlin network': MERLINNetwork,
-        'miota': MIOTA,
-        'metis': Metis,
-        'Metis (Token Transfer)': MetisTokenTransfer,
-        'mina': Mina,
-        'moonbeam': Moonbeam,
-        'moonriver': Moonriver,
-        'n3': N3,
-        'near': NEAR,
-        'nuls': NULS,
-        'nano': Nano,
-        'oasys': OASYS,
-        'oktc': OKTC,
-        'ontology': Ontology,
-        'optimism': Optimism,
-        'optimism (v2)': OptimismV2,
-        'platon': PlatON,
-        'polkadot': Polkadot,
-        'polygon': Polygon,
-        'polygon (bridged)': PolygonBridged,
-        'quantum': Quantum,
-        'ravencoin': Ravencoin,
-        'ripple': Ripple,
-        'ronin': Ronin,
-        'sui': SUI,
-        'siacoin': Siacoin,
-        'solana': Solana,
-        'starknet': Starknet,
-        'stellar lumens': StellarLumens,
-        'ton': TON,
-        'trc20': TRC20,
-        'terra': Terra,
-        'terra classic': TerraClassic,
-        'terra classic (ustc)': TerraClassicUSTC,
-        'tezos': Tezos,
-        'theta': Theta,
-        'venom': Venom,
-        'wax': Wax,
-        'x layer': XLayer,
-        'zetachain': ZetaChain,
-        'zilliqa': Zilliqa,
-        'l-stacks': lStacks,
-        'zksync era': zkSyncEra,
+@dataclass
+class RateLimit:
+    """
+    An instance of an endpoint rate limit.
+
+    Attributes:
+        requests (int): a number of requests allowed per period.
+        period (float): a period in seconds.
+
+    """
+    requests: int
+    period: float
+
+
+class RateLimits:
+    """
+    An instance with rate limits of endpoints.
+    """
+    Default = RateLimit(requests=5, period=1)
+
+    limits_dict = {
+        '/api/v5/asset/currencies': RateLimit(requests=6, period=1),
+        '/api/v5/asset/balances': RateLimit(requests=6, period=1),
+        '/api/v5/asset/deposit-history': RateLimit(requests=6, period=1),
+        '/api/v5/asset/withdrawal-history': RateLimit(requests=6, period=1),
+        '/api/v5/asset/withdrawal': RateLimit(requests=6, period=1),
+        '/api/v5/asset/cancel-withdrawal': RateLimit(requests=6, period=1),
+        '/api/v5/asset/transfer': RateLimit(requests=2, period=1),
+        '/api/v5/asset/transfer-state': RateLimit(requests=10, period=1),
+        '/api/v5/asset/deposit-address': RateLimit(requests=6, period=1),
+        '/api/v5/asset/bills': RateLimit(requests=6, period=1),
+        '/api/v5/asset/subaccount/balances': RateLimit(requests=6, period=2),
+        '/api/v5/account/balance': RateLimit(requests=10, period=2),
+        '/api/v5/account/subaccount/balances': RateLimit(requests=6, period=2),
+        '/api/v5/users/subaccount/list': RateLimit(requests=2, period=2),
+        '/api/v5/public/time': RateLimit(requests=10, period=2),
+        '/api/v5/public/instruments': RateLimit(requests=20, period=2),
+        '/api/v5/market/tickers': RateLimit(requests=20, period=2),
+        '/api/v5/market/ticker': RateLimit(requests=20, period=2),
     }
 
-    @staticmethod
-    def are_equal(chain_1: str, chain_2: str) -> bool:
-        """
-        Compare if the names of chains match in lowercase.
 
-        Args:
-            chain_1 (str): the first chain name.
-            chain_2 (str): the second chain name.
+class Priorities:
+    """
+    An instance with priority classes of requests, lower values are dispatched first.
+    """
+    Critical = 0
+    Normal = 1
+    Bulk = 2
 
-        Returns:
-            bool: True if chains are equal.
+    endpoints_dict = {
+        '/api/v5/asset/withdrawal': Critical,
+        '/api/v5/asset/cancel-withdrawal': Critical,
+    }
 
-        """
-        return chain_1.lower() == chain_2.lower()
+
+class CassetteModes:
+    """
+    An instance with all modes of cassettes of requests.
+    """
+    Record = 'record'
+    Replay = 'replay'
+
+
+@dataclass
+class HedgingSettings:
+    """
+    An instance that contains settings of hedged GET requests.
+
+    Attributes:
+        percentile (float): the percentile of observed latency after which a hedge is sent. (0.95)
+        delay (float): the delay in seconds used until enough latency samples are collected. (1.0)
+        min_delay (float): the minimum delay in seconds before a hedge is sent. (0.05)
+        max_delay (float): the maximum delay in seconds before a hedge is sent. (5.0)
+        min_samples (int): the number of latency samples required to use the percentile. (20)
+        entrypoint_url (Optional[str]): an API entrypoint url for hedges, e.g. https://www.okx.cab. (the same)
+        proxy (Optional[str]): a proxy for hedges in the same formats as the client proxy. (the same)
+
+    """
+    percentile: float = 0.95
+    delay: float = 1.0
+    min_delay: float = 0.05
+    max_delay: float = 5.0
+    min_samples: int = 20
+    entrypoint_url: Optional[str] = None
+    proxy: Optional[str] = None
+
+
+@dataclass
+class ConcurrencySettings:
+    """
+    An instance that contains settings of adaptive concurrency (AIMD) of each endpoint.
+
+    Attributes:
+        initial (int): the initial number of requests in flight. (4)
+        minimum (int): the minimum number of requests in flight. (1)
+        maximum (int): the maximum number of requests in flight. (64)
+        increase (float): the number of requests the limit grows by per window of successful responses. (1.0)
+        decrease (float): the factor the limit is multiplied by on 429/50011 errors or latency spikes. (0.5)
+        latency_factor (float): a response is considered a latency spike if it is that many times slower than
+            the smoothed latency. (3.0)
+
+    """
+    initial: int = 4
+    minimum: int = 1
+    maximum: int = 64
+    increase: float = 1.0
+    decrease: float = 0.5
+    latency_factor: float = 3.0
+
+
+class CircuitStates:
+    """
+    An instance with all circuit breaker states.
+    """
+    Closed = 'closed'
+    Open = 'open'
+    HalfOpen = 'half-open'
+
+
+@dataclass
+class CircuitBreakerSettings:
+    """
+    An instance that contains settings of the circuit breaker of each endpoint and host.
+
+    Attributes:
+        failure_rate (float): the failure rate within the window after which the circuit is opened. (0.5)
+        min_requests (int): the number of requests within the window required to open the circuit. (10)
+        window (float): the window of recent requests in seconds. (30)
+        open_timeout (float): the time in seconds after which an open circuit lets probe requests through. (15)
+        half_open_probes (int): the number of probe requests let through at once in the half-open state. (1)
+        failure_codes (Tuple[int, ...]): OKX error codes that mean that the exchange is unavailable.
+            (50001, 50004, 50013, 50026)
+
+    """
+    failure_rate: float = 0.5
+    min_requests: int = 10
+    window: float = 30
+    open_timeout: float = 15
+    half_open_probes: int = 1
+    failure_codes: Tuple[int, ...] = (50001, 50004, 50013, 50026)
+
+
+@dataclass
+class Timeouts:
+    """
+    An instance that contains timeouts of requests in seconds.
+
+    Attributes:
+        total (float): the maximum time of a whole request. (30)
+        connect (float): the maximum time of establishing a connection including a proxy one. (10)
+        read (float): the maximum time between reads of response parts. (20)
+
+    """
+    total: float = 30
+    connect: float = 10
+    read: float = 20
+
+
+@dataclass(frozen=True)
+class DNSSettings:
+    """
+    An instance that contains settings of resolving hosts of the API and proxies.
+
+    Attributes:
+        async_resolver (bool): resolve hosts with aiodns if it's installed instead of getaddrinfo in the thread pool.
+            (True)
+        cache_ttl (float): the time in seconds for which resolved hosts are cached by all connectors. (300)
+        nameservers (Optional[Tuple[str, ...]]): DNS servers used by aiodns. (the system ones)
+
+    """
+    async_resolver: bool = True
+    cache_ttl: float = 300
+    nameservers: Optional[Tuple[str, ...]] = None
+
+
+@dataclass
+class TransportRequest:
+    """
+    An instance of a prepared request that is sent by a transport.
+
+    Attributes:
+        method (str): the request method is either GET or POST.
+        url (str): the URL with parameters.
+        headers (Dict[str, str]): signed headers.
+        body (Optional[bytes]): the request body. (None)
+        timeouts (Optional[Timeouts]): timeouts of the request. (the ones of the transport)
+        connector (Any): the connection pool of the request, transports that manage connections themselves ignore it.
+            (None)
+
+    """
+    method: str
+    url: str
+    headers: Dict[str, str]
+    body: Optional[bytes] = None
+    timeouts: Optional[Timeouts] = None
+    connector: Any = None
+
+
+@dataclass
+class TransportResponse:
+    """
+    An instance of a raw response returned by a transport.
+
+    Attributes:
+        status_code (int): the HTTP status code.
+        content (bytes): the response body.
+
+    """
+    status_code: int
+    content: bytes
 
 
 class FundingToken(ReprWithoutData):
@@ -320,6 +313,199 @@ class FundingToken(ReprWithoutData):
         self.frozenBal: float = float(data.get('frozenBal'))
 
 
+class TradingToken(ReprWithoutData):
+    """
+    An instance of a trading token.
+
+    Attributes:
+        data (Dict[str, Any]): the raw data.
+        token_symbol (str): token symbol, e.g. BTC.
+        eq (float): equity of the token.
+        cashBal (float): cash balance.
+        availBal (float): available balance.
+        frozenBal (float): frozen balance.
+        eqUsd (Optional[float]): equity in USD.
+        uTime (int): update time of the token balance, Unix timestamp format in seconds.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with a trading token data.
+
+        """
+        self.data: Dict[str, Any] = data
+        self.token_symbol: str = data.get('ccy')
+        self.eq: float = float(data.get('eq') or 0)
+        self.cashBal: float = float(data.get('cashBal') or 0)
+        self.availBal: float = float(data.get('availBal') or 0)
+        self.frozenBal: float = float(data.get('frozenBal') or 0)
+        self.eqUsd: Optional[float] = float(data.get('eqUsd')) if data.get('eqUsd') else None
+        self.uTime: int = int(int(data.get('uTime')) / 1000) if data.get('uTime') else 0
+
+
+@dataclass
+class BalanceDelta:
+    """
+    An instance of a balance change of a token.
+
+    Attributes:
+        account (Optional[str]): sub-account name, None for the master account.
+        token_symbol (str): token symbol, e.g. BTC.
+        bal (float): balance.
+        availBal (float): available balance.
+        frozenBal (float): frozen balance.
+        previous (Optional[Tuple[float, float, float]]): the previous balance, available and frozen balances,
+            None if the token is new.
+
+    """
+    account: Optional[str]
+    token_symbol: str
+    bal: float
+    availBal: float
+    frozenBal: float
+    previous: Optional[Tuple[float, float, float]] = None
+
+
+@dataclass
+class TreasurySnapshot:
+    """
+    An instance of aggregated funding holdings of the master account and sub-accounts.
+
+    Attributes:
+        accounts (Dict[Optional[str], Dict[str, FundingToken]]): balances by sub-account names, None is the master
+            account.
+        prices (Dict[str, float]): USD prices of tokens.
+        tokens (Dict[str, float]): total balances of tokens across all accounts.
+        tokens_usd (Dict[str, Optional[float]]): USD values of total balances of tokens, None if there is no price.
+        accounts_usd (Dict[Optional[str], float]): USD values of accounts excluding tokens without a price.
+        total_usd (float): the USD value of all accounts excluding tokens without a price.
+        timings (Dict[str, float]): durations of stages in seconds.
+        ts (int): the time when the snapshot was started, Unix timestamp format in milliseconds.
+
+    """
+    accounts: Dict[Optional[str], Dict[str, 'FundingToken']]
+    prices: Dict[str, float]
+    tokens: Dict[str, float]
+    tokens_usd: Dict[str, Optional[float]]
+    accounts_usd: Dict[Optional[str], float]
+    total_usd: float
+    timings: Dict[str, float]
+    ts: int
+
+
+@dataclass
+class TokenExposure:
+    """
+    An instance of merged balances of a token in the funding and trading accounts.
+
+    Attributes:
+        token_symbol (str): token symbol, e.g. BTC.
+        funding (float): balance in the funding account. (0.0)
+        trading (float): equity in the trading account. (0.0)
+        availBal (float): available balance in both accounts. (0.0)
+        frozenBal (float): frozen balance in both accounts. (0.0)
+
+    """
+    token_symbol: str
+    funding: float = 0.0
+    trading: float = 0.0
+    availBal: float = 0.0
+    frozenBal: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """
+        Get the balance in both accounts.
+
+        Returns:
+            float: the sum of the funding balance and the trading equity.
+
+        """
+        return self.funding + self.trading
+
+
+@dataclass
+class AccountSnapshot:
+    """
+    An instance of merged funding and trading balances of the master account and sub-accounts.
+
+    Attributes:
+        funding (Dict[Optional[str], Dict[str, FundingToken]]): funding balances by sub-account names, None is the
+            master account.
+        trading (Dict[Optional[str], Dict[str, TradingToken]]): trading balances by sub-account names, None is the
+            master account.
+        accounts (Dict[Optional[str], Dict[str, TokenExposure]]): merged balances of tokens by sub-account names,
+            None is the master account.
+        tokens (Dict[str, TokenExposure]): merged balances of tokens across all accounts.
+        timings (Dict[str, float]): durations of stages in seconds.
+        ts (int): the time when all balances were requested, Unix timestamp format in milliseconds.
+
+    """
+    funding: Dict[Optional[str], Dict[str, 'FundingToken']]
+    trading: Dict[Optional[str], Dict[str, 'TradingToken']]
+    accounts: Dict[Optional[str], Dict[str, TokenExposure]]
+    tokens: Dict[str, TokenExposure]
+    timings: Dict[str, float]
+    ts: int
+
+
+class SweepStatuses:
+    """
+    An instance with all statuses of sweep transfers.
+    """
+    Planned = 'planned'
+    Success = 'success'
+    Pending = 'pending'
+    Failed = 'failed'
+    Unknown = 'unknown'
+
+
+@dataclass
+class SweepTransfer:
+    """
+    An instance of a transfer from the funding account of a sub-account to the funding account of the master account.
+
+    Attributes:
+        subAcct (str): name of the sub-account.
+        token_symbol (str): token symbol, e.g. BTC.
+        amount (str): amount to be transferred, the available balance as it was returned.
+        clientId (str): client-supplied ID used to retry the transfer safely.
+        status (str): the transfer status, one of SweepStatuses. (planned)
+        transId (Optional[int]): transfer ID. (None)
+        attempts (int): the number of sent requests. (0)
+        error (Optional[str]): the last error. (None)
+
+    """
+    subAcct: str
+    token_symbol: str
+    amount: str
+    clientId: str
+    status: str = SweepStatuses.Planned
+    transId: Optional[int] = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class AccountResult:
+    """
+    An instance of a result of a function called for an account.
+
+    Attributes:
+        account (str): account name.
+        result (Any): the returned value. (None)
+        error (Optional[str]): the raised exception if the function failed. (None)
+
+    """
+    account: str
+    result: Any = None
+    error: Optional[str] = None
+
+
 @dataclass
 class AccountType(StateName):
     """
@@ -0,0 +1,297 @@
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import Optional, Dict, Union, Tuple, Any, TYPE_CHECKING
+from urllib.parse import urlencode
+
+from aiohttp import TCPConnector
+from pretty_utils.miscellaneous.http import aiohttp_params
+
+from py_okx_async.Base import Base
+from py_okx_async.Deadline import Deadline
+from py_okx_async.RateLimiter import RateLimiter
+from py_okx_async.models import Methods, OKXCredentials, DNSSettings
+from py_okx_async.public.models import InstrumentTypes, Ticker, Instrument
+
+if TYPE_CHECKING:
+    from aiohttp_socks import ProxyConnector
+
+
+class Public(Base):
+    """
+    The class contains functions of public endpoints that don't require an API key.
+
+    Requests aren't signed, use keep-alive connections of a pool shared by all instances of the class and a rate
+    limiter shared by all instances since public endpoints are limited by IP. Responses can be cached for a time.
+
+    Attributes:
+        section (str): a section name.
+        shared_rate_limiter (RateLimiter): the rate limiter shared by all instances.
+        connectors (weakref.WeakKeyDictionary): keep-alive connectors by proxies and DNS settings by event loops.
+        cache (OrderedDict): expiration monotonic times and responses by entrypoint URLs, request paths and
+            parameters from the least recently used ones.
+        cache_size (int): the maximum number of cached responses, the least recently used ones are evicted.
+        cache_ttls (Dict[str, float]): default times in seconds for which responses are cached by request paths.
+        in_flight (weakref.WeakKeyDictionary): running requests of cached endpoints by entrypoint URLs, request paths
+            and parameters by event loops, identical requests wait for the same one.
+
+    """
+    section: str = 'public'
+    shared_rate_limiter: RateLimiter = RateLimiter()
+    connectors: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    cache: 'OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]' = OrderedDict()
+    cache_size: int = 1024
+    cache_ttls: Dict[str, float] = {
+        '/api/v5/public/time': 0,
+        '/api/v5/public/instruments': 60,
+        '/api/v5/market/tickers': 1,
+        '/api/v5/market/ticker': 1,
+    }
+    in_flight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __init__(
+            self, entrypoint_url: str = 'https://www.okx.com', proxy: Optional[str] = None,
+            credentials: Optional[OKXCredentials] = None, rate_limiter: Optional[RateLimiter] = None, **kwargs
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            entrypoint_url (str): an API entrypoint url. (https://www.okx.com)
+            proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy in the same formats as the client proxy. (None)
+            credentials (Optional[OKXCredentials]): ignored, requests aren't signed. (None)
+            rate_limiter (Optional[RateLimiter]): ignored, the rate limiter shared by all instances is used. (None)
+            kwargs: other arguments of the Base class.
+
+        """
+        super().__init__(
+            credentials=None, entrypoint_url=entrypoint_url, proxy=proxy, rate_limiter=Public.shared_rate_limiter,
+            **kwargs
+        )
+
+    @staticmethod
+    def build_connector(
+            proxy: Optional[str] = None, dns: Optional[DNSSettings] = None
+    ) -> Union['ProxyConnector', TCPConnector]:
+        """
+        Get a keep-alive connector of the current event loop shared by all instances, build it if there isn't one.
+
+        Args:
+            proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy. (None)
+            dns (Optional[DNSSettings]): settings of resolving hosts of the API and proxies. (getaddrinfo
+                in the thread pool with a 300-second cache)
+
+        Returns:
+            Union[ProxyConnector, TCPConnector]: the connector.
+
+        """
+        loop = asyncio.get_event_loop()
+        connectors = Public.connectors.setdefault(loop, {})
+        connector = connectors.get((proxy, dns))
+        if connector and not connector.closed:
+            return connector
+
+        resolver = None
+        if dns:
+            from py_okx_async.Resolver import Resolver
+
+            resolver = Resolver.shared(settings=dns)
+
+        if proxy and resolver:
+            from py_okx_async.ResolvingProxyConnector import ResolvingProxyConnector
+
+            connector = ResolvingProxyConnector.from_url(
+                url=proxy.replace('socks5h', 'socks5'), rdns=True, keepalive_timeout=30, proxy_resolver=resolver
+            )
+
+        elif proxy:
+            from aiohttp_socks import ProxyConnector
+
+            connector = ProxyConnector.from_url(url=proxy.replace('socks5h', 'socks5'), rdns=True, keepalive_timeout=30)
+
+        elif resolver:
+            connector = TCPConnector(resolver=resolver, ttl_dns_cache=dns.cache_ttl, keepalive_timeout=30)
+
+        else:
+            connector = TCPConnector(ttl_dns_cache=300, keepalive_timeout=30)
+
+        connectors[(proxy, dns)] = connector
+        return connector
+
+    @staticmethod
+    async def close_connectors() -> None:
+        """
+        Close keep-alive connectors of the current event loop, e.g. before the loop is closed.
+        """
+        for connector in Public.connectors.pop(asyncio.get_event_loop(), {}).values():
+            await connector.close()
+
+    async def signed_headers(self, method: str, request_path: str, body: Union[dict, str]) -> Dict[str, str]:
+        return {'Content-Type': 'application/json'}
+
+    async def make_request(
+            self, method: str, request_path: str, body: Optional[dict] = None, deadline: Optional[Deadline] = None,
+            priority: Optional[int] = None, cache_ttl: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make a request to the OKX API or get a cached response.
+
+        Args:
+            method (str): the request method is either GET or POST.
+            request_path (str): the path of requesting an endpoint.
+            body (Optional[dict]): request parameters. (None)
+            deadline (Optional[Deadline]): a deadline of the request. (the one of the current context)
+            priority (Optional[int]): the priority class of the request, one of Priorities. (the one of the current
+                context or normal)
+            cache_ttl (Optional[float]): the time in seconds for which the response is cached, GET requests only.
+                (Public.cache_ttls)
+
+        Returns:
+            Optional[Dict[str, Any]]: the request response.
+
+        """
+        cache_ttl = Public.cache_ttls.get(request_path, 0) if cache_ttl is None else cache_ttl
+        if method.upper() != Methods.GET or not cache_ttl:
+            return await super().make_request(
+                method=method, request_path=request_path, body=body, deadline=deadline, priority=priority
+            )
+
+        key = (self.entrypoint_url, request_path, urlencode(query=body) if body else '')
+        cached = Public.cache.get(key)
+        if cached:
+            if cached[0] > time.monotonic():
+                Public.cache.move_to_end(key)
+                return cached[1]
+
+            del Public.cache[key]
+
+        requests = Public.in_flight.setdefault(asyncio.get_event_loop(), {})
+        request = requests.get(key)
+        if not request:
+            request = asyncio.ensure_future(super().make_request(
+                method=method, request_path=request_path, body=body, deadline=deadline, priority=priority
+            ))
+            requests[key] = request
+            request.add_done_callback(
+                lambda task: Public.store(key=key, cache_ttl=cache_ttl, task=task, requests=requests)
+            )
+
+        return await asyncio.shield(request)
+
+    @staticmethod
+    def store(
+            key: Tuple[str, str, str], cache_ttl: float, task: asyncio.Future, requests: Dict[tuple, asyncio.Future]
+    ) -> None:
+        """
+        Forget a finished request and cache its response, evicting the least recently used responses if the cache
+        is full.
+
+        Args:
+            key (Tuple[str, str, str]): the entrypoint URL, the request path and parameters.
+            cache_ttl (float): the time in seconds for which the response is cached.
+            task (asyncio.Future): the finished request.
+            requests (Dict[tuple, asyncio.Future]): running requests of the event loop.
+
+        """
+        if requests.get(key) is task:
+            del requests[key]
+
+        if task.cancelled() or task.exception():
+            return
+
+        Public.cache[key] = (time.monotonic() + cache_ttl, task.result())
+        Public.cache.move_to_end(key)
+        while len(Public.cache) > Public.cache_size:
+            Public.cache.popitem(last=False)
+
+    async def time(self) -> int:
+        """
+        Get the system time of the exchange.
+
+        Returns:
+            int: the system time, Unix timestamp format in milliseconds.
+
+        """
+        method = 'time'
+        response = await self.make_request(method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}')
+        return int(response.get('data')[0].get('ts'))
+
+    async def tickers(
+            self, instType: str = InstrumentTypes.Spot, uly: Optional[str] = None, instFamily: Optional[str] = None,
+            cache_ttl: Optional[float] = None
+    ) -> Dict[str, Ticker]:
+        """
+        Get tickers of all instruments of the type.
+
+        Args:
+            instType (str): instrument type, one of InstrumentTypes. (SPOT)
+            uly (Optional[str]): underlying, e.g. BTC-USD. Only applicable to FUTURES/SWAP/OPTION. (None)
+            instFamily (Optional[str]): instrument family, e.g. BTC-USD. Only applicable to FUTURES/SWAP/OPTION. (None)
+            cache_ttl (Optional[float]): the time in seconds for which the response is cached. (1)
+
+        Returns:
+            Dict[str, Ticker]: the tickers by instrument IDs.
+
+        """
+        body = {
+            'instType': instType,
+            'uly': uly,
+            'instFamily': instFamily
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path='/api/v5/market/tickers', body=aiohttp_params(body), cache_ttl=cache_ttl
+        )
+        return {ticker.get('instId'): Ticker(data=ticker) for ticker in response.get('data')}
+
+    async def ticker(self, instId: str, cache_ttl: Optional[float] = None) -> Optional[Ticker]:
+        """
+        Get a ticker of the instrument.
+
+        Args:
+            instId (str): instrument ID, e.g. BTC-USDT.
+            cache_ttl (Optional[float]): the time in seconds for which the response is cached. (1)
+
+        Returns:
+            Optional[Ticker]: the ticker.
+
+        """
+        body = {
+            'instId': instId
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path='/api/v5/market/ticker', body=body, cache_ttl=cache_ttl
+        )
+        if response.get('data'):
+            return Ticker(data=response.get('data')[0])
+
+    async def instruments(
+            self, instType: str = InstrumentTypes.Spot, uly: Optional[str] = None, instFamily: Optional[str] = None,
+            instId: Optional[str] = None, cache_ttl: Optional[float] = None
+    ) -> Dict[str, Instrument]:
+        """
+        Get instruments of the type.
+
+        Args:
+            instType (str): instrument type, one of InstrumentTypes. (SPOT)
+            uly (Optional[str]): underlying, e.g. BTC-USD. Only applicable to FUTURES/SWAP/OPTION. (None)
+            instFamily (Optional[str]): instrument family, e.g. BTC-USD. Only applicable to FUTURES/SWAP/OPTION. (None)
+            instId (Optional[str]): instrument ID, e.g. BTC-USDT. (absolutely all)
+            cache_ttl (Optional[float]): the time in seconds for which the response is cached. (60)
+
+        Returns:
+            Dict[str, Instrument]: the instruments by instrument IDs.
+
+        """
+        method = 'instruments'
+        body = {
+            'instType': instType,
+            'uly': uly,
+            'instFamily': instFamily,
+            'instId': instId
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path=f'/api/v5/{self.section}/{method}', body=aiohttp_params(body),
+            cache_ttl=cache_ttl
+        )
+        return {instrument.get('instId'): Instrument(data=instrument) for instrument in response.get('data')}
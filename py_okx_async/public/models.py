@@ -0,0 +1,123 @@
+from typing import Dict, Any, Optional
+
+from py_okx_async.models import ReprWithoutData
+
+
+class InstrumentTypes:
+    """
+    An instance with all instrument types.
+    """
+    Spot = 'SPOT'
+    Margin = 'MARGIN'
+    Swap = 'SWAP'
+    Futures = 'FUTURES'
+    Option = 'OPTION'
+
+
+class Ticker(ReprWithoutData):
+    """
+    An instance of a ticker.
+
+    Attributes:
+        data (Dict[str, Any]): the raw data.
+        instType (str): instrument type, one of InstrumentTypes.
+        instId (str): instrument ID, e.g. BTC-USDT.
+        last (Optional[float]): last traded price.
+        lastSz (Optional[float]): last traded size.
+        askPx (Optional[float]): best ask price.
+        askSz (Optional[float]): best ask size.
+        bidPx (Optional[float]): best bid price.
+        bidSz (Optional[float]): best bid size.
+        open24h (Optional[float]): open price in the past 24 hours.
+        high24h (Optional[float]): highest price in the past 24 hours.
+        low24h (Optional[float]): lowest price in the past 24 hours.
+        volCcy24h (Optional[float]): 24h trading volume, with a unit of currency. If it is a spot instrument,
+            the unit is quote currency.
+        vol24h (Optional[float]): 24h trading volume, with a unit of contract. If it is a spot instrument, the unit
+            is base currency.
+        sodUtc0 (Optional[float]): open price in the UTC 0.
+        sodUtc8 (Optional[float]): open price in the UTC 8.
+        ts (int): ticker data generation time, Unix timestamp format in seconds.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with a ticker data.
+
+        """
+        self.data: Dict[str, Any] = data
+        self.instType: str = data.get('instType')
+        self.instId: str = data.get('instId')
+        self.last: Optional[float] = float(data.get('last')) if data.get('last') else None
+        self.lastSz: Optional[float] = float(data.get('lastSz')) if data.get('lastSz') else None
+        self.askPx: Optional[float] = float(data.get('askPx')) if data.get('askPx') else None
+        self.askSz: Optional[float] = float(data.get('askSz')) if data.get('askSz') else None
+        self.bidPx: Optional[float] = float(data.get('bidPx')) if data.get('bidPx') else None
+        self.bidSz: Optional[float] = float(data.get('bidSz')) if data.get('bidSz') else None
+        self.open24h: Optional[float] = float(data.get('open24h')) if data.get('open24h') else None
+        self.high24h: Optional[float] = float(data.get('high24h')) if data.get('high24h') else None
+        self.low24h: Optional[float] = float(data.get('low24h')) if data.get('low24h') else None
+        self.volCcy24h: Optional[float] = float(data.get('volCcy24h')) if data.get('volCcy24h') else None
+        self.vol24h: Optional[float] = float(data.get('vol24h')) if data.get('vol24h') else None
+        self.sodUtc0: Optional[float] = float(data.get('sodUtc0')) if data.get('sodUtc0') else None
+        self.sodUtc8: Optional[float] = float(data.get('sodUtc8')) if data.get('sodUtc8') else None
+        self.ts: int = data.get('ts')
+        self.ts = int(int(self.ts) / 1000) if self.ts else 0
+
+
+class Instrument(ReprWithoutData):
+    """
+    An instance of an instrument.
+
+    Attributes:
+        data (Dict[str, Any]): the raw data.
+        instType (str): instrument type, one of InstrumentTypes.
+        instId (str): instrument ID, e.g. BTC-USDT.
+        uly (Optional[str]): underlying, e.g. BTC-USD. Only applicable to FUTURES/SWAP/OPTION.
+        instFamily (Optional[str]): instrument family, e.g. BTC-USD. Only applicable to FUTURES/SWAP/OPTION.
+        baseCcy (Optional[str]): base currency, e.g. BTC in BTC-USDT. Only applicable to SPOT/MARGIN.
+        quoteCcy (Optional[str]): quote currency, e.g. USDT in BTC-USDT. Only applicable to SPOT/MARGIN.
+        settleCcy (Optional[str]): settlement and margin currency, e.g. BTC. Only applicable to FUTURES/SWAP/OPTION.
+        ctVal (Optional[float]): contract value. Only applicable to FUTURES/SWAP/OPTION.
+        listTime (int): listing time, Unix timestamp format in seconds.
+        expTime (int): expiry time, Unix timestamp format in seconds. Only applicable to FUTURES/OPTION.
+        lever (Optional[float]): max leverage. Not applicable to SPOT and OPTION.
+        tickSz (float): tick size, e.g. 0.0001.
+        lotSz (float): lot size.
+        minSz (float): minimum order size.
+        maxMktSz (Optional[float]): the maximum order quantity of a single market order.
+        state (str): instrument status: live, suspend, preopen, test.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with an instrument data.
+
+        """
+        self.data: Dict[str, Any] = data
+        self.instType: str = data.get('instType')
+        self.instId: str = data.get('instId')
+        self.uly: Optional[str] = data.get('uly') if data.get('uly') else None
+        self.instFamily: Optional[str] = data.get('instFamily') if data.get('instFamily') else None
+        self.baseCcy: Optional[str] = data.get('baseCcy') if data.get('baseCcy') else None
+        self.quoteCcy: Optional[str] = data.get('quoteCcy') if data.get('quoteCcy') else None
+        self.settleCcy: Optional[str] = data.get('settleCcy') if data.get('settleCcy') else None
+        self.ctVal: Optional[float] = float(data.get('ctVal')) if data.get('ctVal') else None
+        self.listTime: int = data.get('listTime')
+        self.listTime = int(int(self.listTime) / 1000) if self.listTime else 0
+        self.expTime: int = data.get('expTime')
+        self.expTime = int(int(self.expTime) / 1000) if self.expTime else 0
+        self.lever: Optional[float] = float(data.get('lever')) if data.get('lever') else None
+        self.tickSz: float = float(data.get('tickSz'))
+        self.lotSz: float = float(data.get('lotSz'))
+        self.minSz: float = float(data.get('minSz'))
+        self.maxMktSz: Optional[float] = float(data.get('maxMktSz')) if data.get('maxMktSz') else None
+        self.state: str = data.get('state')
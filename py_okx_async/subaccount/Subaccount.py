@@ -1,11 +1,16 @@
-from typing import Optional, Dict
+import asyncio
+from typing import Optional, Dict, Union, Iterable, AsyncIterator, TYPE_CHECKING
 
 from pretty_utils.miscellaneous.http import aiohttp_params
 
 from py_okx_async.Base import Base
-from py_okx_async.models import Methods, FundingToken
+from py_okx_async.models import Methods, FundingToken, TradingToken
 from py_okx_async.subaccount.models import SubaccountInfo
-from py_okx_async.utils import secs_to_millisecs
+from py_okx_async.utils import secs_to_millisecs, split_token_symbols
+
+if TYPE_CHECKING:
+    from py_okx_async.asset.BalanceTracker import BalanceTracker
+    from py_okx_async.subaccount.SubaccountDirectory import SubaccountDirectory
 
 
 class Subaccount(Base):
@@ -14,9 +19,15 @@ class Subaccount(Base):
 
     Attributes:
         section (str): a section name.
+        directory (Optional[SubaccountDirectory]): a cache of sub-accounts used by fan-outs of the client instead
+            of requesting them.
+        balance_tracker (Optional[BalanceTracker]): a tracker that observes all balances of funding accounts
+            of sub-accounts whenever they are requested.
 
     """
     section: str = 'subaccount'
+    directory: Optional['SubaccountDirectory'] = None
+    balance_tracker: Optional['BalanceTracker'] = None
 
     async def list(
             self, enable: Optional[bool] = None, subAcct: Optional[str] = None, after: Optional[int] = None,
@@ -60,20 +71,70 @@ class Subaccount(Base):
 
         return subaccounts
 
-    async def asset_balances(self, subAcct: str, token_symbol: Optional[str] = None) -> Dict[str, FundingToken]:
+    async def iter_list(
+            self, enable: Optional[bool] = None, after: Optional[int] = None, before: Optional[int] = None
+    ) -> AsyncIterator[SubaccountInfo]:
+        """
+        Iterate over sub-accounts from newer to earlier ones requesting pages one by one.
+
+        Args:
+            enable (Optional[bool]): sub-account status. true: Normal false: Frozen. (absolutely all)
+            after (Optional[int]): return sub-accounts created earlier than the requested time, Unix timestamp
+                in second or millisecond format. (None)
+            before (Optional[int]): return sub-accounts created later than the requested time, Unix timestamp
+                in millisecond format. (None)
+
+        Returns:
+            AsyncIterator[SubaccountInfo]: the iterator of sub-accounts.
+
+        """
+        limit = 100
+        boundary_names = set()
+        if after:
+            after = await secs_to_millisecs(secs=after)
+
+        while True:
+            subaccounts = await self.list(enable=enable, after=after, before=before, limit=limit)
+            for name, info in subaccounts.items():
+                if name not in boundary_names:
+                    yield info
+
+            # The boundary millisecond is requested again since sub-accounts sharing it may be cut off by the page.
+            oldest = min((int(info.data.get('ts')) for info in subaccounts.values()), default=None)
+            if len(subaccounts) < limit or (after and oldest + 1 >= after):
+                return
+
+            boundary_names = {name for name, info in subaccounts.items() if int(info.data.get('ts')) == oldest}
+            after = oldest + 1
+
+    async def asset_balances(
+            self, subAcct: str, token_symbol: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, FundingToken]:
         """
         Get a dictionary with tokens and their balances in the funding account of a sub-account.
 
         Args:
             subAcct (str): sub-account name.
-            token_symbol (Optional[str]): single or multiple token symbol (no more than 20) separated
-                with comma, e.g. BTC or BTC,ETH. (absolutely all)
+            token_symbol (Optional[Union[str, Iterable[str]]]): single or multiple token symbol separated
+                with comma, e.g. BTC or BTC,ETH, or an iterable of them. More than 20 token symbols are requested
+                concurrently in chunks. (absolutely all)
 
         Returns:
             Dict[str, FundingToken]: the dictionary with tokens and their balances in the funding account
                 of a sub-account.
 
         """
+        chunks = split_token_symbols(token_symbol=token_symbol)
+        if len(chunks) > 1:
+            tokens = {}
+            for chunk_tokens in await asyncio.gather(
+                    *(self.asset_balances(subAcct=subAcct, token_symbol=chunk) for chunk in chunks)
+            ):
+                tokens.update(chunk_tokens)
+
+            return tokens
+
+        token_symbol = chunks[0]
         method = 'balances'
         body = {
             'subAcct': subAcct,
@@ -86,4 +147,33 @@ class Subaccount(Base):
         for token in response.get('data'):
             tokens[token.get('ccy')] = FundingToken(data=token)
 
+        if self.balance_tracker and not token_symbol:
+            self.balance_tracker.observe(account=subAcct, tokens=tokens)
+
+        return tokens
+
+    async def trading_balances(self, subAcct: str) -> Dict[str, TradingToken]:
+        """
+        Get a dictionary with tokens and their balances in the trading account of a sub-account.
+
+        Args:
+            subAcct (str): sub-account name.
+
+        Returns:
+            Dict[str, TradingToken]: the dictionary with tokens and their balances in the trading account
+                of a sub-account.
+
+        """
+        method = 'balances'
+        body = {
+            'subAcct': subAcct
+        }
+        response = await self.make_request(
+            method=Methods.GET, request_path=f'/api/v5/account/{self.section}/{method}', body=aiohttp_params(body)
+        )
+        tokens = {}
+        for account in response.get('data'):
+            for token in account.get('details'):
+                tokens[token.get('ccy')] = TradingToken(data=token)
+
         return tokens
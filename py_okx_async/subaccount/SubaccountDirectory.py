@@ -0,0 +1,208 @@
+import asyncio
+import time
+from typing import Optional, Dict, Set, TYPE_CHECKING
+
+from py_okx_async.subaccount.models import SubaccountInfo, SubaccountType
+
+if TYPE_CHECKING:
+    from py_okx_async.subaccount.Subaccount import Subaccount
+
+
+class SubaccountDirectory:
+    """
+    The cache of sub-accounts with O(1) lookups by names and types that is refreshed incrementally.
+
+    After the first full load only sub-accounts created later than the newest known one are requested when the cache
+    is older than the TTL, and statuses are re-validated by requesting only frozen sub-accounts. Cached sub-accounts
+    are returned immediately and refreshed in the background, only the first load and lookups of unknown names wait
+    for requests:
+
+        okx_client.subaccount.directory = SubaccountDirectory(subaccount=okx_client.subaccount)
+        info = await okx_client.subaccount.directory.get(name='sub1')
+
+    Attributes:
+        subaccount (Subaccount): an instance of the 'subaccount' section.
+        ttl (float): the age in seconds after which new sub-accounts are requested.
+        validation_interval (float): the interval in seconds between re-validations of statuses.
+        miss_interval (float): the minimum age in seconds of the cache for a lookup of an unknown name to wait for
+            a refresh.
+        subaccounts (Dict[str, SubaccountInfo]): sub-accounts by names.
+        types (Dict[str, Dict[str, SubaccountInfo]]): sub-accounts by names by states of types.
+        frozen (Set[str]): names of frozen sub-accounts.
+        newest (int): the creation time of the newest known sub-account, Unix timestamp format in milliseconds.
+        loaded (bool): whether all sub-accounts were loaded.
+        refreshed_at (float): the monotonic time of the end of the last refresh.
+        validated_at (float): the monotonic time of the last re-validation of statuses.
+        refresh_task (Optional[asyncio.Task]): the running refresh.
+
+    """
+    subaccount: 'Subaccount'
+    ttl: float
+    validation_interval: float
+    miss_interval: float = 1.0
+    subaccounts: Dict[str, SubaccountInfo]
+    types: Dict[str, Dict[str, SubaccountInfo]]
+    frozen: Set[str]
+    newest: int
+    loaded: bool
+    refreshed_at: float
+    validated_at: float
+    refresh_task: Optional[asyncio.Task]
+
+    def __init__(self, subaccount: 'Subaccount', ttl: float = 60, validation_interval: float = 300) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            subaccount (Subaccount): an instance of the 'subaccount' section.
+            ttl (float): the age in seconds after which new sub-accounts are requested. (60)
+            validation_interval (float): the interval in seconds between re-validations of statuses. (300)
+
+        """
+        self.subaccount = subaccount
+        self.ttl = ttl
+        self.validation_interval = validation_interval
+        self.subaccounts = {}
+        self.types = {}
+        self.frozen = set()
+        self.newest = 0
+        self.loaded = False
+        self.refreshed_at = 0.0
+        self.validated_at = 0.0
+        self.refresh_task = None
+
+    def add(self, info: SubaccountInfo) -> None:
+        """
+        Add a sub-account to indexes or replace it.
+
+        Args:
+            info (SubaccountInfo): the sub-account.
+
+        """
+        previous = self.subaccounts.get(info.subAcct)
+        if previous and previous.type:
+            self.types.get(previous.type.state, {}).pop(info.subAcct, None)
+
+        self.subaccounts[info.subAcct] = info
+        if info.type:
+            self.types.setdefault(info.type.state, {})[info.subAcct] = info
+
+        if info.enable:
+            self.frozen.discard(info.subAcct)
+
+        else:
+            self.frozen.add(info.subAcct)
+
+        self.newest = max(self.newest, int(info.data.get('ts')))
+
+    async def refresh(self) -> None:
+        """
+        Load all sub-accounts or request ones created later than the newest known one, re-validate statuses if it's
+        time.
+        """
+        started = time.monotonic()
+        if not self.loaded or not self.newest:
+            async for info in self.subaccount.iter_list():
+                self.add(info=info)
+
+            self.loaded = True
+            self.validated_at = started
+
+        else:
+            # Sub-accounts created in the same millisecond as the newest known one are requested again.
+            async for info in self.subaccount.iter_list(before=self.newest - 1):
+                if info.subAcct not in self.subaccounts:
+                    self.add(info=info)
+
+            if started - self.validated_at > self.validation_interval:
+                await self.validate()
+                self.validated_at = started
+
+        self.refreshed_at = time.monotonic()
+
+    async def validate(self) -> None:
+        """
+        Update statuses of sub-accounts requesting only frozen ones.
+        """
+        frozen = {info.subAcct: info async for info in self.subaccount.iter_list(enable=False)}
+        for name in self.frozen - set(frozen):
+            if name in self.subaccounts:
+                self.add(info=SubaccountInfo(data={**self.subaccounts[name].data, 'enable': True}))
+
+        for info in frozen.values():
+            self.add(info=info)
+
+    async def ensure(self, max_age: Optional[float] = None) -> None:
+        """
+        Start a background refresh if the cache is older than the maximum age, wait for it only if there is no cache.
+
+        Args:
+            max_age (Optional[float]): the maximum age of the cache in seconds. (the TTL)
+
+        """
+        max_age = self.ttl if max_age is None else max_age
+        if not self.refresh_task and (not self.loaded or time.monotonic() - self.refreshed_at > max_age):
+            self.refresh_task = asyncio.ensure_future(self.refresh())
+            self.refresh_task.add_done_callback(self.refreshed)
+
+        if not self.loaded:
+            await asyncio.shield(self.refresh_task)
+
+    def refreshed(self, task: asyncio.Task) -> None:
+        """
+        Forget the finished background refresh, a failed one is retried on the next access.
+
+        Args:
+            task (asyncio.Task): the refresh task.
+
+        """
+        if not task.cancelled():
+            task.exception()
+
+        self.refresh_task = None
+
+    async def get(self, name: str) -> Optional[SubaccountInfo]:
+        """
+        Get a sub-account, an unknown name waits for a refresh if the cache is older than the miss interval.
+
+        Args:
+            name (str): sub-account name.
+
+        Returns:
+            Optional[SubaccountInfo]: the sub-account.
+
+        """
+        await self.ensure()
+        info = self.subaccounts.get(name)
+        if not info and time.monotonic() - self.refreshed_at > self.miss_interval:
+            await self.ensure(max_age=self.miss_interval)
+            if self.refresh_task:
+                await asyncio.shield(self.refresh_task)
+
+            info = self.subaccounts.get(name)
+
+        return info
+
+    async def list(
+            self, enable: Optional[bool] = None, type: Optional[SubaccountType] = None
+    ) -> Dict[str, SubaccountInfo]:
+        """
+        Get sub-accounts from the cache.
+
+        Args:
+            enable (Optional[bool]): sub-account status. true: Normal false: Frozen. (absolutely all)
+            type (Optional[SubaccountType]): sub-account type. (absolutely all)
+
+        Returns:
+            Dict[str, SubaccountInfo]: sub-accounts by names.
+
+        """
+        await self.ensure()
+        subaccounts = self.types.get(type.state, {}) if type else self.subaccounts
+        if enable is None:
+            return dict(subaccounts)
+
+        if enable is False and not type:
+            return {name: self.subaccounts[name] for name in self.frozen}
+
+        return {name: info for name, info in subaccounts.items() if (name not in self.frozen) == enable}
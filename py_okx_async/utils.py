@@ -1,13 +1,75 @@
-from typing import Optional, Union
-
-import aiohttp
-from aiohttp_socks import ProxyConnector
+import asyncio
+import json
+from typing import Optional, Union, Iterable, List, Dict, Any, Callable, Awaitable, TYPE_CHECKING
+from urllib.parse import urlencode
 
 from py_okx_async import exceptions
+from py_okx_async.models import Methods, TransportRequest, Timeouts
+
+if TYPE_CHECKING:
+    from aiohttp_socks import ProxyConnector
+
+
+async def async_request(
+        method: str, url: str, headers: Optional[dict] = None, connector: Optional['ProxyConnector'] = None, **kwargs
+) -> Optional[dict]:
+    """
+    Make an asynchronous request with the aiohttp transport, the one clients use by default.
+
+    Args:
+        method (str): the request method is either GET or POST.
+        url (str): a URL.
+        headers (Optional[dict]): headers. (None)
+        connector (Optional[ProxyConnector]): a connector. (None)
+        kwargs: arguments of a request, 'params', 'data', 'json' or 'timeout'. The timeout is a number of seconds
+            of the whole request, Timeouts or aiohttp ClientTimeout.
+
+    Returns:
+        Optional[dict]: a JSON response to request.
+
+    Raises:
+        TypeError: if other arguments are passed.
+
+    """
+    from py_okx_async.Transport import AiohttpTransport
+
+    unsupported = set(kwargs) - {'params', 'data', 'json', 'timeout'}
+    if unsupported:
+        raise TypeError(f'Unsupported arguments of a request: {", ".join(sorted(unsupported))}!')
+
+    timeout = kwargs.get('timeout')
+    timeouts = None
+    if isinstance(timeout, Timeouts):
+        timeouts = timeout
+
+    elif isinstance(timeout, (int, float)):
+        timeouts = Timeouts(total=timeout, connect=timeout, read=timeout)
+
+    elif timeout is not None:
+        timeouts = Timeouts(total=timeout.total, connect=timeout.sock_connect, read=timeout.sock_read)
+
+    headers = dict(headers) if headers else {}
+    body = kwargs.get('data')
+    if kwargs.get('json') is not None:
+        body = json.dumps(kwargs['json'])
+        headers.setdefault('Content-Type', 'application/json')
+
+    if kwargs.get('params'):
+        url = f'{url}{"&" if "?" in url else "?"}{urlencode(kwargs["params"])}'
+
+    response = await AiohttpTransport().send(request=TransportRequest(
+        method=method, url=url, headers=headers, body=body.encode() if isinstance(body, str) else body,
+        timeouts=timeouts, connector=connector
+    ))
+    data = json.loads(response.content)
+    if response.status_code <= 201:
+        return data
+
+    raise exceptions.APIException(response=data, status_code=response.status_code)
 
 
 async def async_get(
-        url: str, headers: Optional[dict] = None, connector: Optional[ProxyConnector] = None, **kwargs
+        url: str, headers: Optional[dict] = None, connector: Optional['ProxyConnector'] = None, **kwargs
 ) -> Optional[dict]:
     """
     Make asynchronous GET request.
@@ -16,24 +78,17 @@ async def async_get(
         url (str): a URL.
         headers (Optional[dict]): headers. (None)
         connector (Optional[ProxyConnector]): a connector. (None)
-        kwargs: arguments for a GET request, e.g. 'params', 'data' or 'json'.
+        kwargs: arguments for a GET request, 'params', 'data', 'json' or 'timeout'.
 
     Returns:
         Optional[dict]: a JSON response to request.
 
     """
-    async with aiohttp.ClientSession(headers=headers, connector=connector, connector_owner=False) as session:
-        async with session.get(url=url, **kwargs) as response:
-            status_code = response.status
-            response = await response.json(encoding='utf-8')
-            if status_code <= 201:
-                return response
-
-            raise exceptions.APIException(response=response, status_code=status_code)
+    return await async_request(method=Methods.GET, url=url, headers=headers, connector=connector, **kwargs)
 
 
 async def async_post(
-        url: str, headers: Optional[dict] = None, connector: Optional[ProxyConnector] = None, **kwargs
+        url: str, headers: Optional[dict] = None, connector: Optional['ProxyConnector'] = None, **kwargs
 ) -> Optional[dict]:
     """
     Make asynchronous POST request.
@@ -42,22 +97,124 @@ async def async_post(
         url (str): a URL.
         headers (Optional[dict]): headers. (None)
         connector (Optional[ProxyConnector]): a connector. (None)
-        kwargs: arguments for a POST request, e.g. 'params', 'data' or 'json'.
+        kwargs: arguments for a POST request, 'params', 'data', 'json' or 'timeout'.
 
     Returns:
         Optional[dict]: a JSON response to request.
 
     """
-    async with aiohttp.ClientSession(headers=headers, connector=connector, connector_owner=False) as session:
-        async with session.post(url=url, **kwargs) as response:
-            status_code = response.status
-            response = await response.json(encoding='utf-8')
-            if status_code <= 201:
-                return response
-
-            raise exceptions.APIException(response=response, status_code=status_code)
+    return await async_request(method=Methods.POST, url=url, headers=headers, connector=connector, **kwargs)
 
 
 async def secs_to_millisecs(secs: Union[int, float, str]) -> int:
     secs = int(secs)
     return secs * 1000 if len(str(secs)) == 10 else secs
+
+
+def split_token_symbols(token_symbol: Optional[Union[str, Iterable[str]]], size: int = 20) -> List[Optional[str]]:
+    """
+    Split token symbols into comma-separated chunks that an endpoint accepts in a single request.
+
+    Args:
+        token_symbol (Optional[Union[str, Iterable[str]]]): token symbols separated with comma or an iterable of them.
+        size (int): the maximum number of token symbols in a chunk. (20)
+
+    Returns:
+        List[Optional[str]]: the chunks, [None] if token symbols aren't specified.
+
+    """
+    if token_symbol is None:
+        return [None]
+
+    if isinstance(token_symbol, str):
+        token_symbol = token_symbol.split(',')
+
+    token_symbols = list(dict.fromkeys(symbol.strip() for symbol in token_symbol if symbol and symbol.strip()))
+    if not token_symbols:
+        return [None]
+
+    return [','.join(token_symbols[i:i + size]) for i in range(0, len(token_symbols), size)]
+
+
+async def backfill(
+        fetch: Callable[[int, int], Awaitable[Dict[int, Any]]], start: int, end: int, windows: int = 8,
+        limit: int = 100
+) -> Dict[int, Any]:
+    """
+    Fetch all records of a time range by splitting it into windows that are fetched concurrently.
+
+    A window that returns a full page is split again, only its part that is earlier than the oldest returned record
+    is requested.
+
+    Args:
+        fetch (Callable[[int, int], Awaitable[Dict[int, Any]]]): a function that accepts 'after' and 'before'
+            timestamps in milliseconds and returns records with the raw 'ts' in their 'data' by IDs.
+        start (int): the start of the range, Unix timestamp format in milliseconds, inclusive.
+        end (int): the end of the range, Unix timestamp format in milliseconds, exclusive.
+        windows (int): the number of windows the range is initially split into. (8)
+        limit (int): the number of records in a full page. (100)
+
+    Returns:
+        Dict[int, Any]: the records by IDs from newer to earlier ones.
+
+    """
+
+    async def fetch_window(lower: int, upper: int) -> Dict[int, Any]:
+        records = await fetch(upper, lower - 1)
+        if len(records) < limit:
+            return records
+
+        upper = min(int(record.data.get('ts')) for record in records.values()) + 1
+        if upper - lower <= 1:
+            return records
+
+        middle = (lower + upper) // 2
+        for window_records in await asyncio.gather(fetch_window(lower, middle), fetch_window(middle, upper)):
+            records.update(window_records)
+
+        return records
+
+    step = max(1, -(-(end - start) // max(1, windows)))
+    records = {}
+    for window_records in await asyncio.gather(
+            *(fetch_window(lower, min(lower + step, end)) for lower in range(start, end, step))
+    ):
+        records.update(window_records)
+
+    return dict(sorted(records.items(), key=lambda item: int(item[1].data.get('ts')), reverse=True))
+
+
+def install_uvloop() -> bool:
+    """
+    Make event loops created after the call uvloop ones if uvloop is installed.
+
+    Returns:
+        bool: True if uvloop is used.
+
+    """
+    try:
+        import uvloop
+
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run(main: Awaitable[Any], use_uvloop: bool = True) -> Any:
+    """
+    Run the coroutine in a new event loop like asyncio.run, the loop is a uvloop one if uvloop is installed.
+
+    Args:
+        main (Awaitable[Any]): the coroutine.
+        use_uvloop (bool): use uvloop if it's installed. (True)
+
+    Returns:
+        Any: the result of the coroutine.
+
+    """
+    if use_uvloop:
+        install_uvloop()
+
+    return asyncio.run(main)
@@ -15,8 +15,8 @@ setup(
     long_description=long_description,
     packages=find_packages(),
     install_requires=[
-        'aiohttp', 'aiohttp-socks', 'pretty-utils @ git+https://github.com/SecorD0/pretty-utils@main', 'PySocks',
-        'python-dotenv', 'requests'
+        'aiohttp', 'aiohttp-socks>=0.8,<0.9', 'pretty-utils @ git+https://github.com/SecorD0/pretty-utils@main',
+        'PySocks', 'python-dotenv', 'requests'
     ],
     keywords=[
         'okx', 'pyokx', 'py-okx', 'okxpy', 'okx-py', 'api', 'okxapi', 'okx-api', 'api-okx', 'async-okx',
@@ -0,0 +1,91 @@
+import asyncio
+import sys
+from typing import List, Dict, Any, Awaitable
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.Transport import MockTransport
+from py_okx_async.models import OKXCredentials
+
+
+@pytest.fixture
+def transport() -> MockTransport:
+    return MockTransport()
+
+
+@pytest.fixture
+def make_client(transport: MockTransport):
+    def make(**kwargs) -> OKXClient:
+        return OKXClient(
+            credentials=OKXCredentials(api_key='key', secret_key='secret', passphrase='passphrase'),
+            transport=transport, **kwargs
+        )
+
+    return make
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = asyncio.sleep
+
+    async def no_delay(delay, *args, **kwargs):
+        return await sleep(0, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, 'sleep', no_delay)
+
+
+def query_value(value: Any) -> Any:
+    # Booleans are sent as 'true' and 'false' in query strings.
+    return str(value).lower() if isinstance(value, bool) else value
+
+
+@pytest.fixture
+def history():
+    def make(records: List[Dict[str, Any]]):
+        def handler(request):
+            query = parse_qs(urlsplit(request.url).query)
+            after = int(query['after'][0]) if 'after' in query else None
+            before = int(query['before'][0]) if 'before' in query else None
+            fields = {key: values[0] for key, values in query.items() if key not in ('after', 'before', 'limit')}
+            page = [
+                record for record in sorted(records, key=lambda record: int(record['ts']), reverse=True)
+                if (after is None or int(record['ts']) < after) and (before is None or int(record['ts']) > before)
+                and all(query_value(record.get(key)) == value for key, value in fields.items())
+            ]
+            return {'code': '0', 'msg': '', 'data': page[:int(query.get('limit', ['100'])[0])]}
+
+        return handler
+
+    return make
+
+
+@pytest.fixture
+def run():
+    def run_until_complete(okx_client: OKXClient, main: Awaitable[Any]) -> Any:
+        async def wrapper() -> Any:
+            try:
+                return await main
+
+            finally:
+                for name in OKXClient.sections:
+                    section = okx_client.__dict__.get(name)
+                    for connector in (
+                            getattr(section, 'connector', None), getattr(section, 'critical_connector', None),
+                            getattr(section, 'hedge_connector', None)
+                    ):
+                        if connector and not connector.closed:
+                            await connector.close()
+
+        return asyncio.run(wrapper())
+
+    return run_until_complete
+
+
+@pytest.fixture(autouse=True)
+def public_cache():
+    yield
+    # Responses of public endpoints are cached by the class for all clients, so they must not leak between tests.
+    if 'py_okx_async.public.Public' in sys.modules:
+        sys.modules['py_okx_async.public.Public'].Public.cache.clear()
@@ -0,0 +1,124 @@
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from py_okx_async.models import RateLimit, FundingToken, TradingToken
+
+FUNDING = '/api/v5/asset/balances'
+TRADING = '/api/v5/account/balance'
+SUBACCOUNT_FUNDING = '/api/v5/asset/subaccount/balances'
+SUBACCOUNT_TRADING = '/api/v5/account/subaccount/balances'
+SUBACCOUNT_LIST = '/api/v5/users/subaccount/list'
+LATENCY = 0.05
+
+
+def query(request) -> dict:
+    return {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+
+
+def funding(*tokens: tuple) -> dict:
+    return {
+        'code': '0', 'msg': '',
+        'data': [{'ccy': ccy, 'bal': bal, 'availBal': avail, 'frozenBal': frozen} for ccy, bal, avail, frozen in tokens]
+    }
+
+
+def trading(*tokens: tuple) -> dict:
+    return {
+        'code': '0', 'msg': '',
+        'data': [{'details': [
+            {'ccy': ccy, 'eq': eq, 'cashBal': eq, 'availBal': avail, 'frozenBal': frozen, 'uTime': '1700000000000'}
+            for ccy, eq, avail, frozen in tokens
+        ]}]
+    }
+
+
+@pytest.fixture
+def balances(transport):
+    transport.latency = LATENCY
+    transport.add(path=FUNDING, handler=lambda request: funding(('USDT', '10', '8', '2'), ('BTC', '1', '1', '0')))
+    transport.add(path=TRADING, handler=lambda request: trading(('USDT', '5', '4', '1'), ('ETH', '3', '3', '0')))
+    transport.add(
+        path=SUBACCOUNT_FUNDING,
+        handler=lambda request: funding(('USDT', '100', '100', '0')) if query(request)['subAcct'] == 'sub1' else
+        funding()
+    )
+    transport.add(path=SUBACCOUNT_TRADING, handler=lambda request: trading(('BTC', '0.5', '0.5', '0')))
+    transport.add(path=SUBACCOUNT_LIST, handler=lambda request: {
+        'code': '0', 'msg': '',
+        'data': [{'subAcct': name, 'enable': True, 'type': '1', 'label': '', 'ts': '1700000000000'}
+                 for name in ('sub1', 'sub2')] if 'after' not in query(request) else []
+    })
+
+
+@pytest.fixture
+def okx_client(make_client):
+    return make_client(rate_limits={
+        path: RateLimit(requests=1000, period=1)
+        for path in (FUNDING, TRADING, SUBACCOUNT_FUNDING, SUBACCOUNT_TRADING, SUBACCOUNT_LIST)
+    })
+
+
+def paths(transport) -> list:
+    return sorted(urlsplit(request.url).path for request in transport.requests)
+
+
+def test_trading_balances_are_parsed_and_chunked(okx_client, transport, run):
+    transport.add(path=TRADING, handler=lambda request: trading(*(
+        (ccy, '1', '1', '0') for ccy in (query(request).get('ccy') or 'USDT').split(',')
+    )))
+    token_symbols = [f'T{i}' for i in range(45)]
+
+    async def main():
+        tokens = await okx_client.account.balances(token_symbol=' BTC, ETH ,BTC')
+        assert list(tokens) == ['BTC', 'ETH']
+        assert isinstance(tokens['BTC'], TradingToken)
+        assert (tokens['BTC'].eq, tokens['BTC'].availBal, tokens['BTC'].uTime) == (1.0, 1.0, 1700000000)
+        assert list(await okx_client.account.balances(token_symbol=token_symbols)) == token_symbols
+        assert list(await okx_client.account.balances()) == ['USDT']
+
+    run(okx_client=okx_client, main=main())
+    assert [query(request).get('ccy', '').count(',') + 1 for request in transport.requests] == [2, 20, 20, 5, 1]
+
+
+def test_snapshot_merges_accounts_by_tokens(balances, okx_client, transport, run):
+    snapshot = run(okx_client=okx_client, main=okx_client.account_snapshot(subaccounts=['sub1', 'sub2']))
+    assert list(snapshot.funding) == list(snapshot.trading) == [None, 'sub1', 'sub2']
+    assert isinstance(snapshot.funding[None]['USDT'], FundingToken)
+    assert snapshot.funding['sub2'] == {}
+    master = snapshot.accounts[None]
+    assert (master['USDT'].funding, master['USDT'].trading, master['USDT'].total) == (10.0, 5.0, 15.0)
+    assert (master['USDT'].availBal, master['USDT'].frozenBal) == (12.0, 3.0)
+    assert (master['ETH'].funding, master['ETH'].trading) == (0.0, 3.0)
+    assert set(snapshot.accounts['sub2']) == {'BTC'}
+    assert {token_symbol: exposure.total for token_symbol, exposure in snapshot.tokens.items()} == {
+        'USDT': 115.0, 'BTC': 2.0, 'ETH': 3.0
+    }
+    assert paths(transport=transport) == sorted([FUNDING, TRADING] + [SUBACCOUNT_FUNDING, SUBACCOUNT_TRADING] * 2)
+
+
+def test_snapshot_is_taken_within_single_round_of_requests(balances, okx_client, run):
+    started = time.monotonic()
+    snapshot = run(okx_client=okx_client, main=okx_client.account_snapshot(subaccounts=['sub1', 'sub2']))
+    assert time.monotonic() - started < LATENCY * 2
+    assert abs(snapshot.ts - time.time() * 1000) < 5000
+    assert set(snapshot.timings) == {'funding', 'trading', 'subaccount_balances', 'total'}
+    assert snapshot.timings['total'] < LATENCY * 2
+
+
+def test_snapshot_of_all_subaccounts_requests_their_list_first(balances, okx_client, transport, run):
+    started = time.monotonic()
+    snapshot = run(okx_client=okx_client, main=okx_client.account_snapshot(subaccounts=None))
+    # The list and master balances are requested in the first round, balances of sub-accounts in the second one.
+    assert time.monotonic() - started < LATENCY * 3
+    assert list(snapshot.accounts) == [None, 'sub1', 'sub2']
+    assert 'subaccounts' in snapshot.timings
+    assert paths(transport=transport).count(SUBACCOUNT_LIST) == 1
+
+
+def test_snapshot_of_master_account_only(balances, okx_client, transport, run):
+    snapshot = run(okx_client=okx_client, main=okx_client.account_snapshot())
+    assert list(snapshot.accounts) == [None]
+    assert set(snapshot.tokens) == {'USDT', 'BTC', 'ETH'}
+    assert paths(transport=transport) == sorted([FUNDING, TRADING])
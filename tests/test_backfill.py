@@ -0,0 +1,69 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from py_okx_async.models import RateLimit
+from py_okx_async.utils import backfill
+
+WITHDRAWAL_HISTORY = '/api/v5/asset/withdrawal-history'
+START = 1_700_000_000_000
+
+
+def ledger(timestamps):
+    return {i: SimpleNamespace(data={'ts': str(ts)}) for i, ts in enumerate(timestamps)}
+
+
+def fetcher(records, calls, limit=100):
+    async def fetch(after, before):
+        calls.append((after, before))
+        page = [(i, record) for i, record in records.items() if before < int(record.data['ts']) < after]
+        page.sort(key=lambda item: int(item[1].data['ts']), reverse=True)
+        return dict(page[:limit])
+
+    return fetch
+
+
+def test_dense_windows_are_split_until_complete():
+    # Most records are crowded at the end of the range, so its last window is split several times.
+    records = ledger([START + i * 1000 for i in range(100)] + [START + 900_000 + i for i in range(900)])
+    calls = []
+    result = asyncio.run(backfill(fetch=fetcher(records=records, calls=calls), start=START, end=START + 1_000_000))
+    assert set(result) == set(records)
+    assert [int(record.data['ts']) for record in result.values()] == sorted(
+        (int(record.data['ts']) for record in records.values()), reverse=True
+    )
+    assert len(calls) > 8
+    assert all(before < after for after, before in calls)
+
+
+def test_only_records_of_range_are_fetched():
+    records = ledger([START - 1, START, START + 50, START + 99, START + 100])
+    calls = []
+    result = asyncio.run(backfill(fetch=fetcher(records=records, calls=calls), start=START, end=START + 100, windows=3))
+    assert set(result) == {1, 2, 3}
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize('windows', [1, 8, 1000])
+def test_windows_cover_range(windows):
+    records = ledger(range(START, START + 10))
+    fetch = fetcher(records=records, calls=[])
+    result = asyncio.run(backfill(fetch=fetch, start=START, end=START + 10, windows=windows))
+    assert set(result) == set(records)
+
+
+def test_backfill_withdrawal_history(transport, make_client, history, run):
+    records = [
+        {
+            'wdId': str(i), 'ccy': 'USDT', 'chain': 'USDT-TRC20', 'fee': '1', 'amt': '10', 'to': 'address',
+            'state': '2', 'ts': str(START + i * 500)
+        }
+        for i in range(1000)
+    ]
+    transport.add(path=WITHDRAWAL_HISTORY, handler=history(records=records))
+    okx_client = make_client(rate_limits={WITHDRAWAL_HISTORY: RateLimit(requests=1000, period=1)}, bulk_share=1)
+    withdrawals = run(okx_client=okx_client, main=okx_client.asset.backfill_withdrawal_history(
+        start=START // 1000, end=START // 1000 + 400
+    ))
+    assert list(withdrawals) == list(range(799, -1, -1))
@@ -0,0 +1,90 @@
+from py_okx_async.asset.BalanceTracker import BalanceTracker
+from py_okx_async.models import FundingToken
+
+BALANCES = '/api/v5/asset/balances'
+SUBACCOUNT_BALANCES = '/api/v5/asset/subaccount/balances'
+
+
+def tokens(**balances) -> dict:
+    return {
+        token_symbol: FundingToken(data={'ccy': token_symbol, 'bal': bal, 'availBal': bal, 'frozenBal': '0'})
+        for token_symbol, bal in balances.items()
+    }
+
+
+def wallet(balances: dict):
+    def handler(request):
+        return {'code': '0', 'msg': '', 'data': [
+            {'ccy': token_symbol, 'bal': bal, 'availBal': bal, 'frozenBal': '0'}
+            for token_symbol, bal in balances.items()
+        ]}
+
+    return handler
+
+
+def test_update_emits_only_changes():
+    tracker = BalanceTracker(okx_client=None)
+    deltas = tracker.update(account=None, tokens=tokens(BTC='1', ETH='2'))
+    assert [(delta.token_symbol, delta.bal, delta.previous) for delta in deltas] == [
+        ('BTC', 1.0, None), ('ETH', 2.0, None)
+    ]
+    deltas = tracker.update(account=None, tokens=tokens(BTC='1.5', USDT='3'))
+    assert sorted((delta.token_symbol, delta.bal, delta.previous) for delta in deltas) == [
+        ('BTC', 1.5, (1.0, 1.0, 0.0)), ('ETH', 0.0, (2.0, 2.0, 0.0)), ('USDT', 3.0, None)
+    ]
+    assert tracker.update(account=None, tokens=tokens(BTC='1.5', USDT='3')) == []
+
+
+def test_client_requests_feed_tracker(transport, make_client, run):
+    master = {'BTC': '1'}
+    transport.add(path=BALANCES, handler=wallet(balances=master))
+    okx_client = make_client()
+    tracker = okx_client.balance_tracker
+    assert okx_client.balance_tracker is tracker
+    assert okx_client.asset.balance_tracker is tracker
+
+    async def main():
+        assert [delta.token_symbol for delta in await tracker.refresh()] == ['BTC']
+        master['BTC'] = '2'
+        await okx_client.asset.balances()
+        master['BTC'] = '3'
+        await okx_client.asset.balances()
+        deltas = await tracker.refresh()
+        assert [(delta.bal, delta.previous) for delta in deltas] == [(3.0, (1.0, 1.0, 0.0))]
+
+        master['BTC'] = '4'
+        await okx_client.asset.balances()
+        master['BTC'] = '3'
+        assert await tracker.refresh() == []
+
+        master['ETH'] = '1'
+        await okx_client.asset.balances()
+        del master['ETH']
+        assert await tracker.refresh() == []
+
+        master['BTC'] = '5'
+        await okx_client.asset.balances(token_symbol='BTC')
+        assert [delta.bal for delta in await tracker.refresh()] == [5.0]
+
+    run(okx_client=okx_client, main=main())
+
+
+def test_refresh_all_tracks_subaccounts(transport, make_client, run):
+    transport.add(path=BALANCES, handler=wallet(balances={'USDT': '10'}))
+    subaccounts = {'sub1': {'BTC': '1'}, 'sub2': {'ETH': '2'}}
+    transport.add(path=SUBACCOUNT_BALANCES, handler=lambda request: wallet(
+        balances=subaccounts['sub1' if 'subAcct=sub1' in request.url else 'sub2']
+    )(request))
+    okx_client = make_client()
+
+    async def main():
+        deltas = await okx_client.balance_tracker.refresh_all(subaccounts=['sub1', 'sub2'])
+        assert [(delta.account, delta.token_symbol) for delta in deltas] == [
+            (None, 'USDT'), ('sub1', 'BTC'), ('sub2', 'ETH')
+        ]
+        subaccounts['sub2']['ETH'] = '1'
+        await okx_client.subaccount.asset_balances(subAcct='sub2')
+        deltas = await okx_client.balance_tracker.refresh_all(master=False)
+        assert [(delta.account, delta.bal) for delta in deltas] == [('sub2', 1.0)]
+
+    run(okx_client=okx_client, main=main())
@@ -0,0 +1,101 @@
+import csv
+import json
+
+import pytest
+
+from py_okx_async.asset.models import ExportFormats
+from py_okx_async.exceptions import APIException
+from py_okx_async.models import RateLimit
+
+BILLS = '/api/v5/asset/bills'
+START = 1_700_000_000_000
+
+
+def bill(i: int) -> dict:
+    # Three bills share each millisecond, so batches and pages end in the middle of a millisecond.
+    return {'billId': str(i), 'ccy': 'USDT', 'balChg': '1', 'bal': str(i), 'type': '1', 'ts': str(START + i // 3)}
+
+
+def newest_first(records: list) -> list:
+    return [record['billId'] for record in sorted(records, key=lambda record: int(record['ts']), reverse=True)]
+
+
+def exported(path: str) -> list:
+    with open(path, newline='') as file:
+        return [row[0] for row in csv.reader(file)]
+
+
+@pytest.fixture
+def ledger(transport, history):
+    records = [bill(i=i) for i in range(250)]
+    transport.add(path=BILLS, handler=history(records=records))
+    return records
+
+
+@pytest.fixture
+def fast_client(make_client):
+    def make(**kwargs):
+        return make_client(rate_limits={BILLS: RateLimit(requests=1000, period=1)}, bulk_share=1, **kwargs)
+
+    return make
+
+
+def test_export_writes_all_bills_in_batches(ledger, fast_client, run, tmp_path):
+    path = str(tmp_path / 'bills.csv')
+    okx_client = fast_client()
+    count = run(okx_client=okx_client, main=okx_client.asset.export_bills(
+        path=path, format=ExportFormats.CSV, batch_size=40
+    ))
+    assert count == 250
+    assert exported(path=path) == ['billId'] + newest_first(records=ledger)
+    with open(f'{path}.cursor') as file:
+        cursor = json.load(file)
+
+    assert cursor['after'] == START
+    assert set(cursor['ids']) == {0, 1, 2}
+    assert cursor['count'] == 250
+
+
+def test_crashed_export_is_resumed_from_last_batch(transport, ledger, history, fast_client, run, tmp_path):
+    path = str(tmp_path / 'bills.csv')
+    pages = history(records=ledger)
+    requests = []
+
+    def crash_on_third_page(request):
+        requests.append(request)
+        if len(requests) == 3:
+            return {'code': '51000', 'msg': 'Parameter error', 'data': []}
+
+        return pages(request)
+
+    transport.add(path=BILLS, handler=crash_on_third_page)
+    okx_client = fast_client()
+    with pytest.raises(APIException):
+        run(okx_client=okx_client, main=okx_client.asset.export_bills(
+            path=path, format=ExportFormats.CSV, batch_size=40
+        ))
+
+    # Two pages are received, bills of the unfinished batch aren't written and the cursor is at the last batch.
+    assert len(exported(path=path)) == 1 + 160
+    with open(path, 'a') as file:
+        file.write('garbage of a batch whose cursor was not saved\n')
+
+    okx_client = fast_client()
+    count = run(okx_client=okx_client, main=okx_client.asset.export_bills(
+        path=path, format=ExportFormats.CSV, batch_size=40
+    ))
+    assert count == 250
+    assert exported(path=path) == ['billId'] + newest_first(records=ledger)
+
+
+def test_finished_export_requests_only_earlier_bills(transport, ledger, fast_client, run, tmp_path):
+    path = str(tmp_path / 'bills.csv')
+    okx_client = fast_client()
+    run(okx_client=okx_client, main=okx_client.asset.export_bills(path=path, format=ExportFormats.CSV))
+    transport.requests.clear()
+    okx_client = fast_client()
+    count = run(okx_client=okx_client, main=okx_client.asset.export_bills(path=path, format=ExportFormats.CSV))
+    assert count == 250
+    assert len(exported(path=path)) == 251
+    assert len(transport.requests) == 1
+    assert f'after={START + 1}' in transport.requests[0].url
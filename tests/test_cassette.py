@@ -0,0 +1,95 @@
+import marshal
+import time
+import zlib
+
+import pytest
+
+from py_okx_async.Cassette import Cassette, ReplayTransport, RecordingTransport
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.exceptions import CassetteMiss
+from py_okx_async.models import OKXCredentials, CassetteModes
+
+BALANCES = '/api/v5/asset/balances'
+SUBACCOUNT_BALANCES = '/api/v5/asset/subaccount/balances'
+
+
+def wallet(bal: str) -> dict:
+    return {'code': '0', 'msg': '', 'data': [{'ccy': 'USDT', 'bal': bal, 'availBal': bal, 'frozenBal': '0'}]}
+
+
+def client(cassette: Cassette, transport=None) -> OKXClient:
+    return OKXClient(
+        credentials=OKXCredentials(api_key='key', secret_key='secret', passphrase='passphrase'), cassette=cassette,
+        transport=transport
+    )
+
+
+@pytest.fixture
+def recorded(transport, run, tmp_path):
+    path = str(tmp_path / 'balances.cassette')
+    balances = iter(['1', '2'])
+    transport.add(path=BALANCES, handler=lambda request: wallet(bal=next(balances)))
+    transport.add(
+        path=SUBACCOUNT_BALANCES, handler=lambda request: wallet(bal='5' if 'subAcct=sub1' in request.url else '7')
+    )
+    transport.latency = 0.05
+    cassette = Cassette(path=path, mode=CassetteModes.Record)
+    okx_client = client(cassette=cassette, transport=transport)
+    assert isinstance(okx_client.asset.transport, RecordingTransport)
+
+    async def main():
+        await okx_client.asset.balances()
+        await okx_client.asset.balances()
+        await okx_client.subaccount.asset_balances(subAcct='sub1')
+        await okx_client.subaccount.asset_balances(subAcct='sub2')
+
+    run(okx_client=okx_client, main=main())
+    cassette.save()
+    transport.requests.clear()
+    return path
+
+
+def test_replay_serves_recorded_responses_in_order(recorded, transport, run):
+    okx_client = client(cassette=Cassette(path=recorded, speed=0))
+    assert isinstance(okx_client.asset.transport, ReplayTransport)
+
+    async def main():
+        assert [(await okx_client.asset.balances())['USDT'].bal for _ in range(3)] == [1.0, 2.0, 2.0]
+        assert (await okx_client.subaccount.asset_balances(subAcct='sub2'))['USDT'].bal == 7.0
+        assert (await okx_client.subaccount.asset_balances(subAcct='sub1'))['USDT'].bal == 5.0
+        # Unknown parameters are answered by responses of the same endpoint.
+        assert (await okx_client.subaccount.asset_balances(subAcct='sub3'))['USDT'].bal == 5.0
+        with pytest.raises(CassetteMiss):
+            await okx_client.asset.currencies()
+
+    run(okx_client=okx_client, main=main())
+    assert transport.requests == []
+
+
+def test_replay_keeps_recorded_latencies(recorded, run):
+    for speed, minimum, maximum in ((1, 0.04, 1), (10, 0, 0.04)):
+        okx_client = client(cassette=Cassette(path=recorded, speed=speed))
+        started = time.monotonic()
+        run(okx_client=okx_client, main=okx_client.asset.balances())
+        assert minimum <= time.monotonic() - started < maximum
+
+
+def test_cassette_does_not_keep_headers(recorded):
+    with open(recorded, 'rb') as file:
+        version, records = marshal.loads(zlib.decompress(file.read()))
+
+    assert version == Cassette.version
+    assert [record[:2] for record in records] == [
+        ('GET', BALANCES), ('GET', BALANCES), ('GET', f'{SUBACCOUNT_BALANCES}?subAcct=sub1'),
+        ('GET', f'{SUBACCOUNT_BALANCES}?subAcct=sub2')
+    ]
+    assert all(isinstance(value, (str, int, float, bytes, type(None))) for record in records for value in record)
+
+
+def test_cassette_of_unsupported_version_is_rejected(tmp_path):
+    path = str(tmp_path / 'old.cassette')
+    with open(path, 'wb') as file:
+        file.write(zlib.compress(marshal.dumps((Cassette.version + 1, []))))
+
+    with pytest.raises(ValueError):
+        Cassette(path=path)
@@ -0,0 +1,94 @@
+from typing import Dict, Any, List
+
+import pytest
+
+from py_okx_async.asset.ChangeFeed import ChangeFeed
+from py_okx_async.asset.models import FeedEventTypes, WithdrawalStatuses, DepositStatuses
+from py_okx_async.models import RateLimit
+
+DEPOSIT_HISTORY = '/api/v5/asset/deposit-history'
+WITHDRAWAL_HISTORY = '/api/v5/asset/withdrawal-history'
+START = 1_700_000_000_000
+
+
+def withdrawal(i: int, ts: int, state: str = '2') -> dict:
+    return {
+        'wdId': str(i), 'ccy': 'USDT', 'chain': 'USDT-TRC20', 'fee': '1', 'amt': '10', 'to': 'address',
+        'state': state, 'ts': str(ts)
+    }
+
+
+def deposit(i: int, ts: int, state: str = '2') -> dict:
+    return {
+        'depId': str(i), 'ccy': 'USDT', 'chain': 'USDT-TRC20', 'amt': '10', 'to': 'address', 'txId': f'0x{i}',
+        'state': state, 'ts': str(ts), 'actualDepBlkConfirm': '10'
+    }
+
+
+@pytest.fixture
+def fast_client(make_client):
+    def make(**kwargs):
+        return make_client(rate_limits={
+            path: RateLimit(requests=1000, period=1) for path in (DEPOSIT_HISTORY, WITHDRAWAL_HISTORY)
+        }, **kwargs)
+
+    return make
+
+
+def test_incomplete_feed_fails_on_creation():
+    class Feed(ChangeFeed):
+        async def fetch(self, **kwargs) -> List[Dict[str, Any]]:
+            return []
+
+    with pytest.raises(TypeError):
+        Feed(asset=None)
+
+
+def test_withdrawal_feed(transport, fast_client, history, run):
+    ledger = [withdrawal(i=0, ts=START - 1000)]
+    # Two withdrawals share each millisecond and every tenth one is pending, the first poll needs two pages.
+    ledger += [withdrawal(i=i, ts=START + i // 2, state='1' if i % 10 == 0 else '2') for i in range(1, 151)]
+    transport.add(path=WITHDRAWAL_HISTORY, handler=history(records=ledger))
+    okx_client = fast_client()
+    feed = okx_client.asset.withdrawal_feed(start=START - 500)
+
+    async def main():
+        events = await feed.poll()
+        assert [event.type for event in events] == [FeedEventTypes.New] * 150
+        assert [event.record.wdId for event in events] == list(range(1, 151))
+        assert set(feed.pending) == {str(i) for i in range(10, 151, 10)}
+        assert await feed.poll() == []
+
+        ledger[10]['state'] = '2'
+        ledger.append(withdrawal(i=151, ts=START + 75))
+        events = await feed.poll()
+        assert [(event.type, event.record.wdId) for event in events] == [
+            (FeedEventTypes.New, 151), (FeedEventTypes.StateChanged, 10)
+        ]
+        assert events[1].previous_state == WithdrawalStatuses.statuses_dict['1']
+        assert events[1].record.state == WithdrawalStatuses.statuses_dict['2']
+        assert '10' not in feed.pending
+        assert await feed.poll() == []
+
+    run(okx_client=okx_client, main=main())
+
+
+def test_deposit_feed_starts_now_and_filters_token(transport, fast_client, history, run):
+    ledger = [deposit(i=1, ts=START)]
+    transport.add(path=DEPOSIT_HISTORY, handler=history(records=ledger))
+    okx_client = fast_client()
+    feed = okx_client.asset.deposit_feed(token_symbol='USDT')
+
+    async def main():
+        assert await feed.poll() == []
+        ledger.append(deposit(i=2, ts=feed.cursor + 1, state='0'))
+        ledger.append({**deposit(i=3, ts=feed.cursor + 2), 'ccy': 'BTC', 'chain': 'BTC-Bitcoin'})
+        events = await feed.poll()
+        assert [event.record.depId for event in events] == [2]
+        ledger[1]['state'] = '1'
+        events = await feed.poll()
+        assert events[0].type == FeedEventTypes.StateChanged
+        assert events[0].previous_state == DepositStatuses.statuses_dict['0']
+        assert feed.pending == {'2': '1'}
+
+    run(okx_client=okx_client, main=main())
@@ -0,0 +1,60 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from py_okx_async.models import RateLimit
+from py_okx_async.utils import split_token_symbols
+
+BALANCES = '/api/v5/asset/balances'
+SUBACCOUNT_BALANCES = '/api/v5/asset/subaccount/balances'
+SYMBOLS = [f'T{i}' for i in range(45)]
+
+
+def requested(request) -> list:
+    query = parse_qs(urlsplit(request.url).query)
+    return query['ccy'][0].split(',') if 'ccy' in query else []
+
+
+def echo_balances(request) -> dict:
+    return {'code': '0', 'msg': '', 'data': [
+        {'ccy': symbol, 'bal': '1', 'availBal': '1', 'frozenBal': '0'} for symbol in requested(request=request)
+    ]}
+
+
+@pytest.mark.parametrize('token_symbol, chunks', [
+    (None, [None]),
+    ('', [None]),
+    ([], [None]),
+    ('BTC', ['BTC']),
+    (' BTC, ETH ,,BTC', ['BTC,ETH']),
+    (['BTC', 'ETH', 'BTC'], ['BTC,ETH']),
+    (iter(SYMBOLS), [','.join(SYMBOLS[:20]), ','.join(SYMBOLS[20:40]), ','.join(SYMBOLS[40:])]),
+])
+def test_split_token_symbols(token_symbol, chunks):
+    assert split_token_symbols(token_symbol=token_symbol) == chunks
+
+
+def test_split_token_symbols_size():
+    assert split_token_symbols(token_symbol='A,B,C', size=2) == ['A,B', 'C']
+
+
+@pytest.mark.parametrize('path, balances', [
+    (BALANCES, lambda okx_client, token_symbol: okx_client.asset.balances(token_symbol=token_symbol)),
+    (SUBACCOUNT_BALANCES, lambda okx_client, token_symbol: okx_client.subaccount.asset_balances(
+        subAcct='sub1', token_symbol=token_symbol
+    )),
+])
+def test_balances_are_requested_in_chunks(transport, make_client, run, path, balances):
+    transport.add(path=path, handler=echo_balances)
+    okx_client = make_client(rate_limits={path: RateLimit(requests=100, period=1)})
+    tokens = run(okx_client=okx_client, main=balances(okx_client, SYMBOLS + SYMBOLS[:5]))
+    assert sorted(tokens) == sorted(SYMBOLS)
+    assert [len(requested(request=request)) for request in transport.requests] == [20, 20, 5]
+
+
+def test_single_chunk_is_one_request(transport, make_client, run):
+    transport.add(path=BALANCES, handler=echo_balances)
+    okx_client = make_client()
+    tokens = run(okx_client=okx_client, main=okx_client.asset.balances(token_symbol='BTC,ETH'))
+    assert sorted(tokens) == ['BTC', 'ETH']
+    assert len(transport.requests) == 1
@@ -0,0 +1,99 @@
+import pytest
+
+from py_okx_async.CircuitBreaker import CircuitBreaker, Circuit
+from py_okx_async.exceptions import CircuitOpen, APIException
+from py_okx_async.models import CircuitBreakerSettings, CircuitStates, TransportResponse
+
+BALANCES = '/api/v5/asset/balances'
+SETTINGS = CircuitBreakerSettings(min_requests=4, failure_rate=0.5, open_timeout=0)
+
+
+def opened(settings: CircuitBreakerSettings = SETTINGS) -> Circuit:
+    circuit = Circuit(host='https://www.okx.com', endpoint=BALANCES, settings=settings)
+    for failed in (False, True, False, True):
+        circuit.allow()
+        circuit.record(failed=failed)
+
+    return circuit
+
+
+def test_circuit_opens_at_failure_rate():
+    circuit = Circuit(host='https://www.okx.com', endpoint=BALANCES, settings=SETTINGS)
+    for failed in (True, True, True):
+        circuit.record(failed=failed)
+
+    assert circuit.state == CircuitStates.Closed
+    circuit.record(failed=None)
+    assert circuit.state == CircuitStates.Closed
+    assert opened().state == CircuitStates.Open
+
+
+def test_open_circuit_rejects_requests_until_timeout():
+    circuit = opened(settings=CircuitBreakerSettings(min_requests=4, open_timeout=60))
+    with pytest.raises(CircuitOpen) as error:
+        circuit.allow()
+
+    assert 0 < error.value.retry_after <= 60
+
+
+def test_half_open_circuit_lets_limited_probes_through():
+    circuit = opened()
+    circuit.allow()
+    assert circuit.state == CircuitStates.HalfOpen
+    with pytest.raises(CircuitOpen):
+        circuit.allow()
+
+
+def test_successful_probe_closes_circuit():
+    circuit = opened()
+    circuit.allow()
+    circuit.record(failed=False)
+    assert circuit.state == CircuitStates.Closed
+    assert not circuit.outcomes
+
+
+def test_failed_probe_opens_circuit_again():
+    circuit = opened()
+    circuit.allow()
+    circuit.record(failed=True)
+    assert circuit.state == CircuitStates.Open
+
+
+def test_cancelled_probe_frees_slot():
+    circuit = opened()
+    circuit.allow()
+    circuit.record(failed=None)
+    assert circuit.state == CircuitStates.HalfOpen
+    circuit.allow()
+
+
+@pytest.mark.parametrize('error, response, failure', [
+    (APIException(response={'code': '50001', 'msg': ''}), None, True),
+    (APIException(response={'code': '51000', 'msg': ''}), None, False),
+    (APIException(response={'code': '1', 'msg': ''}, status_code=502), None, True),
+    (ConnectionError(), None, True),
+    (None, {'code': '50013'}, True),
+    (None, {'code': '0'}, False),
+    (None, {}, False),
+])
+def test_failures(error, response, failure):
+    assert CircuitBreaker().is_failure(error=error, response=response) == failure
+
+
+def test_failing_endpoint_is_rejected_without_sending(transport, make_client, run):
+    transport.add(path=BALANCES, handler=TransportResponse(
+        status_code=503, content=b'{"code": "50001", "msg": "Service temporarily unavailable", "data": []}'
+    ))
+    okx_client = make_client(circuit_breaker=CircuitBreakerSettings(min_requests=2, open_timeout=60))
+
+    async def main():
+        for _ in range(2):
+            with pytest.raises(APIException):
+                await okx_client.asset.balances()
+
+        with pytest.raises(CircuitOpen):
+            await okx_client.asset.balances()
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 2
+    assert okx_client.concurrency.limit(api_key='key', endpoint=BALANCES).in_flight == 0
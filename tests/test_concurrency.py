@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from py_okx_async.ConcurrencyController import AdaptiveLimit, ConcurrencyController
+from py_okx_async.OKXClientPool import OKXClientPool
+from py_okx_async.exceptions import APIException
+from py_okx_async.models import ConcurrencySettings, OKXCredentials
+
+BALANCES = '/api/v5/asset/balances'
+
+
+def test_limit_grows_additively_up_to_maximum():
+    limit = AdaptiveLimit(settings=ConcurrencySettings(initial=4, maximum=6))
+    expected = 4.0
+    for _ in range(4):
+        assert limit.try_acquire()
+        limit.release(latency=0.1)
+        expected += 1 / expected
+
+    assert limit.limit == pytest.approx(expected)
+    for _ in range(100):
+        limit.try_acquire()
+        limit.release(latency=0.1)
+
+    assert limit.limit == 6
+
+
+def test_limit_is_cut_on_throttling_once_per_baseline():
+    limit = AdaptiveLimit(settings=ConcurrencySettings(initial=8, minimum=3))
+    limit.try_acquire()
+    limit.release(latency=10)
+    limit.try_acquire()
+    limit.release(throttled=True)
+    assert limit.limit == pytest.approx((8 + 1 / 8) * 0.5)
+
+    limit.try_acquire()
+    limit.release(throttled=True)
+    assert limit.limit == pytest.approx((8 + 1 / 8) * 0.5)
+
+    limit.decreased = 0
+    limit.try_acquire()
+    limit.release(throttled=True)
+    assert limit.limit == 3
+    assert limit.in_flight == 0
+
+
+def test_limit_is_cut_on_latency_spike():
+    limit = AdaptiveLimit(settings=ConcurrencySettings(initial=8))
+    limit.try_acquire()
+    limit.release(latency=0.1)
+    limit.decreased = -1
+    limit.try_acquire()
+    limit.release(latency=1)
+    assert limit.limit < 8
+    assert limit.baseline == 0.1
+
+
+def test_requests_wait_for_free_slot():
+    limit = AdaptiveLimit(settings=ConcurrencySettings(initial=1))
+
+    async def main():
+        await limit.acquire()
+        waiter = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert not limit.try_acquire()
+        limit.release()
+        await waiter
+        assert limit.in_flight == 1
+
+    asyncio.run(main())
+
+
+def test_throttled_response_cuts_limit(transport, make_client, run):
+    transport.add(path=BALANCES, handler={'code': '50011', 'msg': 'Too Many Requests', 'data': []})
+    okx_client = make_client(concurrency=ConcurrencySettings(initial=8))
+    with pytest.raises(APIException):
+        run(okx_client=okx_client, main=okx_client.asset.balances())
+
+    assert okx_client.concurrency.stats()[('key', BALANCES)] == {'limit': 4.0, 'in_flight': 0, 'waiting': 0}
+
+
+def test_pool_shares_controllers_by_api_key(transport):
+    credentials = {
+        'a1': OKXCredentials(api_key='key1', secret_key='secret', passphrase='passphrase'),
+        'a2': OKXCredentials(api_key='key1', secret_key='secret', passphrase='passphrase'),
+        'b1': OKXCredentials(api_key='key2', secret_key='secret', passphrase='passphrase'),
+    }
+    pool = OKXClientPool(credentials=credentials, transport=transport, concurrency=ConcurrencySettings(initial=2))
+    a1, a2, b1 = (pool.client(name=name) for name in credentials)
+    for attribute in ('rate_limiter', 'concurrency', 'circuit_breaker'):
+        assert getattr(a1, attribute) is getattr(a2, attribute)
+        assert getattr(a1, attribute) is not getattr(b1, attribute)
+
+    assert isinstance(a1.concurrency, ConcurrencyController)
+    assert a1.concurrency.settings.initial == 2
+    assert a1.concurrency.limit(api_key='key1', endpoint=BALANCES) is a2.concurrency.limit(
+        api_key='key1', endpoint=BALANCES
+    )
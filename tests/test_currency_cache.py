@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+import pytest
+
+from py_okx_async.OKXClient import OKXClient
+from py_okx_async.asset.CurrencyCache import CurrencyCache
+from py_okx_async.exceptions import APIException
+from py_okx_async.models import OKXCredentials
+
+CURRENCIES = '/api/v5/asset/currencies'
+
+
+def currency(token_symbol: str, chain: str, fee: str = '1') -> dict:
+    return {
+        'canDep': True, 'canInternal': True, 'canWd': True, 'ccy': token_symbol, 'chain': f'{token_symbol}-{chain}',
+        'logoLink': '', 'mainNet': False, 'fee': fee, 'maxWd': '1000', 'minDep': '1', 'minDepArrivalConfirm': '1',
+        'minWd': '2', 'minWdUnlockConfirm': '1', 'name': token_symbol, 'needTag': False, 'usedWdQuota': '0',
+        'wdQuota': '10000000', 'wdTickSz': '2'
+    }
+
+
+def table(fee: str = '1'):
+    def handler(request) -> dict:
+        return {'code': '0', 'msg': '', 'data': [
+            currency(token_symbol=token_symbol, chain=chain, fee=fee)
+            for token_symbol, chain in (('USDT', 'TRC20'), ('USDT', 'ERC20'), ('BTC', 'Bitcoin'))
+        ]}
+
+    return handler
+
+
+def test_first_get_requests_and_saves_currencies(transport, make_client, run, tmp_path):
+    transport.add(path=CURRENCIES, handler=table())
+    path = str(tmp_path / 'currencies.bin')
+    okx_client = make_client()
+    cache = CurrencyCache(asset=okx_client.asset, path=path)
+    assert cache.currencies is None
+
+    async def main():
+        currencies = await cache.get()
+        assert {token_symbol: list(chains) for token_symbol, chains in currencies.items()} == {
+            'USDT': ['TRC20', 'ERC20'], 'BTC': ['Bitcoin']
+        }
+        assert await cache.get() is currencies
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 1
+    assert cache.validated
+
+    loaded = CurrencyCache(asset=okx_client.asset, path=path)
+    assert loaded.ts == cache.ts
+    assert not loaded.validated
+    assert loaded.currencies['USDT']['ERC20'].data == currency(token_symbol='USDT', chain='ERC20')
+
+
+def test_loaded_currencies_are_served_and_refreshed_in_background(transport, make_client, run, tmp_path):
+    path = str(tmp_path / 'currencies.bin')
+    transport.add(path=CURRENCIES, handler=table(fee='1'))
+    okx_client = make_client()
+    run(okx_client=okx_client, main=CurrencyCache(asset=okx_client.asset, path=path).refresh())
+
+    transport.add(path=CURRENCIES, handler=table(fee='2'))
+    transport.latency = 0.01
+    okx_client = make_client()
+    cache = CurrencyCache(asset=okx_client.asset, path=path)
+
+    async def main():
+        # The loaded file is returned at once while currencies are requested again.
+        assert (await cache.get())['USDT']['TRC20'].fee == 1
+        await cache.refresh_task
+        await asyncio.sleep(0)
+        assert cache.refresh_task is None
+        assert (await cache.get())['USDT']['TRC20'].fee == 2
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 2
+
+
+def test_stale_currencies_are_refreshed(transport, make_client, run, tmp_path):
+    transport.add(path=CURRENCIES, handler=table())
+    okx_client = make_client()
+    cache = CurrencyCache(asset=okx_client.asset, path=str(tmp_path / 'currencies.bin'), max_age=60)
+
+    async def main():
+        await cache.get()
+        await cache.get()
+        cache.ts = time.time() - 61
+        await cache.get()
+        await cache.refresh_task
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 2
+
+
+def test_file_of_another_api_key_is_ignored(transport, make_client, run, tmp_path):
+    transport.add(path=CURRENCIES, handler=table())
+    path = str(tmp_path / 'currencies.bin')
+    okx_client = make_client()
+    run(okx_client=okx_client, main=CurrencyCache(asset=okx_client.asset, path=path).refresh())
+
+    other_client = OKXClient(
+        credentials=OKXCredentials(api_key='other', secret_key='secret', passphrase='passphrase'), transport=transport
+    )
+    assert CurrencyCache(asset=other_client.asset, path=path).currencies is None
+    with open(path, 'wb') as file:
+        file.write(b'corrupted')
+
+    assert CurrencyCache(asset=okx_client.asset, path=path).currencies is None
+
+
+def test_failed_refresh_is_retried(transport, make_client, run, tmp_path):
+    responses = [{'code': '50001', 'msg': 'Service temporarily unavailable', 'data': []}]
+    transport.add(path=CURRENCIES, handler=lambda request: responses.pop(0) if responses else table()(request))
+    okx_client = make_client()
+    cache = CurrencyCache(asset=okx_client.asset, path=str(tmp_path / 'currencies.bin'))
+
+    async def main():
+        with pytest.raises(APIException):
+            await cache.get()
+
+        await asyncio.sleep(0)
+        assert cache.refresh_task is None
+        assert 'BTC' in await cache.get()
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 2
+
+
+def test_withdrawal_validation_uses_cache(transport, make_client, run, tmp_path):
+    transport.add(path=CURRENCIES, handler=table())
+    okx_client = make_client()
+    okx_client.asset.currency_cache = CurrencyCache(asset=okx_client.asset, path=str(tmp_path / 'currencies.bin'))
+
+    async def main():
+        assert (await okx_client.asset.validate_withdrawal(token_symbol='USDT', amount='10', chain='TRC20')).valid
+        check = await okx_client.asset.validate_withdrawal(token_symbol='USDT', amount='1', chain='ERC20')
+        assert not check.valid
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 1
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from py_okx_async.Deadline import Deadline
+from py_okx_async.exceptions import DeadlineExceeded
+from py_okx_async.models import RateLimit, Timeouts
+
+BALANCES = '/api/v5/asset/balances'
+DEPOSIT_HISTORY = '/api/v5/asset/deposit-history'
+WITHDRAWAL_HISTORY = '/api/v5/asset/withdrawal-history'
+SUBACCOUNT_LIST = '/api/v5/users/subaccount/list'
+BILLS = '/api/v5/asset/bills'
+START = 1_700_000_000_000
+
+
+def withdrawal(i: int, ts: int) -> dict:
+    return {
+        'wdId': str(i), 'ccy': 'USDT', 'chain': 'USDT-TRC20', 'fee': '1', 'amt': '10', 'txId': '', 'from': '',
+        'to': 'address', 'state': '2', 'ts': str(ts)
+    }
+
+
+def deposit(i: int, ts: int) -> dict:
+    return {
+        'depId': str(i), 'ccy': 'USDT', 'chain': 'USDT-TRC20', 'amt': '10', 'from': '', 'to': 'address', 'txId': '',
+        'state': '2', 'ts': str(ts), 'actualDepBlkConfirm': '10'
+    }
+
+
+def bill(i: int, ts: int) -> dict:
+    return {'billId': str(i), 'ccy': 'USDT', 'balChg': '1', 'bal': str(i), 'type': '1', 'ts': str(ts)}
+
+
+def subaccount(i: int, ts: int) -> dict:
+    return {'subAcct': f'sub{i}', 'enable': True, 'type': '1', 'label': '', 'ts': str(ts)}
+
+
+@pytest.fixture
+def fast_client(make_client):
+    def make(**kwargs):
+        return make_client(rate_limits={
+            path: RateLimit(requests=1000, period=1)
+            for path in (BALANCES, DEPOSIT_HISTORY, WITHDRAWAL_HISTORY, BILLS, SUBACCOUNT_LIST)
+        }, **kwargs)
+
+    return make
+
+
+@pytest.mark.parametrize('after', [None, START + 2000 * 1000, START // 1000 + 2000])
+@pytest.mark.parametrize('path, record, iterate', [
+    (WITHDRAWAL_HISTORY, withdrawal, lambda okx_client, after: okx_client.asset.iter_withdrawal_history(after=after)),
+    (DEPOSIT_HISTORY, deposit, lambda okx_client, after: okx_client.asset.iter_deposit_history(after=after)),
+    (BILLS, bill, lambda okx_client, after: okx_client.asset.iter_bills(after=after)),
+    (SUBACCOUNT_LIST, subaccount, lambda okx_client, after: okx_client.subaccount.iter_list(after=after)),
+])
+def test_iterators_page_past_first_page(transport, fast_client, history, run, path, record, iterate, after):
+    # Two records share each millisecond, so page boundaries cut groups of the same ts.
+    transport.add(path=path, handler=history(records=[record(i=i, ts=START + i // 2 * 1000) for i in range(1001)]))
+    okx_client = fast_client()
+
+    async def main():
+        return [item async for item in iterate(okx_client, after)]
+
+    items = run(okx_client=okx_client, main=main())
+    assert len(items) == 1001
+    assert len(transport.requests) > 10
+    assert all('after=' in request.url for request in transport.requests[1:])
+
+
+def test_iterator_stops_at_deadline(transport, fast_client, history, run):
+    handler = history(records=[withdrawal(i=i, ts=START + i * 1000) for i in range(1000)])
+
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return handler(request)
+
+    transport.add(path=WITHDRAWAL_HISTORY, handler=slow)
+    okx_client = fast_client()
+
+    async def main():
+        with Deadline(timeout=0.12):
+            return [item async for item in okx_client.asset.iter_withdrawal_history()]
+
+    items = run(okx_client=okx_client, main=main())
+    assert 100 <= len(items) < 1000
+    assert len({item.wdId for item in items}) == len(items)
+
+
+def test_request_raises_when_deadline_is_exceeded(transport, fast_client, run):
+    transport.add(path=BALANCES, handler={'code': '0', 'msg': '', 'data': []})
+    transport.latency = 0.2
+    okx_client = fast_client()
+
+    async def main():
+        with Deadline(timeout=0.05):
+            await okx_client.asset.balances()
+
+    with pytest.raises(DeadlineExceeded):
+        run(okx_client=okx_client, main=main())
+
+
+def test_timeouts_are_bounded_by_deadline(transport, fast_client, run):
+    transport.add(path=BALANCES, handler={'code': '0', 'msg': '', 'data': []})
+    okx_client = fast_client(timeouts=Timeouts(total=30, connect=2, read=10))
+
+    async def main():
+        await okx_client.asset.balances()
+        with Deadline(timeout=5):
+            await okx_client.asset.balances()
+
+    run(okx_client=okx_client, main=main())
+    assert transport.requests[0].timeouts.total == 30
+    assert transport.requests[1].timeouts.total <= 5
+    assert transport.requests[1].timeouts.connect == 2
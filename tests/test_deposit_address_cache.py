@@ -0,0 +1,101 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from py_okx_async.asset.DepositAddressCache import DepositAddressCache
+
+DEPOSIT_ADDRESS = '/api/v5/asset/deposit-address'
+CHAINS = {'USDT': ('USDT-TRC20', 'USDT-ERC20'), 'BTC': ('BTC-Bitcoin',)}
+
+
+def deposit_addresses(prefix: str = 'address'):
+    def handler(request) -> dict:
+        token_symbol = parse_qs(urlsplit(request.url).query)['ccy'][0]
+        return {'code': '0', 'msg': '', 'data': [
+            {
+                'addr': f'{prefix}-{chain}', 'ccy': token_symbol, 'chain': chain, 'to': '6', 'selected': True,
+                'ctAddr': ''
+            }
+            for chain in CHAINS[token_symbol]
+        ]}
+
+    return handler
+
+
+def requested(transport) -> list:
+    return [parse_qs(urlsplit(request.url).query)['ccy'][0] for request in transport.requests]
+
+
+def test_deposit_address_reads_through_cache(transport, make_client, run):
+    transport.add(path=DEPOSIT_ADDRESS, handler=deposit_addresses())
+    okx_client = make_client()
+
+    async def main():
+        addresses = await okx_client.asset.deposit_address(token_symbol='USDT')
+        assert {chain: address.addr for chain, address in addresses.items()} == {
+            'TRC20': 'address-USDT-TRC20', 'ERC20': 'address-USDT-ERC20'
+        }
+        assert await okx_client.asset.deposit_address(token_symbol='USDT') == addresses
+        assert okx_client.asset.address_cache.get(token_symbol='USDT', chain='TRC20') is addresses['TRC20']
+
+        addresses = await okx_client.asset.deposit_addresses(token_symbols=['USDT', 'BTC', 'USDT'])
+        assert {token_symbol: list(chains) for token_symbol, chains in addresses.items()} == {
+            'USDT': ['TRC20', 'ERC20'], 'BTC': ['Bitcoin']
+        }
+
+    run(okx_client=okx_client, main=main())
+    assert requested(transport=transport) == ['USDT', 'BTC']
+
+
+def test_refresh_replaces_cached_addresses(transport, make_client, run, monkeypatch):
+    transport.add(path=DEPOSIT_ADDRESS, handler=deposit_addresses())
+    okx_client = make_client()
+
+    async def main():
+        await okx_client.asset.deposit_address(token_symbol='USDT')
+        monkeypatch.setitem(CHAINS, 'USDT', ('USDT-TRC20',))
+        transport.add(path=DEPOSIT_ADDRESS, handler=deposit_addresses(prefix='new'))
+        addresses = await okx_client.asset.deposit_address(token_symbol='USDT', refresh=True)
+        assert {chain: address.addr for chain, address in addresses.items()} == {'TRC20': 'new-USDT-TRC20'}
+        assert okx_client.asset.address_cache.chains(token_symbol='USDT') == addresses
+        assert okx_client.asset.address_cache.get(token_symbol='USDT', chain='ERC20') is None
+
+    run(okx_client=okx_client, main=main())
+    assert requested(transport=transport) == ['USDT', 'USDT']
+
+
+def test_fill_saves_addresses_of_accounts(transport, make_client, run, tmp_path):
+    transport.add(path=DEPOSIT_ADDRESS, handler=deposit_addresses())
+    path = str(tmp_path / 'addresses.json')
+    cache = DepositAddressCache(path=path)
+    okx_client = make_client()
+    okx_client.asset.address_cache = cache
+
+    async def main():
+        assert await cache.fill(okx_clients={None: okx_client}, token_symbols=['USDT', 'BTC']) == 2
+        assert await cache.fill(okx_clients={None: okx_client}, token_symbols=['USDT', 'BTC']) == 0
+        assert await okx_client.asset.deposit_address(token_symbol='BTC') == cache.chains(token_symbol='BTC')
+
+    run(okx_client=okx_client, main=main())
+    assert requested(transport=transport) == ['USDT', 'BTC']
+    loaded = DepositAddressCache(path=path)
+    assert {key: address.addr for key, address in loaded.addresses.items()} == {
+        (None, 'USDT', 'TRC20'): 'address-USDT-TRC20', (None, 'USDT', 'ERC20'): 'address-USDT-ERC20',
+        (None, 'BTC', 'Bitcoin'): 'address-BTC-Bitcoin'
+    }
+
+
+@pytest.mark.parametrize('refresh', [False, True])
+def test_fill_requests_cached_tokens_only_on_refresh(transport, make_client, run, refresh):
+    transport.add(path=DEPOSIT_ADDRESS, handler=deposit_addresses())
+    okx_client = make_client()
+
+    async def main():
+        await okx_client.asset.deposit_address(token_symbol='USDT')
+        cache = DepositAddressCache()
+        await cache.fill(okx_clients={'sub1': okx_client}, token_symbols=['USDT'])
+        await cache.fill(okx_clients={'sub1': okx_client}, token_symbols=['USDT'], refresh=refresh)
+        assert list(cache.chains(token_symbol='USDT', account='sub1')) == ['TRC20', 'ERC20']
+
+    run(okx_client=okx_client, main=main())
+    assert requested(transport=transport) == ['USDT'] * (2 if refresh else 1)
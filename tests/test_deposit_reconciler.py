@@ -0,0 +1,113 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from py_okx_async.asset.DepositReconciler import DepositReconciler
+from py_okx_async.asset.models import Deposit, ExpectedPayment, MatchKeys, DepositStatuses
+
+DEPOSIT_HISTORY = '/api/v5/asset/deposit-history'
+START = 1_700_000_000_000
+
+
+def deposit(
+        i: int, amt: str = '10', to: str = 'address', ccy: str = 'USDT', chain: str = 'TRC20', state: str = '2',
+        ts: int = START
+) -> Deposit:
+    return Deposit(data={
+        'depId': str(i), 'ccy': ccy, 'chain': f'{ccy}-{chain}', 'amt': amt, 'to': to, 'txId': f'0x{i}',
+        'state': state, 'ts': str(ts), 'actualDepBlkConfirm': '10'
+    })
+
+
+@pytest.fixture
+def reconciler():
+    reconciler = DepositReconciler()
+    reconciler.expect(payment=ExpectedPayment(id='tx', txId='0x1'))
+    reconciler.expect(payment=ExpectedPayment(id='address', address='deposit', amount=Decimal('5')))
+    reconciler.expect(payment=ExpectedPayment(id='any amount', address='deposit'))
+    reconciler.expect(payment=ExpectedPayment(id='trc20', token_symbol='USDT', chain='TRC20', amount=Decimal('7')))
+    reconciler.expect(payment=ExpectedPayment(id='any chain', token_symbol='USDT', amount=Decimal('7')))
+    return reconciler
+
+
+def test_deposits_are_matched_by_most_specific_field(reconciler):
+    matches = [
+        reconciler.process_deposit(deposit=item) for item in (
+            deposit(i=1, amt='5', to='deposit'), deposit(i=2, amt='5', to='deposit'),
+            deposit(i=3, amt='8', to='deposit'), deposit(i=4, amt='7', chain='ERC20'), deposit(i=5, amt='7'),
+            deposit(i=6, amt='7')
+        )
+    ]
+    assert [(match.payment.id, match.key) if match else None for match in matches] == [
+        ('tx', MatchKeys.TxId), ('address', MatchKeys.Address), ('any amount', MatchKeys.Address),
+        ('any chain', MatchKeys.Amount), ('trc20', MatchKeys.Amount), None
+    ]
+    assert reconciler.payments == {}
+    assert reconciler.by_txId == reconciler.by_address == reconciler.by_amount == {}
+
+
+def test_payments_sharing_key_are_matched_in_order_of_registration():
+    reconciler = DepositReconciler()
+    for payment_id in ('first', 'second'):
+        reconciler.expect(payment=ExpectedPayment(id=payment_id, token_symbol='USDT', amount=Decimal('10')))
+
+    assert reconciler.process_deposit(deposit=deposit(i=1, ccy='BTC')) is None
+    assert reconciler.process_deposit(deposit=deposit(i=2)).payment.id == 'first'
+    assert reconciler.process_deposit(deposit=deposit(i=3)).payment.id == 'second'
+
+
+def test_expect_replaces_and_cancel_unregisters(reconciler):
+    reconciler.expect(payment=ExpectedPayment(id='tx', txId='0x2'))
+    assert '0x1' not in reconciler.by_txId
+    assert reconciler.cancel(payment_id='tx').txId == '0x2'
+    assert reconciler.cancel(payment_id='tx') is None
+    assert reconciler.by_txId == {}
+    with pytest.raises(ValueError):
+        reconciler.expect(payment=ExpectedPayment(id='empty', token_symbol='USDT'))
+
+
+def test_matched_payment_is_notified_until_final_state():
+    reconciler = DepositReconciler()
+    reconciler.expect(payment=ExpectedPayment(id='invoice', txId='0x1'))
+    match = reconciler.process_deposit(deposit=deposit(i=1, state='0'))
+    assert match.previous_state is None
+    assert 1 in reconciler.matched
+    assert reconciler.process_deposit(deposit=deposit(i=1, state='0')) is None
+
+    match = reconciler.process_deposit(deposit=deposit(i=1, state='2'))
+    assert match.payment.id == 'invoice'
+    assert match.key == MatchKeys.TxId
+    assert match.previous_state == DepositStatuses.statuses_dict['0']
+    assert match.payment.deposit.state == DepositStatuses.statuses_dict['2']
+    assert reconciler.matched == {}
+
+
+def test_reconcile_processes_history_from_earlier_deposits(reconciler):
+    deposits = {item.depId: item for item in (deposit(i=7, amt='7', ts=START + 1), deposit(i=8, amt='7', ts=START))}
+    assert [match.deposit.depId for match in reconciler.reconcile(deposits=deposits)] == [8, 7]
+
+
+def test_watch_matches_events_of_deposit_feed(transport, make_client, history, run):
+    ledger = []
+    transport.add(path=DEPOSIT_HISTORY, handler=history(records=ledger))
+    okx_client = make_client()
+    reconciler = DepositReconciler()
+    reconciler.expect(payment=ExpectedPayment(id='invoice', address='deposit', amount=Decimal('10')))
+    feed = okx_client.asset.deposit_feed(interval=0.01)
+
+    async def main():
+        matches = []
+        watcher = reconciler.watch(feed=feed)
+        ledger.append({**deposit(i=1, to='other', ts=feed.cursor + 1).data})
+        ledger.append({**deposit(i=2, to='deposit', state='0', ts=feed.cursor + 2).data})
+        matches.append(await asyncio.wait_for(watcher.__anext__(), timeout=5))
+        ledger[1]['state'] = '2'
+        matches.append(await asyncio.wait_for(watcher.__anext__(), timeout=5))
+        await watcher.aclose()
+        return matches
+
+    matches = run(okx_client=okx_client, main=main())
+    assert [(match.payment.id, match.deposit.depId, match.deposit.state.state) for match in matches] == [
+        ('invoice', 2, '0'), ('invoice', 2, '2')
+    ]
@@ -0,0 +1,98 @@
+import asyncio
+
+from aiohttp_socks import ProxyConnector
+
+from py_okx_async.models import HedgingSettings, ConcurrencySettings, Methods, Priorities
+
+BALANCES = '/api/v5/asset/balances'
+
+
+def slow_first(transport, delay: float = 0.5):
+    async def handler(request):
+        if len(transport.requests) == 1:
+            await asyncio.sleep(delay)
+
+        return {'code': '0', 'msg': '', 'data': []}
+
+    return handler
+
+
+async def close(section) -> None:
+    for connector in (section.connector, section.critical_connector, section.hedge_connector):
+        if connector:
+            await connector.close()
+
+
+def test_hedge_uses_client_proxy(transport, make_client):
+    transport.add(path=BALANCES, handler=slow_first(transport=transport))
+    okx_client = make_client(
+        proxy='socks5://127.0.0.1:1080', check_proxy=False, hedging=HedgingSettings(delay=0.05, min_delay=0.01)
+    )
+
+    async def main():
+        try:
+            assert await okx_client.asset.balances() == {}
+            await asyncio.sleep(0)
+            assert len(transport.requests) == 2
+            assert all(isinstance(request.connector, ProxyConnector) for request in transport.requests)
+            assert transport.requests[1].connector is okx_client.asset.hedge_connector
+            limit = okx_client.concurrency.limit(api_key='key', endpoint=BALANCES)
+            assert limit.in_flight == 0
+
+        finally:
+            await close(section=okx_client.asset)
+
+    asyncio.run(main())
+
+
+def test_hedge_needs_in_flight_slot(transport, make_client):
+    transport.add(path=BALANCES, handler=slow_first(transport=transport, delay=0.1))
+    okx_client = make_client(
+        hedging=HedgingSettings(delay=0.01, min_delay=0.01), concurrency=ConcurrencySettings(initial=1)
+    )
+
+    async def main():
+        try:
+            await okx_client.asset.balances()
+            assert len(transport.requests) == 1
+            assert okx_client.concurrency.limit(api_key='key', endpoint=BALANCES).in_flight == 0
+
+        finally:
+            await close(section=okx_client.asset)
+
+    asyncio.run(main())
+
+
+def test_hedge_gives_way_to_critical_requests(transport, make_client):
+    okx_client = make_client(hedging=HedgingSettings(delay=0.01, min_delay=0.01))
+    slow = slow_first(transport=transport, delay=0.1)
+
+    async def handler(request):
+        okx_client.rate_limiter.critical_waiting[BALANCES] = 1
+        return await slow(request)
+
+    transport.add(path=BALANCES, handler=handler)
+
+    async def main():
+        try:
+            await okx_client.asset.balances()
+            assert [request.method for request in transport.requests] == [Methods.GET]
+            assert okx_client.concurrency.limit(api_key='key', endpoint=BALANCES).in_flight == 0
+
+        finally:
+            await close(section=okx_client.asset)
+
+    asyncio.run(main())
+
+
+def test_try_acquire_respects_critical_and_bulk(make_client):
+    rate_limiter = make_client().rate_limiter
+    rate_limiter.critical_waiting[BALANCES] = 1
+    assert not rate_limiter.try_acquire(endpoint=BALANCES)
+    assert rate_limiter.try_acquire(endpoint=BALANCES, priority=Priorities.Critical)
+
+    rate_limiter.critical_waiting[BALANCES] = 0
+    bulk_bucket = rate_limiter.bulk_bucket(endpoint=BALANCES)
+    bulk_bucket.tokens = 0
+    assert not rate_limiter.try_acquire(endpoint=BALANCES, priority=Priorities.Bulk)
+    assert rate_limiter.try_acquire(endpoint=BALANCES)
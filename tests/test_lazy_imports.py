@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = ('requests', 'aiohttp', 'aiohttp_socks', 'pretty_utils', 'py_okx_async.chains')
+SECTIONS = ('py_okx_async.asset.Asset', 'py_okx_async.public.Public')
+
+
+def loaded_modules(code: str) -> list:
+    code = textwrap.dedent(code) + f'\nprint(",".join(m for m in {LAZY_MODULES + SECTIONS!r} if m in sys.modules))'
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get('PYTHONPATH')))))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return [name for name in result.stdout.strip().split(',') if name]
+
+
+def test_client_import_is_lazy():
+    assert loaded_modules(code='import sys, py_okx_async.OKXClient') == []
+
+
+def test_section_is_imported_on_first_access():
+    loaded = loaded_modules(code='''
+        import sys
+        from py_okx_async.OKXClient import OKXClient
+        from py_okx_async.Transport import MockTransport
+        from py_okx_async.models import OKXCredentials
+
+        okx_client = OKXClient(
+            credentials=OKXCredentials(api_key='key', secret_key='secret', passphrase='passphrase'),
+            transport=MockTransport()
+        )
+        okx_client.asset
+    ''')
+    assert 'py_okx_async.asset.Asset' in loaded
+    assert 'py_okx_async.public.Public' not in loaded
+    assert 'requests' not in loaded
+    assert 'aiohttp_socks' not in loaded
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'benchmarks', 'load_test.py')
+
+pytest.importorskip('aiohttp')
+
+
+def load_test(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable, SCRIPT, '--api-keys', '2', '--subaccounts', '4', '--concurrency', '4', '--duration', '0.5',
+            '--interval', '0.25', '--server-latency-ms', '1', *args
+        ],
+        capture_output=True, text=True, timeout=60
+    )
+
+
+def test_load_test_reports_summary(tmp_path):
+    path = str(tmp_path / 'results.json')
+    result = load_test('--json', path)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'Total:' in result.stdout
+    with open(path) as file:
+        results = json.load(file)
+
+    assert results['settings']['api_keys'] == 2
+    assert results['summary']['requests'] > 0
+    assert results['summary']['errors'] == {}
+    assert results['summary']['p50_ms'] <= results['summary']['p99_ms']
+    assert results['samples']
+
+
+def test_load_test_fails_regression_gates():
+    result = load_test('--min-rps', '1000000000', '--max-p99-ms', '0.000001')
+    assert result.returncode == 1
+    assert 'The throughput is lower than' in result.stdout
+    assert 'The 99th percentile of latency exceeds' in result.stdout
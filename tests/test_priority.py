@@ -0,0 +1,107 @@
+import asyncio
+
+from py_okx_async.ConcurrencyController import AdaptiveLimit
+from py_okx_async.Priority import Priority
+from py_okx_async.RateLimiter import RateLimiter
+from py_okx_async.models import Priorities, ConcurrencySettings, RateLimit
+
+BALANCES = '/api/v5/asset/balances'
+WITHDRAWAL = '/api/v5/asset/withdrawal'
+
+
+def test_priority_is_resolved_from_request_context_and_endpoint():
+    assert Priority.resolve(endpoint=BALANCES) == Priorities.Normal
+    assert Priority.resolve(endpoint=WITHDRAWAL) == Priorities.Critical
+    with Priority(priority=Priorities.Bulk):
+        assert Priority.resolve(endpoint=BALANCES) == Priorities.Bulk
+        assert Priority.resolve(endpoint=WITHDRAWAL) == Priorities.Critical
+        assert Priority.resolve(endpoint=BALANCES, priority=Priorities.Critical) == Priorities.Critical
+        with Priority(priority=Priorities.Critical):
+            assert Priority.resolve(endpoint=BALANCES) == Priorities.Critical
+
+        assert Priority.resolve(endpoint=BALANCES) == Priorities.Bulk
+
+    assert Priority.resolve(endpoint=BALANCES) == Priorities.Normal
+
+
+def test_tasks_inherit_priority():
+    async def resolve():
+        return Priority.resolve(endpoint=BALANCES)
+
+    async def main():
+        with Priority(priority=Priorities.Bulk):
+            task = asyncio.ensure_future(resolve())
+
+        return await task
+
+    assert asyncio.run(main()) == Priorities.Bulk
+
+
+def test_free_slots_go_to_higher_priority_classes_first():
+    limit = AdaptiveLimit(settings=ConcurrencySettings(initial=1, minimum=1, maximum=1))
+    order = []
+
+    async def request(name: str, priority: int):
+        await limit.acquire(priority=priority)
+        order.append(name)
+        await asyncio.sleep(0)
+        limit.release()
+
+    async def main():
+        await limit.acquire()
+        tasks = [
+            asyncio.ensure_future(request(name=name, priority=priority)) for name, priority in (
+                ('bulk', Priorities.Bulk), ('normal 1', Priorities.Normal), ('critical', Priorities.Critical),
+                ('normal 2', Priorities.Normal)
+            )
+        ]
+        await asyncio.sleep(0)
+        limit.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == ['critical', 'normal 1', 'normal 2', 'bulk']
+
+
+def test_critical_requests_take_tokens_first():
+    rate_limiter = RateLimiter(limits={BALANCES: RateLimit(requests=1, period=0.05)})
+    order = []
+
+    async def request(name: str, priority: int):
+        await rate_limiter.acquire(endpoint=BALANCES, priority=priority)
+        order.append(name)
+
+    async def main():
+        await rate_limiter.acquire(endpoint=BALANCES)
+        normal = asyncio.ensure_future(request(name='normal', priority=Priorities.Normal))
+        await asyncio.sleep(0)
+        critical = asyncio.ensure_future(request(name='critical', priority=Priorities.Critical))
+        await asyncio.gather(normal, critical)
+
+    asyncio.run(main())
+    assert order == ['critical', 'normal']
+    assert rate_limiter.critical_waiting == {BALANCES: 0}
+
+
+def test_bulk_requests_are_limited_to_their_share():
+    rate_limiter = RateLimiter(limits={BALANCES: RateLimit(requests=4, period=1)}, bulk_share=0.5)
+    assert rate_limiter.bulk_limit(endpoint=BALANCES) == RateLimit(requests=2, period=1)
+    assert [rate_limiter.try_acquire(endpoint=BALANCES, priority=Priorities.Bulk) for _ in range(3)] == [
+        True, True, False
+    ]
+    assert [rate_limiter.try_acquire(endpoint=BALANCES) for _ in range(3)] == [True, True, False]
+
+
+def test_client_requests_use_priority_of_context(transport, make_client, run):
+    transport.add(path=BALANCES, handler={'code': '0', 'msg': '', 'data': []})
+    okx_client = make_client()
+
+    async def main():
+        await okx_client.asset.balances()
+        assert BALANCES not in okx_client.rate_limiter.bulk_buckets
+        with Priority(priority=Priorities.Bulk):
+            await okx_client.asset.balances()
+
+        assert BALANCES in okx_client.rate_limiter.bulk_buckets
+
+    run(okx_client=okx_client, main=main())
@@ -0,0 +1,105 @@
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+TICKER = '/api/v5/market/ticker'
+TICKERS = '/api/v5/market/tickers'
+
+
+def ticker(request) -> dict:
+    instId = parse_qs(urlsplit(request.url).query)['instId'][0]
+    return {'code': '0', 'msg': '', 'data': [{'instType': 'SPOT', 'instId': instId, 'last': '1'}]}
+
+
+def requested(transport, path: str) -> list:
+    return [
+        parse_qs(urlsplit(request.url).query).get('instId', [None])[0] for request in transport.requests
+        if urlsplit(request.url).path == path
+    ]
+
+
+@pytest.fixture
+def public_api(transport):
+    transport.add(path=TICKER, handler=ticker)
+    transport.add(path=TICKERS, handler={'code': '0', 'msg': '', 'data': [
+        {'instType': 'SPOT', 'instId': 'BTC-USDT', 'last': '30000'}
+    ]})
+    transport.latency = 0.01
+    return transport
+
+
+def test_identical_misses_share_one_request(public_api, make_client, run):
+    okx_client = make_client()
+
+    async def main():
+        results = await asyncio.gather(*(okx_client.public.tickers() for _ in range(10)))
+        assert all(list(result) == ['BTC-USDT'] for result in results)
+        await okx_client.public.tickers()
+
+    run(okx_client=okx_client, main=main())
+    assert len(requested(transport=public_api, path=TICKERS)) == 1
+
+
+def test_cached_responses_expire(public_api, make_client, run):
+    okx_client = make_client()
+
+    async def main():
+        await okx_client.public.ticker(instId='BTC-USDT', cache_ttl=0.05)
+        await okx_client.public.ticker(instId='BTC-USDT', cache_ttl=0.05)
+        await asyncio.sleep(0.1)
+        await okx_client.public.ticker(instId='BTC-USDT', cache_ttl=0.05)
+        await okx_client.public.ticker(instId='BTC-USDT', cache_ttl=0)
+
+    run(okx_client=okx_client, main=main())
+    assert requested(transport=public_api, path=TICKER) == ['BTC-USDT'] * 3
+
+
+def test_least_recently_used_responses_are_evicted(public_api, make_client, run, monkeypatch):
+    from py_okx_async.public.Public import Public
+
+    monkeypatch.setattr(Public, 'cache_size', 2)
+    okx_client = make_client()
+
+    async def main():
+        for instId in ('BTC-USDT', 'ETH-USDT', 'BTC-USDT', 'SOL-USDT', 'BTC-USDT', 'ETH-USDT'):
+            await okx_client.public.ticker(instId=instId, cache_ttl=60)
+
+    run(okx_client=okx_client, main=main())
+    assert requested(transport=public_api, path=TICKER) == ['BTC-USDT', 'ETH-USDT', 'SOL-USDT', 'ETH-USDT']
+    assert len(Public.cache) == 2
+
+
+def test_failed_responses_are_not_cached(transport, make_client, run):
+    from py_okx_async.exceptions import APIException
+
+    responses = [{'code': '50001', 'msg': 'Service temporarily unavailable', 'data': []}]
+    transport.add(path=TICKER, handler=lambda request: responses.pop(0) if responses else ticker(request))
+    okx_client = make_client()
+
+    async def main():
+        with pytest.raises(APIException):
+            await okx_client.public.ticker(instId='BTC-USDT')
+
+        assert (await okx_client.public.ticker(instId='BTC-USDT')).instId == 'BTC-USDT'
+
+    run(okx_client=okx_client, main=main())
+    assert len(requested(transport=transport, path=TICKER)) == 2
+
+
+def test_connector_is_shared_and_rebuilt_when_closed(public_api, make_client, run):
+    okx_client = make_client()
+    other_client = make_client()
+
+    async def main():
+        await okx_client.public.ticker(instId='BTC-USDT', cache_ttl=0)
+        await other_client.public.ticker(instId='BTC-USDT', cache_ttl=0)
+        connector = okx_client.public.connector
+        assert other_client.public.connector is connector
+
+        await connector.close()
+        await okx_client.public.ticker(instId='BTC-USDT', cache_ttl=0)
+        assert okx_client.public.connector is not connector
+        assert not okx_client.public.connector.closed
+
+    run(okx_client=okx_client, main=main())
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from py_okx_async.OKXClientPool import OKXClientPool
+from py_okx_async.ShardedRunner import TokenBuckets, SharedRateLimiter, ShardedRunner
+from py_okx_async.Transport import MockTransport
+from py_okx_async.models import OKXCredentials, RateLimit, Priorities
+
+BALANCES = '/api/v5/asset/balances'
+LIMITS = {BALANCES: RateLimit(requests=4, period=1)}
+
+
+def credentials(**api_keys) -> dict:
+    return {
+        name: OKXCredentials(api_key=api_key, secret_key='secret', passphrase='passphrase')
+        for name, api_key in api_keys.items()
+    }
+
+
+async def usdt_balance(name, okx_client):
+    if name == 'broken':
+        raise ValueError('no balance')
+
+    return (await okx_client.asset.balances()).get('USDT').availBal
+
+
+@pytest.fixture
+def pool():
+    transport = MockTransport()
+    transport.add(path=BALANCES, handler={'code': '0', 'msg': '', 'data': [
+        {'ccy': 'USDT', 'bal': '10', 'availBal': '10', 'frozenBal': '0'}
+    ]})
+    return OKXClientPool(
+        credentials=credentials(a1='key1', a2='key1', a3='key1', b1='key2', c1='key3', broken='key4'),
+        transport=transport, rate_limits=LIMITS
+    )
+
+
+def test_shards_keep_accounts_of_api_key_together(pool):
+    runner = ShardedRunner(pool=pool, processes=2)
+    shards = runner.shards(names=pool.names)
+    assert sorted(map(sorted, shards)) == [['a1', 'a2', 'a3'], ['b1', 'broken', 'c1']]
+    assert ShardedRunner(pool=pool, processes=8).shards(names=['a1', 'b1']) == [['a1'], ['b1']]
+
+
+def test_token_buckets_are_shared_by_namespaces():
+    token_buckets = TokenBuckets()
+    assert [token_buckets.take(namespace='key1', endpoint=BALANCES, requests=2, period=1) for _ in range(2)] == [0, 0]
+    assert token_buckets.take(namespace='key1', endpoint=BALANCES, requests=2, period=1) > 0
+    assert token_buckets.take(namespace='key2', endpoint=BALANCES, requests=2, period=1) == 0
+
+
+def test_shared_rate_limiters_take_the_same_tokens():
+    token_buckets = TokenBuckets()
+    first, second = (
+        SharedRateLimiter(token_buckets=token_buckets, namespace='key1', limits=LIMITS, bulk_share=0.5)
+        for _ in range(2)
+    )
+
+    async def main():
+        assert [await first.async_take(endpoint=BALANCES) for _ in range(2)] == [0, 0]
+        assert [await second.async_take(endpoint=BALANCES) for _ in range(2)] == [0, 0]
+        assert await first.async_take(endpoint=BALANCES) > 0
+
+    asyncio.run(main())
+
+
+def test_shared_try_acquire_respects_critical_and_bulk():
+    rate_limiter = SharedRateLimiter(token_buckets=TokenBuckets(), namespace='key1', limits=LIMITS, bulk_share=0.5)
+    rate_limiter.critical_waiting[BALANCES] = 1
+    assert not rate_limiter.try_acquire(endpoint=BALANCES)
+    assert rate_limiter.try_acquire(endpoint=BALANCES, priority=Priorities.Critical)
+
+    rate_limiter.critical_waiting[BALANCES] = 0
+    assert [rate_limiter.try_acquire(endpoint=BALANCES, priority=Priorities.Bulk) for _ in range(3)] == [
+        True, True, False
+    ]
+    assert rate_limiter.try_acquire(endpoint=BALANCES)
+    assert not rate_limiter.try_acquire(endpoint=BALANCES)
+
+
+def test_pool_map_creates_each_client_once(pool):
+    async def main():
+        return [result async for result in pool.map(func=usdt_balance, concurrency=4)]
+
+    results = asyncio.run(main())
+    assert {result.account: result.result for result in results if not result.error} == {
+        'a1': 10.0, 'a2': 10.0, 'a3': 10.0, 'b1': 10.0, 'c1': 10.0
+    }
+    assert [result.error for result in results if result.error] == ['ValueError: no balance']
+    assert set(pool.clients) == set(pool.names)
+    assert len({id(pool.clients[name].rate_limiter) for name in pool.names}) == 4
+
+
+def test_runner_streams_results_of_all_shards(pool):
+    async def main():
+        return [result async for result in ShardedRunner(pool=pool, processes=2).run(func=usdt_balance)]
+
+    results = asyncio.run(main())
+    assert sorted(result.account for result in results) == sorted(pool.names)
+    assert {result.account for result in results if result.error} == {'broken'}
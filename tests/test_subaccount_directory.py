@@ -0,0 +1,115 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from py_okx_async.models import RateLimit
+from py_okx_async.subaccount.SubaccountDirectory import SubaccountDirectory
+from py_okx_async.subaccount.models import SubaccountTypes
+
+SUBACCOUNT_LIST = '/api/v5/users/subaccount/list'
+START = 1_700_000_000_000
+
+
+def subaccount(i: int, ts: int, enable: bool = True, type: str = '1') -> dict:
+    return {'subAcct': f'sub{i}', 'enable': enable, 'type': type, 'label': '', 'ts': str(ts)}
+
+
+@pytest.fixture
+def ledger(transport, history):
+    # Two sub-accounts are created in each millisecond and every tenth one is frozen.
+    records = [
+        subaccount(i=i, ts=START + i // 2, enable=i % 10 != 0, type='2' if i % 3 == 0 else '1') for i in range(150)
+    ]
+    transport.add(path=SUBACCOUNT_LIST, handler=history(records=records))
+    return records
+
+
+@pytest.fixture
+def okx_client(make_client):
+    okx_client = make_client(rate_limits={SUBACCOUNT_LIST: RateLimit(requests=1000, period=1)})
+    okx_client.subaccount.directory = SubaccountDirectory(subaccount=okx_client.subaccount)
+    return okx_client
+
+
+@pytest.fixture
+def directory(okx_client):
+    return okx_client.subaccount.directory
+
+
+def query(transport) -> list:
+    return [parse_qs(urlsplit(request.url).query) for request in transport.requests]
+
+
+def test_first_lookup_loads_all_subaccounts(ledger, okx_client, directory, transport, run):
+    async def main():
+        assert (await directory.get(name='sub42')).subAcct == 'sub42'
+        assert len(await directory.list()) == 150
+        assert set(await directory.list(enable=False)) == {f'sub{i}' for i in range(0, 150, 10)}
+        assert len(await directory.list(enable=True)) == 135
+        managed = await directory.list(type=SubaccountTypes.ManagedTrading)
+        assert set(managed) == {f'sub{i}' for i in range(0, 150, 3)}
+        assert set(await directory.list(enable=False, type=SubaccountTypes.ManagedTrading)) == {
+            f'sub{i}' for i in range(0, 150, 30)
+        }
+
+    run(okx_client=okx_client, main=main())
+    assert directory.newest == START + 74
+    # The second page starts from the boundary millisecond of the first one.
+    assert len(transport.requests) == 2
+
+
+def test_stale_cache_requests_only_new_subaccounts(ledger, okx_client, directory, transport, run):
+    async def main():
+        await directory.list()
+        ledger.append(subaccount(i=150, ts=START + 74))
+        ledger.append(subaccount(i=151, ts=START + 80))
+        transport.requests.clear()
+        directory.refreshed_at -= directory.ttl + 1
+        # Cached sub-accounts are returned while the refresh runs in the background.
+        assert 'sub151' not in await directory.list()
+        await directory.refresh_task
+        assert {'sub150', 'sub151'} <= set(await directory.list())
+
+    run(okx_client=okx_client, main=main())
+    assert [request['before'] for request in query(transport=transport)] == [[str(START + 73)]]
+    assert directory.newest == START + 80
+
+
+def test_statuses_are_revalidated_with_frozen_subaccounts(ledger, okx_client, directory, transport, run):
+    async def main():
+        await directory.list()
+        ledger[10]['enable'] = True
+        ledger[11]['enable'] = False
+        transport.requests.clear()
+        directory.validated_at -= directory.validation_interval + 1
+        await directory.refresh()
+        assert 'sub10' not in directory.frozen
+        assert 'sub11' in directory.frozen
+        assert (await directory.get(name='sub10')).enable
+
+    run(okx_client=okx_client, main=main())
+    assert [request.get('enable') for request in query(transport=transport)] == [None, ['false']]
+
+
+def test_unknown_name_waits_for_refresh(ledger, okx_client, directory, transport, run):
+    async def main():
+        await directory.list()
+        ledger.append(subaccount(i=150, ts=START + 100))
+        assert await directory.get(name='sub150') is None
+        directory.refreshed_at -= directory.miss_interval + 1
+        assert (await directory.get(name='sub150')).subAcct == 'sub150'
+        assert await directory.get(name='unknown') is None
+
+    run(okx_client=okx_client, main=main())
+    assert len(transport.requests) == 3
+
+
+def test_client_fan_outs_use_directory(ledger, okx_client, transport, run):
+    async def main():
+        names = await okx_client.subaccount_names()
+        assert await okx_client.subaccount_names() == names
+        return names
+
+    names = run(okx_client=okx_client, main=main())
+    assert set(names) == {f'sub{i}' for i in range(150)}
+    assert len(transport.requests) == 2
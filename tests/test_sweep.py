@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+import pytest
+
+from py_okx_async.Deadline import Deadline
+from py_okx_async.Transport import TransportResponse
+from py_okx_async.exceptions import DeadlineExceeded
+from py_okx_async.models import Methods, SweepTransfer, SweepStatuses
+
+TRANSFER = '/api/v5/asset/transfer'
+TRANSFER_STATE = '/api/v5/asset/transfer-state'
+
+
+def transfer_data(request, transId: str = '1', state: str = 'success'):
+    return {
+        'transId': transId, 'clientId': 'sweep1', 'ccy': 'USDT', 'amt': '10', 'type': '2', 'from': '6', 'to': '6',
+        'subAcct': 'sub1', 'state': state
+    }
+
+
+def lose_first_response(transport):
+    def handler(request):
+        if len([request for request in transport.requests if request.method == Methods.POST]) == 1:
+            raise ConnectionError('the response was lost')
+
+        return {'code': '0', 'msg': '', 'data': [transfer_data(request=request, transId='2')]}
+
+    return handler
+
+
+def sweep_transfer(okx_client) -> SweepTransfer:
+    transfer = SweepTransfer(subAcct='sub1', token_symbol='USDT', amount='10', clientId='sweep1')
+
+    async def main():
+        try:
+            return await okx_client.sweep_transfer(transfer=transfer)
+
+        finally:
+            await okx_client.asset.connector.close()
+
+    return asyncio.run(main())
+
+
+def test_retry_finds_transfer_whose_response_was_lost(transport, make_client, fast_sleep):
+    transport.add(path=TRANSFER, handler=lose_first_response(transport=transport), method=Methods.POST)
+    transport.add(path=TRANSFER_STATE, handler=lambda request: {
+        'code': '0', 'msg': '', 'data': [transfer_data(request=request)]
+    })
+    transfer = sweep_transfer(okx_client=make_client())
+    assert [request.method for request in transport.requests] == [Methods.POST, Methods.GET]
+    assert 'clientId=sweep1' in transport.requests[1].url
+    assert transfer.status == SweepStatuses.Success
+    assert transfer.transId == 1
+    assert transfer.attempts == 1
+
+
+def test_retry_resends_transfer_that_is_not_found(transport, make_client, fast_sleep):
+    transport.add(path=TRANSFER, handler=lose_first_response(transport=transport), method=Methods.POST)
+    transport.add(path=TRANSFER_STATE, handler={'code': '0', 'msg': '', 'data': []})
+    transfer = sweep_transfer(okx_client=make_client())
+    assert [request.method for request in transport.requests] == [Methods.POST, Methods.GET, Methods.POST]
+    assert {json.loads(request.body)['clientId'] for request in transport.requests[::2]} == {'sweep1'}
+    assert transfer.status == SweepStatuses.Success
+    assert transfer.transId == 2
+    assert transfer.attempts == 2
+
+
+def test_rejected_transfer_is_not_retried(transport, make_client, fast_sleep):
+    transport.add(
+        path=TRANSFER, handler={'code': '58350', 'msg': 'Insufficient balance', 'data': []}, method=Methods.POST
+    )
+    transfer = sweep_transfer(okx_client=make_client())
+    assert len(transport.requests) == 1
+    assert transfer.status == SweepStatuses.Failed
+
+
+def test_failed_lookup_leaves_transfer_unknown(transport, make_client, fast_sleep):
+    transport.add(path=TRANSFER, handler=lose_first_response(transport=transport), method=Methods.POST)
+    transport.add(path=TRANSFER_STATE, handler=lambda request: TransportResponse(status_code=502, content=b''))
+    transfer = sweep_transfer(okx_client=make_client())
+    assert [request.method for request in transport.requests if request.method == Methods.POST] == [Methods.POST]
+    assert transfer.status == SweepStatuses.Unknown
+    assert transfer.attempts == 1
+    assert transfer.error
+
+
+def test_found_transfer_state_is_mapped(transport, make_client, fast_sleep):
+    transport.add(path=TRANSFER, handler=lose_first_response(transport=transport), method=Methods.POST)
+    transport.add(path=TRANSFER_STATE, handler=lambda request: {
+        'code': '0', 'msg': '', 'data': [transfer_data(request=request, state='pending')]
+    })
+    transfer = sweep_transfer(okx_client=make_client())
+    assert transfer.status == SweepStatuses.Pending
+
+
+def test_exceeded_deadline_is_not_retried(transport, make_client, run):
+    transport.add(path=TRANSFER, handler=lose_first_response(transport=transport), method=Methods.POST)
+    transport.latency = 0.05
+    okx_client = make_client()
+    transfer = SweepTransfer(subAcct='sub1', token_symbol='USDT', amount='10', clientId='sweep1')
+
+    async def main():
+        with Deadline(timeout=0.01):
+            await okx_client.sweep_transfer(transfer=transfer)
+
+    with pytest.raises(DeadlineExceeded):
+        run(okx_client=okx_client, main=main())
+
+    assert len(transport.requests) == 1
@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientTimeout, web
+
+from py_okx_async.Transport import Transport, AiohttpTransport, MockTransport
+from py_okx_async.exceptions import APIException
+from py_okx_async.models import Methods, Timeouts, TransportRequest, TransportResponse
+from py_okx_async.utils import async_request, async_get, async_post
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    requests = []
+
+    async def send(self, request):
+        requests.append(request)
+        return TransportResponse(status_code=200, content=b'{"code": "0", "msg": "", "data": []}')
+
+    monkeypatch.setattr(AiohttpTransport, 'send', send)
+    return requests
+
+
+def test_transport_without_send_cannot_be_created():
+    class Incomplete(Transport):
+        async def close(self) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Transport()
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    assert not MockTransport().network
+
+
+def test_request_arguments_are_prepared(sent):
+    async def main():
+        await async_get(url='https://host/path?a=1', params={'b': 2}, headers={'X': 'y'})
+        await async_post(url='https://host/path', json={'c': 3})
+        await async_post(url='https://host/path', data='raw')
+
+    asyncio.run(main())
+    assert [(request.method, request.url, request.body) for request in sent] == [
+        (Methods.GET, 'https://host/path?a=1&b=2', None), (Methods.POST, 'https://host/path', b'{"c": 3}'),
+        (Methods.POST, 'https://host/path', b'raw')
+    ]
+    assert sent[0].headers == {'X': 'y'}
+    assert sent[1].headers == {'Content-Type': 'application/json'}
+
+
+@pytest.mark.parametrize('timeout, timeouts', [
+    (None, None),
+    (5, Timeouts(total=5, connect=5, read=5)),
+    (Timeouts(total=3, connect=1, read=2), Timeouts(total=3, connect=1, read=2)),
+    (ClientTimeout(total=4, sock_connect=1, sock_read=2), Timeouts(total=4, connect=1, read=2)),
+])
+def test_timeout_is_mapped_to_timeouts(sent, timeout, timeouts):
+    asyncio.run(async_get(url='https://host/path', timeout=timeout))
+    assert sent[0].timeouts == timeouts
+
+
+def test_unsupported_arguments_are_rejected(sent):
+    with pytest.raises(TypeError, match='allow_redirects, ssl'):
+        asyncio.run(async_request(method=Methods.GET, url='https://host/path', ssl=False, allow_redirects=False))
+
+    assert sent == []
+
+
+def test_aiohttp_transport_applies_timeouts():
+    async def handler(request):
+        if request.path == '/slow':
+            await asyncio.sleep(1)
+
+        return web.json_response({'code': '1', 'msg': 'error', 'data': []}, status=400)
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/{path}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, host='127.0.0.1', port=0)
+        await site.start()
+        url = f'http://127.0.0.1:{runner.addresses[0][1]}'
+        try:
+            with pytest.raises(APIException) as error:
+                await async_get(url=f'{url}/fast', timeout=5)
+
+            assert error.value.status_code == 400
+            with pytest.raises(asyncio.TimeoutError):
+                await async_get(url=f'{url}/slow', timeout=0.1)
+
+            response = await AiohttpTransport().send(request=TransportRequest(
+                method=Methods.GET, url=f'{url}/fast', headers={}, timeouts=Timeouts(total=5, connect=1, read=1)
+            ))
+            assert (response.status_code, json.loads(response.content)['code']) == (400, '1')
+
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
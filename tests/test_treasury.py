@@ -0,0 +1,58 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+BALANCES = '/api/v5/asset/balances'
+SUBACCOUNT_BALANCES = '/api/v5/asset/subaccount/balances'
+SUBACCOUNT_LIST = '/api/v5/users/subaccount/list'
+TICKERS = '/api/v5/market/tickers'
+WALLETS = {None: {'USDT': '100', 'BTC': '1'}, 'sub1': {'BTC': '0.5', 'XYZ': '10'}, 'sub2': {'ETH': '2'}}
+
+
+def wallet(request) -> dict:
+    account = parse_qs(urlsplit(request.url).query).get('subAcct', [None])[0]
+    return {'code': '0', 'msg': '', 'data': [
+        {'ccy': token_symbol, 'bal': bal, 'availBal': bal, 'frozenBal': '0'}
+        for token_symbol, bal in WALLETS[account].items()
+    ]}
+
+
+@pytest.fixture
+def treasury(transport):
+    transport.add(path=BALANCES, handler=wallet)
+    transport.add(path=SUBACCOUNT_BALANCES, handler=wallet)
+    transport.add(path=SUBACCOUNT_LIST, handler={'code': '0', 'msg': '', 'data': [
+        {'subAcct': 'sub1', 'enable': True, 'type': '1', 'ts': '1700000000001'},
+        {'subAcct': 'sub2', 'enable': True, 'type': '1', 'ts': '1700000000000'},
+    ]})
+    transport.add(path=TICKERS, handler={'code': '0', 'msg': '', 'data': [
+        {'instType': 'SPOT', 'instId': 'BTC-USDT', 'last': '30000'},
+        {'instType': 'SPOT', 'instId': 'ETH-USDT', 'last': '2000'},
+        {'instType': 'SPOT', 'instId': 'BTC-USDC', 'last': '1'},
+        {'instType': 'SPOT', 'instId': 'ABC-USDT', 'last': ''},
+    ]})
+    transport.latency = 0.01
+    return transport
+
+
+def test_treasury_snapshot_values_all_accounts(treasury, make_client, run):
+    okx_client = make_client()
+    snapshot = run(okx_client=okx_client, main=okx_client.treasury_snapshot())
+    assert snapshot.prices == {'USDT': 1.0, 'BTC': 30000.0, 'ETH': 2000.0}
+    assert list(snapshot.accounts) == [None, 'sub1', 'sub2']
+    assert snapshot.tokens == {'USDT': 100.0, 'BTC': 1.5, 'XYZ': 10.0, 'ETH': 2.0}
+    assert snapshot.tokens_usd == {'USDT': 100.0, 'BTC': 45000.0, 'XYZ': None, 'ETH': 4000.0}
+    assert snapshot.accounts_usd == {None: 30100.0, 'sub1': 15000.0, 'sub2': 4000.0}
+    assert snapshot.total_usd == 49100.0
+    assert set(snapshot.timings) == {'balances', 'subaccounts', 'subaccount_balances', 'prices', 'total'}
+    # Master balances, the list of sub-accounts and prices are requested at the same time.
+    assert {urlsplit(request.url).path for request in treasury.requests[:3]} == {BALANCES, SUBACCOUNT_LIST, TICKERS}
+
+
+def test_treasury_snapshot_of_given_subaccounts(treasury, make_client, run):
+    okx_client = make_client()
+    snapshot = run(okx_client=okx_client, main=okx_client.treasury_snapshot(subaccounts=['sub2']))
+    assert list(snapshot.accounts) == [None, 'sub2']
+    assert snapshot.total_usd == 34100.0
+    assert SUBACCOUNT_LIST not in {urlsplit(request.url).path for request in treasury.requests}
+    assert 'subaccounts' not in snapshot.timings
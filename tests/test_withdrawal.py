@@ -0,0 +1,107 @@
+import json
+from decimal import Decimal
+from urllib.parse import urlsplit
+
+import pytest
+
+from py_okx_async.asset.Asset import Asset
+from py_okx_async.asset.models import Currency, WithdrawalErrors
+from py_okx_async.exceptions import InvalidWithdrawal
+from py_okx_async.models import Methods
+
+
+def currencies(**kwargs):
+    data = {
+        'canDep': True, 'canInternal': True, 'canWd': True, 'ccy': 'USDT', 'chain': 'USDT-TRC20', 'logoLink': '',
+        'mainNet': False, 'fee': '1', 'maxWd': '1000', 'minDep': '1', 'minDepArrivalConfirm': '1', 'minWd': '2',
+        'minWdUnlockConfirm': '1', 'name': 'Tether', 'needTag': False, 'usedWdQuota': '0', 'wdQuota': '10000000',
+        'wdTickSz': '2'
+    }
+    data.update(kwargs)
+    return {'USDT': {'TRC20': Currency(data=data)}}
+
+
+def check(amount, fee=None, chain='TRC20', token_symbol='USDT', **kwargs):
+    return Asset.check_withdrawal(
+        currencies=currencies(**kwargs), token_symbol=token_symbol, amount=amount, chain=chain, fee=fee
+    )
+
+
+def test_valid_withdrawal_uses_chain_fee():
+    result = check(amount='10.5', chain='USDT-TRC20')
+    assert result.valid
+    assert result.chain == 'TRC20'
+    assert result.amount == Decimal('10.5')
+    assert result.fee == Decimal('1')
+
+
+def test_extra_decimals_are_rejected_with_rounded_values():
+    result = check(amount='10.129', fee='1.001')
+    assert result.error == WithdrawalErrors.Precision
+    assert result.amount == Decimal('10.12')
+    assert result.fee == Decimal('1.01')
+
+    assert check(amount=10.12, fee='1.001').error == WithdrawalErrors.Precision
+
+
+@pytest.mark.parametrize('amount, fee, kwargs, error', [
+    ('1.99', None, {}, WithdrawalErrors.BelowMinimum),
+    ('0', None, {'minWd': '0'}, WithdrawalErrors.BelowMinimum),
+    ('1000.01', None, {}, WithdrawalErrors.AboveMaximum),
+    ('1000000', None, {'maxWd': '0'}, None),
+    ('10', '0.99', {}, WithdrawalErrors.LowFee),
+    ('10', None, {'canWd': False}, WithdrawalErrors.Disabled),
+])
+def test_limits(amount, fee, kwargs, error):
+    assert check(amount=amount, fee=fee, **kwargs).error == error
+
+
+def test_unknown_token_and_chain():
+    assert check(amount='10', token_symbol='BTC').error == WithdrawalErrors.UnknownToken
+    assert check(amount='10', chain='ERC20').error == WithdrawalErrors.UnknownChain
+
+
+CURRENCIES = '/api/v5/asset/currencies'
+WITHDRAWAL = '/api/v5/asset/withdrawal'
+
+
+@pytest.fixture
+def okx_client(make_client, transport):
+    transport.add(path=CURRENCIES, handler=lambda request: {
+        'code': '0', 'msg': '', 'data': [currencies()['USDT']['TRC20'].data]
+    })
+    transport.add(path=WITHDRAWAL, handler=lambda request: {'code': '0', 'msg': '', 'data': [{
+        'amt': json.loads(request.body)['amt'], 'wdId': '1', 'ccy': 'USDT', 'clientId': '', 'chain': 'USDT-TRC20'
+    }]}, method=Methods.POST)
+    return make_client()
+
+
+def test_invalid_withdrawal_is_not_sent(okx_client, transport, run):
+    async def main():
+        with pytest.raises(InvalidWithdrawal) as error:
+            await okx_client.asset.withdrawal(
+                token_symbol='USDT', amount='10.129', toAddr='address', chain='TRC20', validate=True
+            )
+
+        assert error.value.reason == WithdrawalErrors.Precision
+        return await okx_client.asset.withdrawal(
+            token_symbol='USDT', amount='10.12', toAddr='address', chain='TRC20', validate=True
+        )
+
+    token = run(okx_client=okx_client, main=main())
+    assert (token.wdId, token.amt, token.chain) == (1, 10.12, 'TRC20')
+    assert [urlsplit(request.url).path for request in transport.requests] == [CURRENCIES, CURRENCIES, WITHDRAWAL]
+    body = json.loads(transport.requests[-1].body)
+    assert (body['amt'], body['fee'], body['chain']) == ('10.12', '1.00', 'USDT-TRC20')
+
+
+def test_batch_is_validated_with_single_request(okx_client, transport, run):
+    checks = run(okx_client=okx_client, main=okx_client.asset.validate_withdrawals(withdrawals=[
+        {'token_symbol': 'USDT', 'amount': '10', 'chain': 'TRC20'},
+        {'token_symbol': 'USDT', 'amount': '1', 'chain': 'TRC20', 'fee': '1'},
+        {'token_symbol': 'BTC', 'amount': '1', 'chain': 'Bitcoin'},
+    ]))
+    assert [check.error for check in checks] == [
+        None, WithdrawalErrors.BelowMinimum, WithdrawalErrors.UnknownToken
+    ]
+    assert len(transport.requests) == 1